@@ -130,10 +130,13 @@ _MODIFYING_HANDLERS = {
         song, p.get("track_index", 0), p.get("key", ""), p.get("value", ""), ctrl),
     "set_implicit_arm": lambda song, p, ctrl: handlers.tracks.set_implicit_arm(
         song, p.get("track_index", 0), p.get("enabled", True), ctrl),
+    "apply_track_ops": lambda song, p, ctrl: handlers.tracks.apply_track_ops(
+        song, p.get("ops", []), ctrl),
 
     # --- Clips ---
     "create_clip": lambda song, p, ctrl: handlers.clips.create_clip(song, p.get("track_index", 0), p.get("clip_index", 0), p.get("length", 4.0), ctrl),
     "add_notes_to_clip": lambda song, p, ctrl: handlers.clips.add_notes_to_clip(song, p.get("track_index", 0), p.get("clip_index", 0), p.get("notes", []), ctrl),
+    "add_notes_to_clip_soa": lambda song, p, ctrl: handlers.clips.add_notes_to_clip_soa(song, p.get("track_index", 0), p.get("clip_index", 0), p.get("notes", {}), ctrl),
     "set_clip_name": lambda song, p, ctrl: handlers.clips.set_clip_name(song, p.get("track_index", 0), p.get("clip_index", 0), p.get("name", ""), ctrl),
     "fire_clip": lambda song, p, ctrl: handlers.clips.fire_clip(song, p.get("track_index", 0), p.get("clip_index", 0), ctrl),
     "stop_clip": lambda song, p, ctrl: handlers.clips.stop_clip(song, p.get("track_index", 0), p.get("clip_index", 0), ctrl),
@@ -208,6 +211,7 @@ _MODIFYING_HANDLERS = {
     "set_return_track_mute": lambda song, p, ctrl: handlers.mixer.set_return_track_mute(song, p.get("return_track_index", 0), p.get("mute", False), ctrl),
     "set_return_track_solo": lambda song, p, ctrl: handlers.mixer.set_return_track_solo(song, p.get("return_track_index", 0), p.get("solo", False), ctrl),
     "set_master_volume": lambda song, p, ctrl: handlers.mixer.set_master_volume(song, p.get("volume", 0.85), ctrl),
+    "set_mixer_batch": lambda song, p, ctrl: handlers.mixer.set_mixer_batch(song, p.get("settings", []), ctrl),
     "set_crossfade_assign": lambda song, p, ctrl: handlers.mixer.set_crossfade_assign(song, p.get("track_index", 0), p.get("assign", 0), ctrl),
     "set_crossfader": lambda song, p, ctrl: handlers.mixer.set_crossfader(song, p.get("value", 0.5), ctrl),
     "set_cue_volume": lambda song, p, ctrl: handlers.mixer.set_cue_volume(song, p.get("value", 0.85), ctrl),
@@ -467,6 +471,9 @@ _READONLY_HANDLERS = {
     "get_device_parameters": lambda song, p, ctrl: handlers.devices.get_device_parameters(
         song, p.get("track_index", 0), p.get("device_index", 0),
         p.get("track_type", "track"), ctrl),
+    "get_device_parameters_batch": lambda song, p, ctrl: handlers.devices.get_device_parameters_batch(
+        song, p.get("track_index", 0), p.get("device_indices"),
+        p.get("track_type", "track"), ctrl),
     "get_macro_values": lambda song, p, ctrl: handlers.devices.get_macro_values(
         song, p.get("track_index", 0), p.get("device_index", 0),
         track_type=p.get("track_type", "track"), ctrl=ctrl),
@@ -789,6 +796,12 @@ class AbletonBridge(ControlSurface):
                 try:
                     client, address = self.server.accept()
                     self.log_message("Connection accepted from " + str(address))
+                    try:
+                        # Pipelined commands get back-to-back small responses;
+                        # without this Nagle holds each one until an ACK
+                        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    except (OSError, socket.error):
+                        pass
                     self.show_message("AbletonBridge: Client connected")
 
                     client_thread = threading.Thread(
@@ -819,7 +832,9 @@ class AbletonBridge(ControlSurface):
         """Handle communication with a connected client"""
         self.log_message("Client handler started")
         client.settimeout(5.0)
-        buffer = ''
+        # Raw bytes; only complete lines are decoded, so a multi-byte
+        # character split across two recv() calls survives intact
+        buffer = bytearray()
 
         try:
             while self.running:
@@ -833,13 +848,16 @@ class AbletonBridge(ControlSurface):
                         self.log_message("Client disconnected")
                         break
 
-                    # Accumulate data (replace invalid UTF-8 instead of crashing)
-                    buffer += data.decode('utf-8', errors='replace')
+                    buffer.extend(data)
 
                     # Process all complete newline-delimited messages
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
-                        line = line.strip()
+                    while True:
+                        nl = buffer.find(b'\n')
+                        if nl == -1:
+                            break
+                        # Replace invalid UTF-8 instead of crashing
+                        line = bytes(buffer[:nl]).decode('utf-8', 'replace').strip()
+                        del buffer[:nl + 1]
                         if not line:
                             continue
 
@@ -29,18 +29,42 @@ def create_clip(song, track_index, clip_index, length, ctrl=None):
 
 def add_notes_to_clip(song, track_index, clip_index, notes, ctrl=None):
     """Add MIDI notes to a clip."""
+    rows = (
+        (note.get("pitch", 60), note.get("start_time", 0.0), note.get("duration", 0.25),
+         note.get("velocity", 100), note.get("mute", False))
+        for note in notes
+    )
+    return _add_note_rows(song, track_index, clip_index, rows, ctrl)
+
+
+def add_notes_to_clip_soa(song, track_index, clip_index, notes, ctrl=None):
+    """Add MIDI notes sent as parallel columns.
+
+    notes is {"pitch": [...], "start_time": [...], "duration": [...],
+    "velocity": [...]} with an optional "mute" column, which avoids
+    repeating every key name once per note on the wire.
+    """
+    pitches = notes.get("pitch", [])
+    mutes = notes.get("mute") or [False] * len(pitches)
+    rows = zip(pitches, notes.get("start_time", []), notes.get("duration", []),
+               notes.get("velocity", []), mutes)
+    return _add_note_rows(song, track_index, clip_index, rows, ctrl)
+
+
+def _add_note_rows(song, track_index, clip_index, rows, ctrl=None):
+    """Add (pitch, start_time, duration, velocity, mute) rows to a clip."""
     try:
         _, clip = get_clip(song, track_index, clip_index)
 
         # Validate and normalize note data
         note_specs = []
-        for note in notes:
+        for pitch, start_time, duration, velocity, mute in rows:
             note_specs.append({
-                "pitch": max(0, min(127, int(note.get("pitch", 60)))),
-                "start_time": max(0.0, float(note.get("start_time", 0.0))),
-                "duration": max(0.01, float(note.get("duration", 0.25))),
-                "velocity": max(1, min(127, int(note.get("velocity", 100)))),
-                "mute": bool(note.get("mute", False)),
+                "pitch": max(0, min(127, int(pitch))),
+                "start_time": max(0.0, float(start_time)),
+                "duration": max(0.01, float(duration)),
+                "velocity": max(1, min(127, int(velocity))),
+                "mute": bool(mute),
             })
 
         # Strategy 1: Live 12+ MidiNoteSpecification API
@@ -54,7 +78,7 @@ def add_notes_to_clip(song, track_index, clip_index, notes, ctrl=None):
                         duration=s["duration"], velocity=s["velocity"],
                         mute=s["mute"]))
                 clip.add_new_notes(tuple(specs))
-                return {"note_count": len(notes)}
+                return {"note_count": len(note_specs)}
         except Exception as exc:
             if ctrl:
                 ctrl.log_message("Strategy 1 (MidiNoteSpecification) failed: " + str(exc))
@@ -67,7 +91,7 @@ def add_notes_to_clip(song, track_index, clip_index, notes, ctrl=None):
                     for s in note_specs
                 )
                 clip.add_new_notes(legacy_tuples)
-                return {"note_count": len(notes)}
+                return {"note_count": len(note_specs)}
             except Exception as exc:
                 if ctrl:
                     ctrl.log_message("Strategy 2 (add_new_notes tuples) failed: " + str(exc))
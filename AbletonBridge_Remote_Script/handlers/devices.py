@@ -175,27 +175,10 @@ def get_device_parameters(song, track_index, device_index, track_type="track", c
             )
         device = device_list[device_index]
 
-        parameters = []
-        for i, param in enumerate(device.parameters):
-            param_info = {
-                "index": i,
-                "name": param.name,
-                "value": param.value,
-                "min": param.min,
-                "max": param.max,
-                "is_quantized": param.is_quantized,
-                "value_items": list(param.value_items) if param.is_quantized else [],
-            }
-            try:
-                param_info["display_value"] = param.str_for_value(param.value)
-            except Exception:
-                pass
-            parameters.append(param_info)
-
         return {
             "device_name": device.name,
             "device_type": device.class_name,
-            "parameters": parameters,
+            "parameters": _describe_parameters(device),
         }
     except Exception as e:
         if ctrl:
@@ -203,6 +186,60 @@ def get_device_parameters(song, track_index, device_index, track_type="track", c
         raise
 
 
+def _describe_parameters(device):
+    """Return the parameter dicts reported by get_device_parameters."""
+    parameters = []
+    for i, param in enumerate(device.parameters):
+        param_info = {
+            "index": i,
+            "name": param.name,
+            "value": param.value,
+            "min": param.min,
+            "max": param.max,
+            "is_quantized": param.is_quantized,
+            "value_items": list(param.value_items) if param.is_quantized else [],
+        }
+        try:
+            param_info["display_value"] = param.str_for_value(param.value)
+        except Exception:
+            pass
+        parameters.append(param_info)
+    return parameters
+
+
+def get_device_parameters_batch(song, track_index, device_indices=None, track_type="track", ctrl=None):
+    """Get parameters for several devices on one track in a single call.
+
+    Returns {"parameters_by_index": {"<device_index>": [...]}, "errors": {...}}
+    keyed by device index as a string. A device that cannot be read is
+    reported under "errors" and does not stop the rest. When device_indices
+    is omitted every device on the track is read.
+    """
+    try:
+        track = resolve_track(song, track_index, track_type)
+        device_list = list(track.devices)
+        if device_indices is None:
+            device_indices = range(len(device_list))
+
+        parameters_by_index = {}
+        errors = {}
+        for device_index in device_indices:
+            key = str(device_index)
+            try:
+                if device_index < 0 or device_index >= len(device_list):
+                    raise IndexError(
+                        "Device index out of range (have " + str(len(device_list)) + " devices)"
+                    )
+                parameters_by_index[key] = _describe_parameters(device_list[device_index])
+            except Exception as e:
+                errors[key] = str(e)
+        return {"parameters_by_index": parameters_by_index, "errors": errors}
+    except Exception as e:
+        if ctrl:
+            ctrl.log_message("Error getting device parameters batch: " + str(e))
+        raise
+
+
 def set_device_parameter(
     song, track_index, device_index, parameter_name, value,
     track_type="track", value_display=None, ctrl=None
@@ -335,6 +335,52 @@ def set_master_volume(song, volume, ctrl=None):
         raise
 
 
+def _set_clamped(param, value):
+    param.value = max(param.min, min(param.max, value))
+
+
+def set_mixer_batch(song, settings, ctrl=None):
+    """Apply volume/pan/mute/solo for many tracks in one main-thread task.
+
+    Each setting is a dict with track_index, optional track_type and any of
+    volume, pan, mute, solo, plus an "index" used to label errors (defaults
+    to its position). A failing parameter is reported and does not stop
+    the rest.
+    """
+    applied = 0
+    errors = []
+    for pos, setting in enumerate(settings):
+        label = setting.get("index", pos)
+        track_type = setting.get("track_type", "track")
+        try:
+            track = get_track(song, setting.get("track_index", 0), track_type)
+        except Exception as e:
+            errors.append({"index": label, "error": str(e)})
+            continue
+        mixer = track.mixer_device
+        for key in ("volume", "pan", "mute", "solo"):
+            if key not in setting:
+                continue
+            try:
+                value = setting[key]
+                if key == "volume":
+                    _set_clamped(mixer.volume, value)
+                elif track_type == "master":
+                    raise ValueError("Master track has no {0} control".format(key))
+                elif key == "pan":
+                    _set_clamped(mixer.panning, value)
+                elif key == "mute":
+                    track.mute = bool(value)
+                else:
+                    track.solo = bool(value)
+                applied += 1
+            except Exception as e:
+                errors.append({"index": label, "param": key, "error": str(e)})
+    if errors and ctrl:
+        ctrl.log_message("set_mixer_batch: {0} errors".format(len(errors)))
+    return {"applied": applied, "errors": errors}
+
+
 # --- Read-only info ---
 
 
@@ -575,6 +575,53 @@ def set_track_routing(song, track_index, input_type=None, input_channel=None,
         raise
 
 
+# --- Batched track operations ---
+
+_TRACK_OPS = {
+    "set_name": lambda song, op, ctrl: set_track_name(
+        song, op.get("track_index", 0), op.get("name", ""), ctrl),
+    "set_color": lambda song, op, ctrl: set_track_color(
+        song, op.get("track_index", 0), op.get("color_index", 0), ctrl),
+    "arm": lambda song, op, ctrl: arm_track(song, op.get("track_index", 0), ctrl),
+    "disarm": lambda song, op, ctrl: disarm_track(song, op.get("track_index", 0), ctrl),
+    "set_monitoring": lambda song, op, ctrl: set_track_monitoring(
+        song, op.get("track_index", 0), op.get("state", 1), ctrl),
+    "set_routing": lambda song, op, ctrl: set_track_routing(
+        song, op.get("track_index", 0),
+        op.get("input_type"), op.get("input_channel"),
+        op.get("output_type"), op.get("output_channel"), ctrl),
+}
+
+
+def apply_track_ops(song, ops, ctrl=None):
+    """Apply several per-track property changes in one main-thread task.
+
+    Each op is a dict with a "kind" (a key of _TRACK_OPS) plus that kind's
+    arguments. Ops run in order; a failing op is reported and does not stop
+    the rest.
+    """
+    results = []
+    applied = 0
+    for i, op in enumerate(ops):
+        kind = op.get("kind")
+        handler = _TRACK_OPS.get(kind)
+        if handler is None:
+            results.append({"index": i, "kind": kind, "status": "error",
+                            "message": "Unknown op kind: {0}".format(kind)})
+            continue
+        try:
+            result = handler(song, op, ctrl)
+            results.append({"index": i, "kind": kind, "status": "success", "result": result})
+            applied += 1
+        except Exception as e:
+            results.append({"index": i, "kind": kind, "status": "error", "message": str(e)})
+    return {
+        "applied": applied,
+        "failed": len(ops) - applied,
+        "results": results,
+    }
+
+
 # --- Take Lanes ---
 
 
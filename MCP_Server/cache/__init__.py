@@ -1,4 +1,4 @@
-"""Browser cache management for AbletonBridge."""
+"""Browser and query-result cache management for AbletonBridge."""
 from .browser import (
     populate_browser_cache,
     load_browser_cache_from_disk,
@@ -8,3 +8,11 @@ from .browser import (
     build_device_uri_map,
     save_browser_cache_to_disk,
 )
+from .queries import (
+    cached_query,
+    cached_query_async,
+    bump_live_state_epoch,
+    record_track_count,
+    adjust_track_count,
+    known_track_count,
+)
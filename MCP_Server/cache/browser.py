@@ -6,14 +6,20 @@ contains the logic that reads / writes that state.
 """
 
 import os
-import json
 import gzip
+import pickle
+import sys
 import time
 import logging
 import threading
 from typing import Dict, Any, List
 from collections import deque
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 import MCP_Server.state as state
 from MCP_Server.constants import (
     CATEGORY_PRIORITY,
@@ -23,12 +29,20 @@ from MCP_Server.constants import (
     BROWSER_CACHE_TTL,
     BROWSER_DISK_CACHE_DIR,
     BROWSER_DISK_CACHE_PATH,
+    BROWSER_DISK_CACHE_PATH_ZSTD,
     BROWSER_DISK_CACHE_PATH_LEGACY,
     BROWSER_DISK_CACHE_MAX_AGE,
 )
+from MCP_Server.serialization import dumpb, loads
 
 logger = logging.getLogger("AbletonBridge")
 
+# Make the known category names the canonical interned strings, so categories
+# interned on load are the very objects CATEGORY_PRIORITY is keyed by
+for _category in CATEGORY_PRIORITY:
+    sys.intern(_category)
+del _category
+
 
 # ---------------------------------------------------------------------------
 # Device URI map builder
@@ -40,26 +54,40 @@ def build_device_uri_map(flat_items: List[Dict[str, Any]]) -> Dict[str, str]:
     Only includes loadable items with a non-empty URI.
     For duplicate names, prefers is_device=True items, then higher-priority
     categories (Instruments > Audio Effects > MIDI Effects > Sounds > Drums).
+    Each name is also reachable with its spaces removed ("drumrack"), unless
+    that form is itself a real name.
     """
-    uri_map: Dict[str, str] = {}
-    quality_map: Dict[str, tuple] = {}
+    # name -> (quality, uri); one dict write per improvement
+    best: Dict[str, tuple] = {}
+    priority = CATEGORY_PRIORITY
 
     for item in flat_items:
-        if not item.get("is_loadable") or not item.get("uri"):
+        uri = item.get("uri")
+        if not uri or not item.get("is_loadable"):
             continue
 
-        name_lower = item.get("search_name", item.get("name", "").lower())
+        # search_name is precomputed at scan time; only lowercase when missing
+        name_lower = item.get("search_name")
+        if name_lower is None:
+            name_lower = item.get("name", "").lower()
         if not name_lower:
             continue
 
-        is_device = item.get("is_device", False)
-        cat_priority = CATEGORY_PRIORITY.get(item.get("category", ""), 99)
-        new_quality = (is_device, -cat_priority)
-
-        if name_lower not in uri_map or new_quality > quality_map[name_lower]:
-            uri_map[name_lower] = item["uri"]
-            quality_map[name_lower] = new_quality
+        quality = (item.get("is_device", False), -priority.get(item.get("category", ""), 99))
+        current = best.get(name_lower)
+        if current is None or quality > current[0]:
+            best[name_lower] = (quality, uri)
 
+    uri_map: Dict[str, str] = {}
+    compact_quality: Dict[str, tuple] = {}
+    for name, (quality, uri) in best.items():
+        compact = name.replace(" ", "")
+        if compact != name and compact not in best:
+            current = compact_quality.get(compact)
+            if current is None or quality > current:
+                compact_quality[compact] = quality
+                uri_map[compact] = uri
+    uri_map.update((name, uri) for name, (_, uri) in best.items())
     return uri_map
 
 
@@ -67,72 +95,174 @@ def build_device_uri_map(flat_items: List[Dict[str, Any]]) -> Dict[str, str]:
 # Disk cache persistence
 # ---------------------------------------------------------------------------
 
+def _snapshot_path(cache_path: str) -> str:
+    """Pickled copy of the parsed cache, kept next to the compressed file."""
+    return cache_path + ".pkl"
+
+
+def _cache_signature(cache_path: str) -> tuple:
+    st = os.stat(cache_path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _write_snapshot(cache_path: str, data: Dict[str, Any]) -> None:
+    """Pickle *data* behind the signature of the file it was saved to."""
+    snapshot = _snapshot_path(cache_path)
+    tmp_path = snapshot + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(_cache_signature(cache_path), f, protocol=5)
+        pickle.dump(data, f, protocol=5)
+    os.replace(tmp_path, snapshot)
+
+
+def _read_snapshot(cache_path: str):
+    """Return the pickled payload if it matches *cache_path* as it is now, else None.
+
+    The signature is read before the payload, so a stale snapshot costs one
+    small unpickle.
+    """
+    snapshot = _snapshot_path(cache_path)
+    if not os.path.exists(snapshot):
+        return None
+    try:
+        with open(snapshot, "rb") as f:
+            if pickle.load(f) != _cache_signature(cache_path):
+                return None
+            return pickle.load(f)
+    except Exception as e:
+        logger.debug("Ignoring unreadable browser cache snapshot: %s", e)
+        return None
+
+
+def _group_by_category(flat: List[Dict[str, Any]], categories: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Rebuild the per-category view from the flat list, sharing its entries.
+
+    Category strings are interned on the way: a decoded cache otherwise holds
+    a separate copy of "Instruments" etc. for every item.
+    """
+    by_cat: Dict[str, List[Dict[str, Any]]] = {sys.intern(name): [] for name in categories}
+    for item in flat:
+        category = item.get("category")
+        if category is not None:
+            category = item["category"] = sys.intern(category)
+            by_cat.setdefault(category, []).append(item)
+    return by_cat
+
+
 def save_browser_cache_to_disk() -> bool:
-    """Persist the in-memory browser cache to a JSON file on disk."""
+    """Persist the in-memory browser cache to a compressed JSON file on disk.
+
+    Uses zstd (level 3) when ``zstandard`` is installed, gzip otherwise;
+    the other formats' files are removed so a stale one is never loaded.
+    Every item already carries its category, so only the category names are
+    written and the per-category lists are rebuilt on load (version 2);
+    writing them out in full stored each item twice.
+    """
     try:
         with state.browser_cache_lock:
             if not state.browser_cache_flat:
                 return False
             data = {
-                "version": 1,
+                "version": 2,
                 "timestamp": state.browser_cache_timestamp,
                 "flat": state.browser_cache_flat,
-                "by_category": state.browser_cache_by_category,
+                "categories": list(state.browser_cache_by_category),
                 "device_uri_map": state.device_uri_map,
             }
 
+        payload = dumpb(data)
+        if zstandard is not None:
+            cache_path, codec = BROWSER_DISK_CACHE_PATH_ZSTD, "zstd"
+            blob = zstandard.ZstdCompressor(level=3, threads=-1).compress(payload)
+        else:
+            cache_path, codec = BROWSER_DISK_CACHE_PATH, "gzip"
+            blob = gzip.compress(payload, compresslevel=6)
+
         os.makedirs(BROWSER_DISK_CACHE_DIR, exist_ok=True)
-        tmp_path = BROWSER_DISK_CACHE_PATH + ".tmp"
-        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
-            json.dump(data, f, separators=(",", ":"))
-        os.replace(tmp_path, BROWSER_DISK_CACHE_PATH)
-        # Remove legacy uncompressed cache if it exists
-        if os.path.exists(BROWSER_DISK_CACHE_PATH_LEGACY):
-            try:
-                os.remove(BROWSER_DISK_CACHE_PATH_LEGACY)
-            except OSError:
-                pass
-        logger.info("Browser cache saved to disk (%d items, gzip)", len(data["flat"]))
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_path, cache_path)
+        try:
+            _write_snapshot(cache_path, data)
+        except Exception as e:
+            logger.debug("Failed to write browser cache snapshot: %s", e)
+        # Remove caches in other formats (including legacy uncompressed)
+        for other in (BROWSER_DISK_CACHE_PATH_ZSTD, BROWSER_DISK_CACHE_PATH, BROWSER_DISK_CACHE_PATH_LEGACY):
+            if other == cache_path:
+                continue
+            for path in (other, _snapshot_path(other)):
+                if os.path.exists(path):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+        logger.info("Browser cache saved to disk (%d items, %s)", len(data["flat"]), codec)
         return True
     except Exception as e:
         logger.warning("Failed to save browser cache to disk: %s", e)
         return False
 
 
+def _install_browser_cache(flat: List[Dict[str, Any]], by_category: Dict[str, List[Dict[str, Any]]],
+                           uri_map: Dict[str, str], timestamp: float) -> None:
+    """Publish a complete browser cache and drop everything derived from the old one.
+
+    All fields change under a single lock acquisition, so a reader holding
+    the lock never sees one generation's items with another's URI map.
+    """
+    with state.browser_cache_lock:
+        state.browser_cache_flat = flat
+        state.browser_cache_by_category = by_category
+        state.device_uri_map = uri_map
+        state.device_uri_scan_memo = {}
+        state.browser_search_columns = {}
+        state.browser_cache_timestamp = timestamp
+    state.browser_cache_ready.set()
+
+
 def load_browser_cache_from_disk() -> bool:
     """Load browser cache from disk into the in-memory globals.
 
     Returns True if a valid, non-stale disk cache was loaded.
     """
     try:
-        # Clean up stale .tmp file from a previous interrupted save
-        tmp_path = BROWSER_DISK_CACHE_PATH + ".tmp"
-        if os.path.exists(tmp_path):
-            try:
-                os.remove(tmp_path)
-                logger.info("Cleaned up stale browser cache .tmp file")
-            except OSError:
-                pass
-
-        cache_path = None
-        if os.path.exists(BROWSER_DISK_CACHE_PATH):
-            cache_path = BROWSER_DISK_CACHE_PATH
-        elif os.path.exists(BROWSER_DISK_CACHE_PATH_LEGACY):
-            cache_path = BROWSER_DISK_CACHE_PATH_LEGACY
+        # Clean up stale .tmp files from a previous interrupted save
+        for tmp_path in (BROWSER_DISK_CACHE_PATH_ZSTD + ".tmp", BROWSER_DISK_CACHE_PATH + ".tmp"):
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                    logger.info("Cleaned up stale browser cache .tmp file")
+                except OSError:
+                    pass
+
+        candidates = [(BROWSER_DISK_CACHE_PATH, gzip.decompress),
+                      (BROWSER_DISK_CACHE_PATH_LEGACY, None)]
+        if zstandard is not None:
+            candidates.insert(0, (BROWSER_DISK_CACHE_PATH_ZSTD, zstandard.ZstdDecompressor().decompress))
+        cache_path, decompress = next(
+            ((path, fn) for path, fn in candidates if os.path.exists(path)), (None, None))
         if cache_path is None:
             logger.info("No disk cache found")
             return False
 
-        opener = gzip.open if cache_path.endswith(".gz") else open
-        with opener(cache_path, "rt", encoding="utf-8") as f:
-            data = json.load(f)
-
-        if not isinstance(data, dict) or data.get("version") != 1:
+        # A pickle written alongside this exact file skips decompress + parse
+        data = _read_snapshot(cache_path)
+        if data is None:
+            with open(cache_path, "rb") as f:
+                payload = f.read()
+            if decompress:
+                payload = decompress(payload)  # the compressed copy is freed here
+            # Drop the JSON text before installing, so only the parsed tree stays resident
+            data = loads(payload)
+            del payload
+
+        version = data.get("version") if isinstance(data, dict) else None
+        if version not in (1, 2):
             logger.warning("Disk cache has unknown format, ignoring")
             return False
 
         flat = data.get("flat", [])
-        by_cat = data.get("by_category", {})
         uri_map = data.get("device_uri_map", {})
         disk_timestamp = data.get("timestamp", 0.0)
 
@@ -146,13 +276,12 @@ def load_browser_cache_from_disk() -> bool:
                         age / 3600, BROWSER_DISK_CACHE_MAX_AGE / 3600)
             return False
 
-        with state.browser_cache_lock:
-            state.browser_cache_flat = flat
-            state.browser_cache_by_category = by_cat
-            state.device_uri_map = uri_map
-            state.browser_cache_timestamp = disk_timestamp
+        if version == 1:
+            by_cat = data.get("by_category", {})
+        else:
+            by_cat = _group_by_category(flat, data.get("categories", []))
 
-        state.browser_cache_ready.set()
+        _install_browser_cache(flat, by_cat, uri_map, disk_timestamp)
         logger.info("Loaded browser cache from disk: %d items, %d categories, %d device URIs (%.1f min old)",
                     len(flat), len(by_cat), len(uri_map), age / 60)
         return True
@@ -200,6 +329,7 @@ def populate_browser_cache(force: bool = False) -> bool:
             return False
 
         logger.info("Browser cache: starting scan...")
+        scan_started = time.monotonic()
         flat_items: List[Dict[str, Any]] = []
         by_display: Dict[str, List[Dict[str, Any]]] = {}
         total = 0
@@ -269,14 +399,9 @@ def populate_browser_cache(force: bool = False) -> bool:
 
         device_map = build_device_uri_map(flat_items)
 
-        with state.browser_cache_lock:
-            state.browser_cache_flat = flat_items
-            state.browser_cache_by_category = by_display
-            state.device_uri_map = device_map
-            state.browser_cache_timestamp = time.time()
-
-        state.browser_cache_ready.set()
-        logger.info("Browser cache: %d items, %d categories, %d device names mapped", total, len(by_display), len(device_map))
+        _install_browser_cache(flat_items, by_display, device_map, time.time())
+        logger.info("Browser cache: %d items, %d categories, %d device names mapped in %.1fs",
+                    total, len(by_display), len(device_map), time.monotonic() - scan_started)
         save_browser_cache_to_disk()
         return True
 
@@ -300,24 +425,31 @@ def resolve_device_uri(uri_or_name: str) -> str:
     If the input already looks like a URI (contains ':' or '#'), return as-is.
     Otherwise, look up the name in the dynamic device URI map built from
     the browser cache.  Waits for the warmup thread if the map is empty.
+    Fallback scan results, misses included, are memoized until the cache
+    is rebuilt, so an unknown name pays for the wait and scan only once.
     """
     if ":" in uri_or_name or "#" in uri_or_name:
         return uri_or_name
 
     name_lower = uri_or_name.strip().lower()
+    name_compact = name_lower.replace(" ", "")
 
-    # Fast O(1) lookup in the dynamic device URI map
+    # Fast O(1) lookup in the dynamic device URI map (or an earlier scan hit)
     with state.browser_cache_lock:
-        resolved = state.device_uri_map.get(name_lower)
+        uri_map = state.device_uri_map
+        resolved = uri_map.get(name_lower) or uri_map.get(name_compact)
+        memo = None if resolved else state.device_uri_scan_memo.get(name_lower)
     if resolved:
         logger.info("Resolved device name '%s' to URI '%s'", uri_or_name, resolved)
         return resolved
+    if memo is not None:
+        return memo or uri_or_name
 
     # Map is empty — wait (bounded) for warmup thread to populate it
     logger.info("Device map empty, waiting for browser cache warmup (max 5s)...")
     state.browser_cache_ready.wait(timeout=5.0)
     with state.browser_cache_lock:
-        resolved = state.device_uri_map.get(name_lower)
+        resolved = state.device_uri_map.get(name_lower) or state.device_uri_map.get(name_compact)
     if resolved:
         logger.info("Resolved device name '%s' to URI '%s'", uri_or_name, resolved)
         return resolved
@@ -327,12 +459,21 @@ def resolve_device_uri(uri_or_name: str) -> str:
         cache_snapshot = state.browser_cache_flat
     if cache_snapshot:
         logger.warning("Device '%s' not in URI map, falling back to O(n) scan of %d items", uri_or_name, len(cache_snapshot))
-    for item in cache_snapshot:
-        if item.get("search_name") == name_lower and item.get("is_loadable") and item.get("uri"):
+    for item, search_name in zip(cache_snapshot, search_names(cache_snapshot)):
+        if search_name == name_lower and item.get("is_loadable") and item.get("uri"):
             resolved = item["uri"]
             logger.info("Resolved device name '%s' via cache scan to URI '%s'", uri_or_name, resolved)
+            with state.browser_cache_lock:
+                # Only memoize against the cache we scanned; a refresh resets the memo
+                if state.browser_cache_flat is cache_snapshot:
+                    state.device_uri_scan_memo[name_lower] = resolved
             return resolved
 
+    # Remember the miss too, but only against a populated, finished cache
+    if cache_snapshot and state.browser_cache_ready.is_set():
+        with state.browser_cache_lock:
+            if state.browser_cache_flat is cache_snapshot:
+                state.device_uri_scan_memo[name_lower] = ""
     logger.warning("Could not resolve '%s' to a known URI, passing through as-is", uri_or_name)
     return uri_or_name
 
@@ -357,15 +498,16 @@ def resolve_sample_uri(uri_or_name: str) -> str:
         if filename:
             filename_lower = filename.lower()
             with state.browser_cache_lock:
-                snapshot = list(state.browser_cache_flat)
+                snapshot = state.browser_cache_flat
+            names = search_names(snapshot)
             # exact name match
-            for item in snapshot:
-                if item.get("search_name") == filename_lower and item.get("uri"):
+            for item, search_name in zip(snapshot, names):
+                if search_name == filename_lower and item.get("uri"):
                     logger.info("Resolved query URI '%s' to '%s'", uri_or_name, item["uri"])
                     return item["uri"]
             # substring fallback
-            for item in snapshot:
-                if filename_lower in item.get("search_name", "") and item.get("uri"):
+            for item, search_name in zip(snapshot, names):
+                if filename_lower in search_name and item.get("uri"):
                     logger.info("Resolved query URI '%s' to '%s' (substring)", uri_or_name, item["uri"])
                     return item["uri"]
         # Not in cache — fall through to live lookup below
@@ -377,16 +519,16 @@ def resolve_sample_uri(uri_or_name: str) -> str:
     # --- Plain filename: search cache ---
     name_lower = (filename or uri_or_name).strip().lower()
     with state.browser_cache_lock:
-        snapshot = list(state.browser_cache_flat)
+        snapshot = state.browser_cache_flat
+    names = search_names(snapshot)
     # exact match
-    for item in snapshot:
-        if item.get("search_name") == name_lower and item.get("is_loadable") and item.get("uri"):
+    for item, search_name in zip(snapshot, names):
+        if search_name == name_lower and item.get("is_loadable") and item.get("uri"):
             logger.info("Resolved sample name '%s' to URI '%s'", uri_or_name, item["uri"])
             return item["uri"]
     # substring match
-    for item in snapshot:
-        sn = item.get("search_name", "")
-        if name_lower in sn and item.get("is_loadable") and item.get("uri"):
+    for item, search_name in zip(snapshot, names):
+        if name_lower in search_name and item.get("is_loadable") and item.get("uri"):
             logger.info("Resolved sample name '%s' to URI '%s' (substring)", uri_or_name, item["uri"])
             return item["uri"]
 
@@ -439,3 +581,22 @@ def get_browser_cache() -> List[Dict[str, Any]]:
     """Get the flat browser cache. Use refresh_browser_cache to force a rescan."""
     with state.browser_cache_lock:
         return state.browser_cache_flat
+
+
+def search_names(items: List[Dict[str, Any]]) -> List[str]:
+    """Return the lowercase names of *items* as one column, built once per list.
+
+    Cache lists are replaced, never mutated, so the column is keyed on the
+    list's identity. Name scans then walk a list of strings instead of
+    doing a dict lookup per item.
+    """
+    entry = state.browser_search_columns.get(id(items))
+    if entry is not None and entry[0] is items:
+        return entry[1]
+    names = [
+        item["search_name"] if "search_name" in item else item.get("name", "").lower()
+        for item in items
+    ]
+    with state.browser_cache_lock:
+        state.browser_search_columns[id(items)] = (items, names)
+    return names
@@ -0,0 +1,125 @@
+"""Short-lived cache for read-only Remote Script queries.
+
+Bulk queries such as ``get_all_tracks_info`` are often repeated several times
+within one agent turn. Their serialized JSON is cached for a short TTL so a
+repeat read skips both the TCP round trip and ``json.dumps``.
+
+Every non-read command sent through ``AbletonConnection.send_command`` bumps
+``state.live_state_epoch`` and drops all entries, so changes made through the
+bridge are visible immediately. The TTL bounds staleness from edits made
+directly in Live.
+
+Entries hold the already-encoded JSON text, so a hit returns the stored
+string as-is with no re-encoding.
+
+The session's track count is tracked the same way: it is recorded from
+``get_all_tracks_info`` results, is only trusted while the epoch it was
+observed at is current, and expires after ``state.TRACK_COUNT_TTL``.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+import MCP_Server.state as state
+from MCP_Server.serialization import dumps
+
+DEFAULT_QUERY_TTL: float = 0.2   # seconds
+METER_QUERY_TTL: float = 0.03    # meters change continuously; only amortize bursts
+
+
+def bump_live_state_epoch() -> None:
+    """Invalidate every cached query result."""
+    with state.query_cache_lock:
+        state.live_state_epoch += 1
+        state.query_cache.clear()
+
+
+def _lookup(command: str, params: Optional[Dict[str, Any]], ttl: float):
+    """Return (key, now, epoch, fresh cached JSON or None)."""
+    key = (command, tuple(sorted(params.items())) if params else ())
+    now = time.monotonic()
+    with state.query_cache_lock:
+        entry = state.query_cache.get(key)
+        epoch = state.live_state_epoch
+    if entry is not None and now - entry[0] < ttl:
+        return key, now, epoch, entry[1]
+    return key, now, epoch, None
+
+
+def _store(key: tuple, now: float, epoch: int, result: Any) -> str:
+    encoded = dumps(result)
+    with state.query_cache_lock:
+        # A write that landed while we were fetching makes this result stale
+        if state.live_state_epoch == epoch:
+            state.query_cache[key] = (now, encoded)
+    return encoded
+
+
+def cached_query(ableton, command: str, params: Optional[Dict[str, Any]] = None,
+                 ttl: float = DEFAULT_QUERY_TTL,
+                 on_fetch: Optional[Callable[[Any, int], None]] = None) -> str:
+    """Send a read-only *command* and return its JSON, reusing a fresh cached copy.
+
+    *on_fetch*, if given, is called with the raw result and the epoch it was
+    read at whenever the command actually goes to Live.
+    """
+    key, now, epoch, hit = _lookup(command, params, ttl)
+    if hit is not None:
+        return hit
+    result = ableton.send_command(command, params)
+    if on_fetch is not None:
+        on_fetch(result, epoch)
+    return _store(key, now, epoch, result)
+
+
+async def cached_query_async(connect: Callable[[], Any], command: str,
+                             params: Optional[Dict[str, Any]] = None,
+                             ttl: float = DEFAULT_QUERY_TTL) -> str:
+    """Awaitable cached_query for coroutine tools.
+
+    A cache hit is answered on the event loop without a thread hop. On a
+    miss, *connect* (which may block while reconnecting) runs in a worker
+    thread and the command goes out through ``send_command_async``.
+    """
+    key, now, epoch, hit = _lookup(command, params, ttl)
+    if hit is not None:
+        return hit
+    ableton = await asyncio.to_thread(connect)
+    result = await ableton.send_command_async(command, params)
+    return _store(key, now, epoch, result)
+
+
+def record_track_count(count: int, epoch: int) -> None:
+    """Remember that the session had *count* tracks as of *epoch*."""
+    with state.track_count_lock:
+        state.track_count_cache = (count, epoch, time.monotonic())
+
+
+def adjust_track_count(delta: int) -> None:
+    """Apply a known track-count change from the write that just completed.
+
+    The write itself bumped the epoch, so the cached count is only carried
+    forward if it was current immediately before that write.
+    """
+    with state.track_count_lock:
+        cached = state.track_count_cache
+        if cached is None:
+            return
+        count, epoch, observed_at = cached
+        current = state.live_state_epoch
+        if epoch == current - 1:
+            state.track_count_cache = (count + delta, current, observed_at)
+        else:
+            state.track_count_cache = None
+
+
+def known_track_count() -> Optional[int]:
+    """Return the cached track count, or None if it is missing or stale."""
+    cached = state.track_count_cache
+    if cached is None:
+        return None
+    count, epoch, observed_at = cached
+    if epoch != state.live_state_epoch or time.monotonic() - observed_at >= state.TRACK_COUNT_TTL:
+        return None
+    return count
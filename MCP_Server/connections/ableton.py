@@ -1,27 +1,76 @@
 """AbletonConnection — TCP socket connection to the Ableton Remote Script."""
 
+import asyncio
 import socket
 import json
 import logging
 import time
 import threading
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-from MCP_Server.constants import TIER_0_COMMANDS, TIER_1_COMMANDS, TIER_2_COMMANDS, MODIFYING_COMMANDS
+from MCP_Server.constants import TIER_0_COMMANDS, COMMAND_META, DEFAULT_COMMAND_META
+from MCP_Server.cache.queries import bump_live_state_epoch
+from MCP_Server.serialization import dumpb, loads
 import MCP_Server.state as state
 
 logger = logging.getLogger("AbletonBridge")
 
-# Phase 4.5: Non-idempotent commands should NOT be retried automatically
-# because a retry could create duplicate tracks, clips, etc.
-NON_IDEMPOTENT_COMMANDS = frozenset([
-    "create_midi_track", "create_audio_track", "create_clip",
-    "create_return_track", "create_scene", "delete_track",
-    "delete_clip", "delete_scene", "delete_device",
-    "duplicate_track", "duplicate_clip", "duplicate_scene", "add_notes_to_clip",
-    "add_notes_extended", "delete_return_track",
-])
+
+# Exact bytes the Remote Script's json.dumps writes before a success result
+_RAW_SUCCESS_PREFIX = b'{"status": "success", "result": '
+
+# Large enough that a pipelined batch goes out in a single send
+_SOCKET_BUFFER_BYTES = 256 * 1024
+
+# Per-recv read size; large responses (browser trees, clip dumps) arrive in
+# a few reads instead of dozens
+_RECV_CHUNK_BYTES = 64 * 1024
+
+# Keepalive timing (seconds) so a vanished peer is noticed by the kernel in
+# well under a minute instead of the two-hour system default
+_KEEPALIVE_IDLE = 10
+_KEEPALIVE_INTERVAL = 5
+_KEEPALIVE_COUNT = 3
+
+
+def _encode_command(command: Dict[str, Any]) -> bytes:
+    """Serialize a command to compact JSON bytes that are pure ASCII.
+
+    Remote Scripts from earlier releases decode every recv() chunk on its
+    own, so a multi-byte character split across two chunks would be
+    mangled; anything non-ASCII is therefore re-encoded with \\u escapes.
+    """
+    payload = dumpb(command)
+    if not payload.isascii():
+        payload = json.dumps(command, separators=(",", ":")).encode("ascii")
+    return payload
+
+
+def _tune_socket(sock: socket.socket) -> None:
+    """Apply low-latency options to a fresh TCP socket (best effort).
+
+    TCP_NODELAY stops Nagle's algorithm from holding back a small command
+    until the previous one is ACKed, which otherwise costs up to a
+    delayed-ACK interval (~40 ms) on back-to-back sends.
+    """
+    options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_BYTES),
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_BYTES),
+    ]
+    # Keepalive tuning knobs are platform specific (Linux, recent macOS/Windows)
+    for name, value in (("TCP_KEEPIDLE", _KEEPALIVE_IDLE),
+                        ("TCP_KEEPINTVL", _KEEPALIVE_INTERVAL),
+                        ("TCP_KEEPCNT", _KEEPALIVE_COUNT)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    for level, option, value in options:
+        try:
+            sock.setsockopt(level, option, value)
+        except OSError as e:
+            logger.debug("setsockopt(%s, %s) failed: %s", level, option, e)
 
 
 @dataclass
@@ -39,9 +88,10 @@ class AbletonConnection:
 
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            _tune_socket(self.sock)
             self.sock.settimeout(5.0)
             self.sock.connect((self.host, self.port))
-            self._recv_buffer = ""  # Clear buffer on new connection
+            self._recv_buffer.clear()  # Clear buffer on new connection
             logger.info("Connected to Ableton at %s:%s", self.host, self.port)
             return True
         except Exception as e:
@@ -72,8 +122,13 @@ class AbletonConnection:
                 self._udp_sock = None
 
     def __post_init__(self):
-        self._recv_buffer = ""
+        self._recv_buffer = bytearray()
+        # Fixed landing area for recv_into(); each read is copied once, into
+        # _recv_buffer, instead of first becoming a fresh bytes object
+        self._recv_chunk = memoryview(bytearray(_RECV_CHUNK_BYTES))
         self._send_lock = threading.Lock()
+        # Monotonic time before which the next command must not be sent
+        self._next_send_at = 0.0
 
     def _ensure_udp_socket(self):
         """Create a UDP socket for real-time parameter sending if not already open."""
@@ -91,42 +146,55 @@ class AbletonConnection:
             "type": command_type,
             "params": params or {}
         }
-        payload = json.dumps(command).encode("utf-8")
+        payload = _encode_command(command)
         sock.sendto(payload, (self.host, self._udp_port))
         logger.debug("Sent UDP command: %s", command_type)
 
-    def receive_full_response(self, sock, buffer_size=8192, timeout=15.0):
-        """Receive a complete newline-delimited JSON response and return the parsed object"""
+    def receive_full_response(self, sock, buffer_size=_RECV_CHUNK_BYTES, timeout=15.0, raw=False):
+        """Receive a complete newline-delimited JSON response and return the parsed object.
+
+        With raw=True the response line is returned as undecoded bytes.
+        """
         sock.settimeout(timeout)
+        buf = self._recv_buffer
+        chunk = self._recv_chunk[:buffer_size]
+        # Only bytes appended since the last miss need scanning for the delimiter,
+        # so a large response arriving in many chunks is scanned once overall.
+        scan_from = 0
 
         try:
             while True:
-                # Check if we already have a complete line in the buffer
-                if '\n' in self._recv_buffer:
-                    line, self._recv_buffer = self._recv_buffer.split('\n', 1)
-                    line = line.strip()
-                    if line:
-                        try:
-                            result = json.loads(line)
-                        except json.JSONDecodeError:
-                            logger.error("Malformed JSON from Ableton (first 200 chars): %s", line[:200])
-                            raise
-                        logger.debug("Received complete response (%d chars)", len(line))
-                        return result
+                nl = buf.find(b'\n', scan_from)
+                if nl != -1:
+                    line = bytes(buf[:nl]).strip()
+                    del buf[:nl + 1]
+                    scan_from = 0
+                    if not line:
+                        continue
+                    if raw:
+                        return line
+                    try:
+                        result = loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        logger.error("Malformed JSON from Ableton (first 200 bytes): %r", line[:200])
+                        raise
+                    logger.debug("Received complete response (%d bytes)", len(line))
+                    return result
+                scan_from = len(buf)
 
                 try:
-                    chunk = sock.recv(buffer_size)
-                    if not chunk:
+                    n = sock.recv_into(chunk)
+                    if not n:
                         raise Exception("Connection closed before receiving any data")
 
-                    self._recv_buffer += chunk.decode('utf-8')
+                    buf += chunk[:n]
                 except socket.timeout:
                     logger.warning("Socket timeout during receive")
                     raise
                 except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
                     logger.error("Socket connection error during receive: %s", e)
                     raise
-        except (socket.timeout, json.JSONDecodeError):
+        except (socket.timeout, json.JSONDecodeError, UnicodeDecodeError):
             raise
         except Exception as e:
             logger.error("Error during receive: %s", e)
@@ -136,7 +204,7 @@ class AbletonConnection:
         """Force a fresh reconnection, clearing all state."""
         logger.info("Forcing reconnection to Ableton...")
         self.disconnect()
-        self._recv_buffer = ""
+        self._recv_buffer.clear()
         return self.connect()
 
     def send_command(self, command_type: str, params: Dict[str, Any] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
@@ -144,24 +212,22 @@ class AbletonConnection:
 
         Includes automatic retry: if the first attempt fails due to a
         socket error, the connection is reset and the command is retried once.
-        Adds small delays around modifying commands for stability.
+        Modifying commands leave Ableton a short settle time before the next
+        send; it is only slept off if the next command arrives sooner.
 
         Non-idempotent commands (create/delete operations) are NOT retried
         to prevent duplicate side-effects (Phase 4.5).
         """
+        # Settle time, retry policy and default timeout come from one lookup.
+        # Settle times are small since the async semaphore in _tool_handler
+        # already serializes tool calls, preventing command flooding.
+        settle, non_idempotent, default_timeout = COMMAND_META.get(
+            command_type, DEFAULT_COMMAND_META
+        )
         # Phase 4.5: non-idempotent commands get a single attempt
-        max_attempts = 1 if command_type in NON_IDEMPOTENT_COMMANDS else 2
-        is_modifying = command_type in MODIFYING_COMMANDS
-
-        # Determine delay tier: reduced delays since the async semaphore in
-        # _tool_handler already serializes tool calls, preventing command flooding.
-        # Tier 0 = no delay, Tier 1 = 10ms post, Tier 2 = 10ms pre+post
-        if command_type in TIER_2_COMMANDS:
-            pre_delay, post_delay = 0.01, 0.01
-        elif command_type in TIER_1_COMMANDS:
-            pre_delay, post_delay = 0, 0.01
-        else:
-            pre_delay, post_delay = 0, 0
+        max_attempts = 1 if non_idempotent else 2
+        # Anything that is not a plain getter may change Live state
+        is_read = command_type.startswith("get_")
 
         for attempt in range(1, max_attempts + 1):
             with self._send_lock:
@@ -173,22 +239,21 @@ class AbletonConnection:
                     "params": params or {}
                 }
 
+                # Invalidate cached queries before the write hits the socket;
+                # _send_lock orders it against any in-flight read.
+                if not is_read:
+                    bump_live_state_epoch()
+
                 try:
                     logger.debug("Sending command: %s (attempt %d)", command_type, attempt)
 
                     # Send the command as newline-delimited JSON
-                    self.sock.sendall((json.dumps(command) + '\n').encode('utf-8'))
-
-                    # Pre-delay: give Ableton time to process before we read the response
-                    if pre_delay:
-                        time.sleep(pre_delay)
+                    self._wait_for_send_slot()
+                    self.sock.sendall(_encode_command(command) + b'\n')
 
                     # Set timeout based on command type (caller override takes priority)
                     if timeout is None:
-                        from MCP_Server.constants import SLOW_COMMAND_TIMEOUTS
-                        timeout = SLOW_COMMAND_TIMEOUTS.get(
-                            command_type, 15.0 if is_modifying else 10.0
-                        )
+                        timeout = default_timeout
                     # Receive the response (already parsed by receive_full_response)
                     response = self.receive_full_response(self.sock, timeout=timeout)
                     logger.debug("Response status: %s", response.get('status', 'unknown'))
@@ -197,17 +262,21 @@ class AbletonConnection:
                         logger.error("Ableton error: %s", response.get('message'))
                         raise Exception(response.get("message", "Unknown error from Ableton"))
 
-                    # Post-delay: let Ableton settle before the next command
-                    if post_delay:
-                        time.sleep(post_delay)
+                    # A full round trip proves the socket is alive
+                    _mark_verified(self)
+
+                    # Let Ableton settle before the next command
+                    if settle:
+                        self._next_send_at = time.monotonic() + settle
 
                     return response.get("result", {})
 
                 except Exception as e:
                     logger.error("Command '%s' attempt %d failed: %s", command_type, attempt, e)
                     # Close the broken socket and clear buffer
+                    _mark_unverified(self)
                     self.disconnect()
-                    self._recv_buffer = ""
+                    self._recv_buffer.clear()
 
                     if attempt < max_attempts:
                         # Wait briefly then retry with a fresh connection
@@ -218,9 +287,117 @@ class AbletonConnection:
                     else:
                         raise Exception(f"Command '{command_type}' failed after {max_attempts} attempts: {e}")
 
+    def send_commands_pipelined(self, commands: List[Tuple[str, Optional[Dict[str, Any]]]],
+                                raw: bool = False) -> List[Any]:
+        """Send several commands in one write and read their responses in order.
+
+        The Remote Script handles newline-delimited commands one after another
+        on the same socket, so the whole batch costs one round trip instead of
+        one per command. Only pipeline commands that do not depend on each
+        other's results; anything that returns an index later commands need
+        must go through send_command first.
+
+        Returns one entry per command: the result dict, or an Exception for a
+        command Ableton rejected. Transport errors raise and are not retried,
+        since part of the batch may already have been applied.
+
+        With raw=True each successful result is returned as its JSON bytes,
+        cut straight out of the response line instead of being decoded, for
+        callers that only forward the data.
+        """
+        if not commands:
+            return []
+        metas = [COMMAND_META.get(c, DEFAULT_COMMAND_META) for c, _ in commands]
+        settle = max(s for s, _, _ in metas)
+        payload = b"".join(
+            _encode_command({"type": c, "params": p or {}}) + b"\n" for c, p in commands
+        )
+
+        with self._send_lock:
+            if not self.sock and not self.connect():
+                raise ConnectionError("Not connected to Ableton")
+            if not all(c.startswith("get_") for c, _ in commands):
+                bump_live_state_epoch()
+            try:
+                logger.debug("Sending %d pipelined commands", len(commands))
+                self._wait_for_send_slot()
+                self.sock.sendall(payload)
+                results: List[Any] = []
+                for (command_type, _), (_, _, timeout) in zip(commands, metas):
+                    response = self.receive_full_response(self.sock, timeout=timeout, raw=raw)
+                    if raw:
+                        if response.startswith(_RAW_SUCCESS_PREFIX) and response.endswith(b"}"):
+                            results.append(response[len(_RAW_SUCCESS_PREFIX):-1])
+                            continue
+                        response = loads(response)
+                    if response.get("status") == "error":
+                        logger.error("Ableton error (%s): %s", command_type, response.get("message"))
+                        results.append(Exception(response.get("message", "Unknown error from Ableton")))
+                    elif raw:
+                        results.append(json.dumps(response.get("result", {})).encode("utf-8"))
+                    else:
+                        results.append(response.get("result", {}))
+            except Exception as e:
+                logger.error("Pipelined batch failed: %s", e)
+                _mark_unverified(self)
+                self.disconnect()
+                self._recv_buffer.clear()
+                raise Exception(f"Pipelined batch of {len(commands)} commands failed: {e}")
+            _mark_verified(self)
+            if settle:
+                self._next_send_at = time.monotonic() + settle
+            return results
+
+    def _wait_for_send_slot(self) -> None:
+        """Sleep off whatever remains of the previous command's settle time."""
+        wait = self._next_send_at - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def send_command_async(self, command_type: str, params: Dict[str, Any] = None,
+                                 timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Awaitable send_command; the blocking socket I/O runs in a worker thread."""
+        return await asyncio.to_thread(self.send_command, command_type, params, timeout)
+
+
+def _mark_verified(conn: AbletonConnection) -> None:
+    """Record that the shared connection just completed a round trip."""
+    if conn is state.ableton_connection:
+        state.ableton_verified_at = time.monotonic()
+
+
+def _mark_unverified(conn: AbletonConnection) -> None:
+    """Force the next get_ableton_connection() to probe the shared socket."""
+    if conn is state.ableton_connection:
+        state.ableton_verified_at = 0.0
+
+
+def invalidate_ableton_connection() -> None:
+    """Drop the cached connection so the next get_ableton_connection() reconnects."""
+    conn = state.ableton_connection
+    state.ableton_connection = None
+    state.ableton_verified_at = 0.0
+    if conn is not None:
+        try:
+            conn.disconnect()
+        except Exception:
+            pass
+
 
 def get_ableton_connection():
-    """Get or create a persistent Ableton connection"""
+    """Get or create a persistent Ableton connection.
+
+    A connection verified within the last ABLETON_LIVENESS_TTL seconds is
+    returned without probing the socket, so back-to-back tool calls pay one
+    attribute read. Every successful command refreshes the verification and
+    every failed one clears it, so during a busy session the getpeername()
+    probe only runs after an idle gap or an error. send_command() still
+    reconnects on its own if the socket dies in between.
+    """
+    conn = state.ableton_connection
+    if conn is not None and conn.sock is not None:
+        if time.monotonic() - state.ableton_verified_at < state.ABLETON_LIVENESS_TTL:
+            return conn
 
     if state.ableton_connection is not None:
         try:
@@ -229,14 +406,11 @@ def get_ableton_connection():
                 raise ConnectionError("Socket is None")
             state.ableton_connection.sock.settimeout(1.0)
             state.ableton_connection.sock.getpeername()  # raises if disconnected
+            state.ableton_verified_at = time.monotonic()
             return state.ableton_connection
         except Exception as e:
             logger.warning("Existing connection is no longer valid: %s", e)
-            try:
-                state.ableton_connection.disconnect()
-            except Exception:
-                pass
-            state.ableton_connection = None
+            invalidate_ableton_connection()
 
     # Connection doesn't exist or is invalid, create a new one
     if state.ableton_connection is None:
@@ -254,6 +428,7 @@ def get_ableton_connection():
                         # Get session info as a test
                         state.ableton_connection.send_command("get_session_info")
                         logger.info("Connection validated successfully")
+                        state.ableton_verified_at = time.monotonic()
                         state.ableton_connected_event.set()
                         return state.ableton_connection
                     except Exception as e:
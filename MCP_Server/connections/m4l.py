@@ -1,5 +1,6 @@
 """M4LConnection — UDP connection to the Max for Live bridge device."""
 
+import asyncio
 import socket
 import json
 import logging
@@ -7,14 +8,63 @@ import time
 import threading
 import uuid
 import base64
+import functools
 import struct
 from dataclasses import dataclass, field
 from typing import Dict, Any, List
 
 import MCP_Server.state as state
+from MCP_Server.serialization import loads
 
 logger = logging.getLogger("AbletonBridge")
 
+# Precompiled OSC argument formats (big-endian 32-bit int / float)
+_INT_ST = struct.Struct(">i")
+_FLOAT_ST = struct.Struct(">f")
+
+
+def _osc_padded_len(n: int) -> int:
+    """Size of an n-byte OSC string once null-terminated and padded to 4 bytes."""
+    return (n + 4) & ~3
+
+
+# Per-typetag packers: each writes one pre-converted argument at ``off`` and
+# returns the offset just past it.  Unknown tags write nothing.
+def _pack_int(buf: bytearray, off: int, v) -> int:
+    _INT_ST.pack_into(buf, off, int(v))
+    return off + 4
+
+
+def _pack_float(buf: bytearray, off: int, v) -> int:
+    _FLOAT_ST.pack_into(buf, off, float(v))
+    return off + 4
+
+
+def _pack_string(buf: bytearray, off: int, b: bytes) -> int:
+    buf[off:off + len(b)] = b
+    return off + _osc_padded_len(len(b))
+
+
+def _pack_nothing(buf: bytearray, off: int, v) -> int:
+    return off
+
+
+_OSC_PACKERS = {"i": _pack_int, "f": _pack_float, "s": _pack_string}
+
+
+@functools.lru_cache(maxsize=128)
+def _osc_signature(tags: str):
+    """Precompute everything about a typetag signature that doesn't depend on values.
+
+    Returns ``(type_tag_bytes, packers, fixed_size, string_slots)`` where
+    ``fixed_size`` covers the padded type tag plus all numeric arguments.
+    """
+    type_tag = ("," + tags).encode("utf-8")
+    packers = tuple(_OSC_PACKERS.get(t, _pack_nothing) for t in tags)
+    fixed_size = _osc_padded_len(len(type_tag)) + 4 * sum(t in ("i", "f") for t in tags)
+    string_slots = tuple(i for i, t in enumerate(tags) if t == "s")
+    return type_tag, packers, fixed_size, string_slots
+
 
 @dataclass
 class M4LConnection:
@@ -72,23 +122,24 @@ class M4LConnection:
           ('f', 3.14) -- 32-bit float
           ('s', 'hi') -- null-terminated padded string
         """
-        def _osc_string(s: str) -> bytes:
-            b = s.encode("utf-8") + b"\x00"
-            b += b"\x00" * ((4 - len(b) % 4) % 4)
-            return b
-
         osc_args = osc_args or []
-        msg = _osc_string(address)
-        type_tag = "," + "".join(t for t, _ in osc_args)
-        msg += _osc_string(type_tag)
-        for t, v in osc_args:
-            if t == "s":
-                msg += _osc_string(str(v))
-            elif t == "i":
-                msg += struct.pack(">i", int(v))
-            elif t == "f":
-                msg += struct.pack(">f", float(v))
-        return msg
+        type_tag, packers, total, string_slots = _osc_signature(
+            "".join(t for t, _ in osc_args))
+        values = [v for _, v in osc_args]
+        # Encode strings up front so the whole message is sized once; the
+        # zero-filled buffer supplies every null terminator and pad byte.
+        for i in string_slots:
+            values[i] = str(values[i]).encode("utf-8")
+            total += _osc_padded_len(len(values[i]))
+        addr = address.encode("utf-8")
+        total += _osc_padded_len(len(addr))
+
+        buf = bytearray(total)
+        off = _pack_string(buf, 0, addr)
+        off = _pack_string(buf, off, type_tag)
+        for pack, v in zip(packers, values):
+            off = pack(buf, off, v)
+        return bytes(buf)
 
     def _build_osc_packet(self, command_type: str, params: Dict[str, Any], request_id: str) -> bytes:
         """Build the OSC packet for a given command type."""
@@ -477,6 +528,11 @@ class M4LConnection:
                         continue
                     raise Exception("Timeout waiting for M4L bridge response. Is the M4L device loaded?")
 
+    async def send_command_async(self, command_type: str, params: Dict[str, Any] = None,
+                                 timeout: float = None) -> Dict[str, Any]:
+        """Awaitable send_command; the blocking socket I/O runs in a worker thread."""
+        return await asyncio.to_thread(self.send_command, command_type, params, timeout)
+
     def send_command_with_retry(self, command_type: str, params: Dict[str, Any] = None, timeout: float = None, max_attempts: int = 3) -> Dict[str, Any]:
         """Send command with retry logic for 'busy' responses from M4L bridge."""
         if max_attempts <= 0:
@@ -511,26 +567,34 @@ class M4LConnection:
         else:
             osc_address = data.decode("utf-8", errors="replace").strip()
 
+        # Raw JSON (chunk packets, older bridges): '{' and '[' are in neither
+        # base64 alphabet, so the first character picks the parser up front
+        if osc_address[:1] in ("{", "["):
+            try:
+                return loads(osc_address)
+            except ValueError:
+                pass
+
         # The OSC address is our base64-encoded JSON response
         # (udpsend uses the outlet symbol as the OSC address)
         # URL-safe base64 is the common path (v2.0.0+ bridge)
         try:
             padded = osc_address + "=" * (-len(osc_address) % 4)
-            decoded = base64.urlsafe_b64decode(padded).decode("utf-8")
-            return json.loads(decoded)
+            decoded = base64.urlsafe_b64decode(padded)
+            return loads(decoded)
         except (ValueError, base64.binascii.Error, json.JSONDecodeError, UnicodeDecodeError):
             pass
 
         # Fallback: try standard base64
         try:
-            decoded = base64.b64decode(osc_address).decode("utf-8")
-            return json.loads(decoded)
+            decoded = base64.b64decode(osc_address)
+            return loads(decoded)
         except (ValueError, base64.binascii.Error, json.JSONDecodeError, UnicodeDecodeError):
             pass
 
         # Fallback: try raw JSON (in case response wasn't base64-encoded)
         try:
-            return json.loads(osc_address)
+            return loads(osc_address)
         except (json.JSONDecodeError, ValueError):
             pass
 
@@ -541,13 +605,13 @@ class M4LConnection:
         text = text.rstrip(",").strip()
         try:
             padded = text + "=" * (-len(text) % 4)
-            decoded = base64.urlsafe_b64decode(padded).decode("utf-8")
-            return json.loads(decoded)
+            decoded = base64.urlsafe_b64decode(padded)
+            return loads(decoded)
         except (ValueError, base64.binascii.Error, json.JSONDecodeError, UnicodeDecodeError):
             pass
         try:
-            decoded = base64.b64decode(text).decode("utf-8")
-            return json.loads(decoded)
+            decoded = base64.b64decode(text)
+            return loads(decoded)
         except (ValueError, base64.binascii.Error, json.JSONDecodeError, UnicodeDecodeError):
             pass
 
@@ -559,56 +623,66 @@ class M4LConnection:
         Large responses are split into multiple UDP packets, each containing:
           {"_c": chunk_index, "_t": total_chunks, "_d": "url_safe_base64_piece"}
         Each _d piece decodes to a fragment of the original JSON string.
-        We collect all chunks, decode each _d, concatenate, and parse.
+        We collect all chunks into slots indexed by _c, decode, and parse once.
         """
         total = first_chunk["_t"]
         logger.info("M4L chunked response: %d total chunks", total)
 
-        # Store chunks by index
-        chunks: Dict[int, str] = {first_chunk["_c"]: first_chunk["_d"]}
+        first_idx = first_chunk["_c"]
+        if not 0 <= first_idx < total:
+            raise Exception(f"M4L chunked response: first chunk index {first_idx} out of range for {total} chunks")
+
+        pieces: List[str] = [None] * total
+        pieces[first_idx] = first_chunk["_d"]
+        received = 1
 
         # Collect remaining chunks
         # Give extra time: 100ms per chunk + 5s base
         chunk_timeout = max(5.0, total * 0.1 + 5.0)
         self.recv_sock.settimeout(chunk_timeout)
 
-        while len(chunks) < total:
+        while received < total:
             try:
                 data, _ = self.recv_sock.recvfrom(65535)
                 parsed = self._parse_m4l_response(data)
                 if "_c" in parsed and "_t" in parsed:
                     idx = parsed["_c"]
-                    if idx in chunks:
+                    if not 0 <= idx < total:
+                        logger.warning("M4L chunk reassembly: chunk %d out of range, ignoring", idx)
+                        continue
+                    if pieces[idx] is not None:
                         logger.warning("M4L chunk reassembly: duplicate chunk %d, ignoring", idx)
                         continue
-                    chunks[idx] = parsed["_d"]
-                    if len(chunks) % 5 == 0:
-                        logger.info("M4L chunk reassembly: %d/%d", len(chunks), total)
+                    pieces[idx] = parsed["_d"]
+                    received += 1
+                    if received % 5 == 0:
+                        logger.info("M4L chunk reassembly: %d/%d", received, total)
                 else:
                     # Got a non-chunk response (maybe from another command?)
                     logger.warning("M4L chunk reassembly: got non-chunk packet, ignoring")
             except socket.timeout:
-                missing = sorted(set(range(total)) - set(chunks.keys()))
+                missing = [i for i, p in enumerate(pieces) if p is None]
                 logger.error(
                     "M4L chunk reassembly: timeout after %d/%d chunks, missing: %s",
-                    len(chunks), total, missing[:10]
+                    received, total, missing[:10]
                 )
                 raise Exception(
-                    f"Timeout receiving chunked M4L response ({len(chunks)}/{total} chunks, "
+                    f"Timeout receiving chunked M4L response ({received}/{total} chunks, "
                     f"missing: {missing[:10]})"
                 )
 
-        # Reassemble: decode each piece and concatenate
-        json_parts = []
-        for i in range(total):
-            piece_b64 = chunks[i]
-            padded = piece_b64 + "=" * (-len(piece_b64) % 4)
-            piece_json = base64.urlsafe_b64decode(padded).decode("utf-8")
-            json_parts.append(piece_json)
-
-        full_json = "".join(json_parts)
-        logger.info("M4L chunked response reassembled: %d chars from %d chunks", len(full_json), total)
-        return json.loads(full_json)
+        # Each piece was encoded separately with its padding stripped. A piece
+        # whose length is a multiple of 4 had no padding, so when that holds
+        # for all but the last the base64 text can be joined and decoded once.
+        if all(len(p) % 4 == 0 for p in pieces[:-1]):
+            joined = "".join(pieces)
+            raw = base64.urlsafe_b64decode(joined + "=" * (-len(joined) % 4))
+        else:
+            raw = b"".join(
+                base64.urlsafe_b64decode(p + "=" * (-len(p) % 4)) for p in pieces
+            )
+        logger.info("M4L chunked response reassembled: %d bytes from %d chunks", len(raw), total)
+        return loads(raw)
 
     def ping(self) -> bool:
         """Check if the M4L bridge device is responding."""
@@ -36,11 +36,12 @@ TIER_0_COMMANDS: frozenset = frozenset([
     "preview_browser_item", "move_clip_playing_pos",
     "set_transmute_properties", "rack_variation_action",
     "set_return_track_mute", "set_return_track_solo", "set_clip_grid",
+    "set_mixer_batch",
 ])
 
-# Tier 1: Light delay (50ms post-delay only) -- note/clip/automation operations
+# Tier 1: Light delay (10ms settle time) -- note/clip/automation operations
 TIER_1_COMMANDS: frozenset = frozenset([
-    "add_notes_to_clip", "add_notes_extended", "remove_notes_range",
+    "add_notes_to_clip", "add_notes_to_clip_soa", "add_notes_extended", "remove_notes_range",
     "clear_clip_notes", "quantize_clip_notes", "transpose_clip_notes",
     "set_clip_loop_points", "set_clip_start_end",
     "create_clip_automation", "clear_clip_automation",
@@ -53,7 +54,7 @@ TIER_1_COMMANDS: frozenset = frozenset([
     "set_hybrid_reverb_ir", "duplicate_clip_to_arrangement",
 ])
 
-# Tier 2: Heavy delay (100ms pre + 100ms post) -- structural/loading changes
+# Tier 2: Heavy delay (20ms settle time) -- structural/loading changes
 TIER_2_COMMANDS: frozenset = frozenset([
     "create_midi_track", "create_audio_track", "create_clip",
     "delete_clip", "delete_track", "duplicate_track",
@@ -63,7 +64,7 @@ TIER_2_COMMANDS: frozenset = frozenset([
     "audio_to_midi", "create_midi_track_with_simpler",
     "sliced_simpler_to_drum_rack", "delete_device",
     "delete_time", "duplicate_time", "insert_silence",
-    "arm_track", "disarm_track",
+    "arm_track", "disarm_track", "apply_track_ops",
     "start_arrangement_recording", "stop_arrangement_recording",
     "set_loop_start", "set_loop_end", "set_loop_length", "set_playback_position",
 ])
@@ -71,6 +72,16 @@ TIER_2_COMMANDS: frozenset = frozenset([
 # Combined set of all modifying commands (union of all tiers)
 MODIFYING_COMMANDS: frozenset = TIER_0_COMMANDS | TIER_1_COMMANDS | TIER_2_COMMANDS
 
+# Phase 4.5: Non-idempotent commands should NOT be retried automatically
+# because a retry could create duplicate tracks, clips, etc.
+NON_IDEMPOTENT_COMMANDS: frozenset = frozenset([
+    "create_midi_track", "create_audio_track", "create_clip",
+    "create_return_track", "create_scene", "delete_track",
+    "delete_clip", "delete_scene", "delete_device",
+    "duplicate_track", "duplicate_clip", "duplicate_scene", "add_notes_to_clip",
+    "add_notes_to_clip_soa", "add_notes_extended", "delete_return_track",
+])
+
 # Per-command timeout overrides for legitimately slow operations.
 # Used by send_command() when the caller doesn't specify a timeout.
 SLOW_COMMAND_TIMEOUTS: Dict[str, float] = {
@@ -83,6 +94,28 @@ SLOW_COMMAND_TIMEOUTS: Dict[str, float] = {
     "get_browser_items_at_path": 20.0,
 }
 
+# Minimum gap in seconds between a command's response and the next send, per
+# delay tier. Tier 0 = none, Tier 1 = 10ms, Tier 2 = 20ms
+TIER_SETTLE_TIMES: Tuple[float, ...] = (0.0, 0.01, 0.02)
+
+
+def _command_meta(command: str) -> Tuple[float, bool, float]:
+    tier = 2 if command in TIER_2_COMMANDS else 1 if command in TIER_1_COMMANDS else 0
+    default_timeout = SLOW_COMMAND_TIMEOUTS.get(
+        command, 15.0 if command in MODIFYING_COMMANDS else 10.0
+    )
+    return TIER_SETTLE_TIMES[tier], command in NON_IDEMPOTENT_COMMANDS, default_timeout
+
+
+# command -> (settle_time, non_idempotent, default_timeout),
+# precomputed so send_command() does one dict lookup per call instead of
+# walking the tier sets. Commands not listed use DEFAULT_COMMAND_META.
+COMMAND_META: Dict[str, Tuple[float, bool, float]] = {
+    c: _command_meta(c)
+    for c in MODIFYING_COMMANDS | NON_IDEMPOTENT_COMMANDS | SLOW_COMMAND_TIMEOUTS.keys()
+}
+DEFAULT_COMMAND_META: Tuple[float, bool, float] = (TIER_SETTLE_TIMES[0], False, 10.0)
+
 # ---------------------------------------------------------------------------
 # Browser categories
 # ---------------------------------------------------------------------------
@@ -143,5 +176,7 @@ BROWSER_DISK_CACHE_MAX_AGE: float = 604800.0  # 7 days -- disk cache ignored if
 
 BROWSER_DISK_CACHE_DIR: str = os.path.join(os.path.expanduser("~"), ".ableton-bridge")
 BROWSER_DISK_CACHE_PATH: str = os.path.join(BROWSER_DISK_CACHE_DIR, "browser_cache.json.gz")
+# Written instead of the .gz file when the optional zstandard package is installed
+BROWSER_DISK_CACHE_PATH_ZSTD: str = os.path.join(BROWSER_DISK_CACHE_DIR, "browser_cache.json.zst")
 BROWSER_DISK_CACHE_PATH_LEGACY: str = os.path.join(BROWSER_DISK_CACHE_DIR, "browser_cache.json")
 CHAIN_TEMPLATES_PATH: str = os.path.join(BROWSER_DISK_CACHE_DIR, "chain_templates.json")
@@ -28,14 +28,19 @@ class DashboardLogHandler(logging.Handler):
     Stores lightweight tuples (created_float, level_str, message_str) to
     avoid formatting timestamps on every log message.  Timestamps are
     formatted only when the dashboard is actually viewed.
+
+    The buffer is best-effort: if the dashboard is copying it right now the
+    record is dropped rather than making the logging thread wait.
     """
 
     def emit(self, record):
         try:
-            with state.server_log_lock:
-                state.server_log_buffer.append(
-                    (record.created, record.levelname, record.getMessage())
-                )
+            entry = (record.created, record.levelname, record.getMessage())
+            if state.server_log_lock.acquire(blocking=False):
+                try:
+                    state.server_log_buffer.append(entry)
+                finally:
+                    state.server_log_lock.release()
         except Exception:
             pass
 
@@ -105,17 +110,20 @@ def build_status_json() -> dict:
 
     m4l_sockets_ready, m4l_connected = get_m4l_status()
 
+    # Copy under the locks, aggregate and format after releasing them
     with state.tool_call_lock:
         recent = list(state.tool_call_log)
-        total = sum(state.tool_call_counts.values())
-        top_tools = sorted(state.tool_call_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        counts = list(state.tool_call_counts.items())
+    total = sum(n for _, n in counts)
+    top_tools = sorted(counts, key=lambda x: x[1], reverse=True)[:10]
 
     with state.server_log_lock:
-        # Format timestamps from stored tuples (created_float, level, msg)
-        server_logs = [
-            {"ts": datetime.fromtimestamp(ts).strftime("%H:%M:%S"), "level": lvl, "msg": msg}
-            for ts, lvl, msg in state.server_log_buffer
-        ]
+        log_entries = list(state.server_log_buffer)
+    # Format timestamps from stored tuples (created_float, level, msg)
+    server_logs = [
+        {"ts": datetime.fromtimestamp(ts).strftime("%H:%M:%S"), "level": lvl, "msg": msg}
+        for ts, lvl, msg in log_entries
+    ]
 
     # Dynamic tool count via the mcp instance stored in state
     mcp = state.mcp_instance
@@ -108,6 +108,17 @@ NOTE_NAMES = {
 }
 ACCIDENTALS = {'#': 1, 'b': -1, '': 0}
 
+# Every label _RE_MELODIC_NOTE can capture ("C", "c#", "Bb", ...) -> semitone
+_NOTE_SEMITONES = {
+    letter + accidental: semitone + offset
+    for name, semitone in NOTE_NAMES.items()
+    for letter in (name, name.lower())
+    for accidental, offset in ACCIDENTALS.items()
+}
+
+# Melodic note symbols -> velocity; any other character ends the note
+_MELODIC_VELOCITIES = {'o': 90, 'x': 90, '.': 60, 'O': 110, '*': 110}
+
 
 # =============================================================================
 # GRID PARSER - DRUMS
@@ -150,27 +161,19 @@ def parse_drum_grid(grid: str, steps_per_beat: int = 4) -> list[dict]:
         if pitch is None:
             continue
 
-        # Parse pattern
-        step = 0
-        for char in pattern_str:
-            if char == '|':
-                continue  # Bar separator
-
-            velocity = DRUM_SYMBOLS.get(char, 0)
-
+        # Parse pattern; bar separators don't take up a step
+        duration = 1 / steps_per_beat
+        symbol_velocity = DRUM_SYMBOLS.get
+        for step, char in enumerate(pattern_str.replace('|', '')):
+            velocity = symbol_velocity(char, 0)
             if velocity > 0:
-                start_time = step / steps_per_beat
-                duration = 1 / steps_per_beat
-
                 notes.append({
                     'pitch': pitch,
-                    'start_time': start_time,
+                    'start_time': step / steps_per_beat,
                     'duration': duration,
                     'velocity': velocity
                 })
 
-            step += 1
-
     return notes
 
 
@@ -212,16 +215,9 @@ def parse_melodic_grid(grid: str, base_octave: int = 4, steps_per_beat: int = 4)
             else:
                 continue
         else:
-            raw = match.group(1)
-            base_letter = raw[0].upper()
-            accidental = raw[1:] if len(raw) > 1 else ""
             octave = int(match.group(2)) if match.group(2) else base_octave
             pattern_str = match.group(3)
-
-            # Convert to MIDI pitch
-            semitone = NOTE_NAMES.get(base_letter, 0)
-            semitone += ACCIDENTALS.get(accidental, 0)
-            pitch = semitone + (octave + 1) * 12
+            pitch = _NOTE_SEMITONES[match.group(1)] + (octave + 1) * 12
 
         # Parse pattern
         step = 0
@@ -232,17 +228,12 @@ def parse_melodic_grid(grid: str, base_octave: int = 4, steps_per_beat: int = 4)
             if char == '|':
                 continue
 
-            is_note = char in ('o', 'O', '.', 'x', '*')
+            char_velocity = _MELODIC_VELOCITIES.get(char)
 
-            if is_note:
+            if char_velocity is not None:
                 if note_start is None:
                     note_start = step
-                    if char in ('O', '*'):
-                        velocity = 110
-                    elif char == '.':
-                        velocity = 60
-                    else:
-                        velocity = 90
+                    velocity = char_velocity
             else:
                 if note_start is not None:
                     start_time = note_start / steps_per_beat
@@ -276,6 +267,35 @@ def parse_melodic_grid(grid: str, base_octave: int = 4, steps_per_beat: int = 4)
 # NOTES -> GRID (for display)
 # =============================================================================
 
+# Standard drum order for display, as pitch -> row rank (unlisted pitches sort last)
+_DRUM_DISPLAY_RANK = {}
+for _label in ('HC', 'HO', 'RD', 'CR', 'SN', 'CL', 'RM', 'KK', 'HT', 'MT', 'LT', 'FT'):
+    _DRUM_DISPLAY_RANK.setdefault(DRUM_LABELS[_label], len(_DRUM_DISPLAY_RANK))
+del _label
+
+_MELODIC_NAMES = ('C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B')
+
+
+def _group_by_pitch(notes: list[dict], default_pitch: int) -> dict:
+    """Bucket notes by pitch in a single pass."""
+    pitch_notes = {}
+    for note in notes:
+        pitch_notes.setdefault(note.get('pitch', default_pitch), []).append(note)
+    return pitch_notes
+
+
+def _format_row(label: str, row: list, bar_width: int) -> str:
+    """Join a row's cells bar by bar: ``label|....|....|``."""
+    bars = [''.join(row[i:i + bar_width]) for i in range(0, len(row), bar_width)]
+    return label + '|' + '|'.join(bars) + '|'
+
+
+def _beat_line(prefix: str, num_bars: int, steps_per_beat: int) -> str:
+    """Beat-number ruler matching the rows: ``  |1   2   3   4   |...``."""
+    pad = ' ' * (steps_per_beat - 1)
+    return prefix + '|' + ('1' + pad + '2' + pad + '3' + pad + '4' + pad + '|') * num_bars
+
+
 def notes_to_drum_grid(
     notes: list[dict],
     steps_per_beat: int = 4,
@@ -301,23 +321,13 @@ def notes_to_drum_grid(
         num_bars = max(1, int((max_time + 3.9) // 4))
 
     total_steps = num_bars * 4 * steps_per_beat
-
-    # Group notes by pitch
-    pitch_notes = {}
-    for note in notes:
-        pitch = note.get('pitch', 36)
-        if pitch not in pitch_notes:
-            pitch_notes[pitch] = []
-        pitch_notes[pitch].append(note)
-
-    # Standard drum order for display
-    display_order = ['HC', 'HO', 'RD', 'CR', 'SN', 'CL', 'RM', 'KK', 'HT', 'MT', 'LT', 'FT']
-    pitch_order = [DRUM_LABELS.get(label, 0) for label in display_order]
+    bar_width = 4 * steps_per_beat
+    pitch_notes = _group_by_pitch(notes, 36)
 
     # Build grid lines
     lines = []
 
-    for pitch in sorted(pitch_notes.keys(), key=lambda p: pitch_order.index(p) if p in pitch_order else 99):
+    for pitch in sorted(pitch_notes, key=lambda p: _DRUM_DISPLAY_RANK.get(p, 99)):
         label = PREFERRED_LABELS.get(pitch, f'{pitch:02d}')
 
         # Initialize row
@@ -334,23 +344,9 @@ def notes_to_drum_grid(
                 else:
                     row[step] = '.'
 
-        # Format with bar separators
-        parts = [label, '|']
-        bar_width = 4 * steps_per_beat
-        for i, char in enumerate(row):
-            parts.append(char)
-            if (i + 1) % bar_width == 0:
-                parts.append('|')
-        lines.append("".join(parts))
-
-    # Add beat markers
-    beat_line = "  |"
-    for bar in range(num_bars):
-        for beat in range(1, 5):
-            beat_line += str(beat)
-            beat_line += ' ' * (steps_per_beat - 1)
-        beat_line += '|'
-    lines.append(beat_line)
+        lines.append(_format_row(label, row, bar_width))
+
+    lines.append(_beat_line("  ", num_bars, steps_per_beat))
 
     return '\n'.join(lines)
 
@@ -380,57 +376,33 @@ def notes_to_melodic_grid(
         num_bars = max(1, int((max_time + 3.9) // 4))
 
     total_steps = num_bars * 4 * steps_per_beat
-
-    # Group notes by pitch
-    pitch_notes = {}
-    for note in notes:
-        pitch = note.get('pitch', 60)
-        if pitch not in pitch_notes:
-            pitch_notes[pitch] = []
-        pitch_notes[pitch].append(note)
+    bar_width = 4 * steps_per_beat
+    pitch_notes = _group_by_pitch(notes, 60)
 
     # Build grid lines (highest pitch first)
     lines = []
-    note_names = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
 
-    for pitch in sorted(pitch_notes.keys(), reverse=True):
+    for pitch in sorted(pitch_notes, reverse=True):
         # Convert pitch to note name
-        octave = (pitch // 12) - 1
-        note_idx = pitch % 12
-        note_name = note_names[note_idx]
-        label = f"{note_name}{octave}".ljust(3)
+        label = f"{_MELODIC_NAMES[pitch % 12]}{pitch // 12 - 1}".ljust(3)
 
         # Initialize row
         row = ['-'] * total_steps
 
         for note in pitch_notes[pitch]:
-            start_step = int(note.get('start_time', 0) * steps_per_beat)
+            start_step = max(0, int(note.get('start_time', 0) * steps_per_beat))
             dur_steps = max(1, int(note.get('duration', 0.25) * steps_per_beat))
             vel = note.get('velocity', 100)
 
-            # Fill in the note
+            # Fill in the note, clipped to the grid
             symbol = 'O' if vel > 110 else ('.' if vel < 70 else 'o')
-            for i in range(dur_steps):
-                if start_step + i < total_steps:
-                    row[start_step + i] = symbol
-
-        # Format with bar separators
-        parts = [label, '|']
-        bar_width = 4 * steps_per_beat
-        for i, char in enumerate(row):
-            parts.append(char)
-            if (i + 1) % bar_width == 0:
-                parts.append('|')
-        lines.append("".join(parts))
-
-    # Add beat markers
-    beat_line = "   |"
-    for bar in range(num_bars):
-        for beat in range(1, 5):
-            beat_line += str(beat)
-            beat_line += ' ' * (steps_per_beat - 1)
-        beat_line += '|'
-    lines.append(beat_line)
+            end_step = min(start_step + dur_steps, total_steps)
+            if start_step < end_step:
+                row[start_step:end_step] = symbol * (end_step - start_step)
+
+        lines.append(_format_row(label, row, bar_width))
+
+    lines.append(_beat_line("   ", num_bars, steps_per_beat))
 
     return '\n'.join(lines)
 
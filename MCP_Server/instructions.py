@@ -21,6 +21,7 @@ These combine multiple operations into one call (3-5x fewer round-trips). Prefer
 - apply_effect_chain — load multiple effects sequentially
 - setup_send_return — return track + effect + send level mapping
 - get_full_session_state — session + all tracks + returns + scenes in one query
+- batch_execute — run a list of {tool, args} calls in one request (in order by default)
 - save_effect_chain / load_effect_chain — template system. Caveat: load restores devices only; parameters require a separate restore step.
 
 ## Track Indexing
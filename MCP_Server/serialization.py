@@ -0,0 +1,54 @@
+"""JSON encoding helpers for AbletonBridge MCP server.
+
+Uses ``orjson`` when it is installed (``pip install ableton-bridge[speed]``)
+and falls back to the stdlib ``json`` module otherwise. ``dumps`` output is
+always a ``str`` because MCP tool results are text; ``dumpb`` returns UTF-8
+``bytes`` for files and sockets.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj) -> str:
+        """Serialize *obj* to a compact JSON string."""
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTS).decode("utf-8")
+        except TypeError:
+            # orjson rejects a few inputs json accepts (e.g. ints > 64 bit)
+            return json.dumps(obj)
+
+    def dumpb(obj) -> bytes:
+        """Serialize *obj* to compact UTF-8 JSON bytes."""
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTS)
+        except TypeError:
+            return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(data):
+        """Parse JSON from ``bytes`` or ``str``."""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Ints > 64 bit and NaN/Infinity (emitted by the Remote Script's
+            # json.dumps) are only understood by the stdlib parser
+            return json.loads(data)
+else:
+    def dumps(obj) -> str:
+        """Serialize *obj* to a JSON string."""
+        return json.dumps(obj)
+
+    def dumpb(obj) -> bytes:
+        """Serialize *obj* to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(data):
+        """Parse JSON from ``bytes`` or ``str``."""
+        return json.loads(data)
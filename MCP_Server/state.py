@@ -8,26 +8,80 @@ Variable names have **no** underscore prefix -- they are accessed as e.g.
 ``state.ableton_connection``, ``state.snapshot_store``, etc.
 """
 
+import itertools
 import os
 import socket
 import threading
+import weakref
 from collections import deque
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 # ---------------------------------------------------------------------------
 # Connection state
 # ---------------------------------------------------------------------------
 ableton_connection: Optional[Any] = None  # AbletonConnection | None
 m4l_connection: Optional[Any] = None      # M4LConnection | None
+ableton_verified_at: float = 0.0          # monotonic time of last probe or completed command
+ABLETON_LIVENESS_TTL: float = 1.0         # skip the socket probe if verified this recently
 
 # ---------------------------------------------------------------------------
 # Feature stores (in-memory, lost on restart)
 # ---------------------------------------------------------------------------
-snapshot_store: Dict[str, Dict[str, Any]] = {}
-macro_store: Dict[str, Dict[str, Any]] = {}
-param_map_store: Dict[str, Dict[str, Any]] = {}
-effect_chain_store: Dict[str, Dict[str, Any]] = {}
+
+# (parameter_index, original_name, friendly_name, category or None)
+ParamMapping = Tuple[Any, Optional[str], Optional[str], Optional[str]]
+
+
+class ParamMapRecord:
+    """A stored parameter map; slotted since agents create many per session."""
+    __slots__ = ("id", "track_index", "device_index", "device_name",
+                 "device_class", "mappings", "created_ns")
+
+    def __init__(self, id: str, track_index: int, device_index: int, device_name: str,
+                 device_class: str, mappings: Tuple[ParamMapping, ...], created_ns: int):
+        self.id = id
+        self.track_index = track_index
+        self.device_index = device_index
+        self.device_name = device_name
+        self.device_class = device_class
+        self.mappings = mappings
+        self.created_ns = created_ns
+
+    def to_dict(self) -> Dict[str, Any]:
+        mappings = []
+        for parameter_index, original_name, friendly_name, category in self.mappings:
+            m = {"parameter_index": parameter_index, "original_name": original_name,
+                 "friendly_name": friendly_name}
+            if category is not None:
+                m["category"] = category
+            mappings.append(m)
+        return {
+            "id": self.id,
+            "track_index": self.track_index,
+            "device_index": self.device_index,
+            "device_name": self.device_name,
+            "device_class": self.device_class,
+            "mappings": mappings,
+            "created_ns": self.created_ns,
+        }
+
+
+snapshot_store: Dict[str, Dict[str, Any]] = {}       # copy-on-write, writers hold store_lock
+macro_store: Dict[str, Dict[str, Any]] = {}          # guarded by macro_lock
+param_map_store: Dict[str, ParamMapRecord] = {}       # copy-on-write, see param_map_lock
+effect_chain_store: Dict[str, Dict[str, Any]] = {}   # copy-on-write, writers hold effect_chain_lock
+# One lock per store, so snapshot captures never wait on macro or chain writes
 store_lock: threading.Lock = threading.Lock()
+macro_lock: threading.Lock = threading.Lock()
+effect_chain_lock: threading.Lock = threading.Lock()
+# Writers to param_map_store take this lock and swap in a new dict; readers
+# grab the current reference and never block on each other or on store_lock.
+param_map_lock: threading.Lock = threading.Lock()
+# Parameter-map IDs: 8 hex digits from a counter seeded randomly per process
+param_map_ids: Iterator[int] = itertools.count(int.from_bytes(os.urandom(4), "big"))
+# content hash -> shared parameter list (deduplicates repeated device captures)
+snapshot_param_pool: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+snapshot_param_pool_lock: threading.Lock = threading.Lock()
 
 # ---------------------------------------------------------------------------
 # Dashboard / telemetry state
@@ -49,6 +103,20 @@ browser_cache_timestamp: float = 0.0
 browser_cache_lock: threading.Lock = threading.Lock()
 browser_cache_populating: bool = False                   # prevents duplicate scans
 device_uri_map: Dict[str, str] = {}                      # lowercase name -> URI
+device_uri_scan_memo: Dict[str, str] = {}                # fallback scan results ("" = miss); reset with device_uri_map
+browser_search_columns: Dict[int, tuple] = {}            # id(item list) -> (list, search names); reset with device_uri_map
+
+# ---------------------------------------------------------------------------
+# Read-only query cache (see MCP_Server.cache.queries)
+# ---------------------------------------------------------------------------
+query_cache: Dict[tuple, tuple] = {}                     # (command, params) -> (monotonic ts, json)
+query_cache_lock: threading.Lock = threading.Lock()
+live_state_epoch: int = 0                                # bumped by every non-read command
+# Last observed song.tracks length as (count, live_state_epoch, monotonic ts);
+# used to reject out-of-range track indices before a round trip.
+track_count_cache: Optional[tuple] = None
+track_count_lock: threading.Lock = threading.Lock()
+TRACK_COUNT_TTL: float = 2.0                             # bounds drift from tracks added in Live itself
 
 # ---------------------------------------------------------------------------
 # Events
@@ -1,9 +1,10 @@
 """Shared tool infrastructure: decorators, helpers, error formatting."""
 import asyncio
 import functools
-import json
 import logging
 
+from MCP_Server.serialization import dumps
+
 logger = logging.getLogger("AbletonBridge")
 
 # Limits concurrent tool executions that use the Ableton TCP connection.
@@ -21,6 +22,8 @@ def _tool_handler(error_prefix: str):
 
     Runs the synchronous tool function in a thread pool via asyncio.to_thread()
     so it doesn't block the FastMCP async event loop during TCP/UDP I/O.
+    Coroutine tool functions are awaited directly; they are expected to push
+    their own blocking I/O off the loop (e.g. via send_command_async).
 
     An asyncio.Semaphore gates entry so that only one tool occupies the thread
     pool (and the shared TCP socket) at a time. An outer timeout ensures a
@@ -34,14 +37,17 @@ def _tool_handler(error_prefix: str):
     Exception -> tool_error("Error {prefix}: ...")
     """
     def decorator(func):
+        is_async = asyncio.iscoroutinefunction(func)
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             try:
                 async with _ableton_semaphore:
-                    result = await asyncio.wait_for(
-                        asyncio.to_thread(func, *args, **kwargs),
-                        timeout=_TOOL_TIMEOUT_SECONDS,
-                    )
+                    if is_async:
+                        call = func(*args, **kwargs)
+                    else:
+                        call = asyncio.to_thread(func, *args, **kwargs)
+                    result = await asyncio.wait_for(call, timeout=_TOOL_TIMEOUT_SECONDS)
                 if isinstance(result, str):
                     stripped = result.strip()
                     if stripped.startswith(("{", "[")):
@@ -70,17 +76,27 @@ def _m4l_result(result: dict) -> dict:
     raise Exception(f"M4L bridge error: {msg}")
 
 
+# Envelope prefixes for the common message-only responses: only the message
+# itself goes through the encoder, spliced between a constant prefix and "}"
+_SUCCESS_PREFIX = '{"status":"ok","message":'
+_ERROR_PREFIX = '{"status":"error","message":'
+
+
 def tool_success(message: str, data: dict = None) -> str:
     """Create a standardized success response."""
+    if not data and type(message) is str:
+        return _SUCCESS_PREFIX + dumps(message) + "}"
     result = {"status": "ok", "message": message}
     if data:
         result["data"] = data
-    return json.dumps(result)
+    return dumps(result)
 
 
 def tool_error(message: str) -> str:
     """Create a standardized error response."""
-    return json.dumps({"status": "error", "message": message})
+    if type(message) is str:
+        return _ERROR_PREFIX + dumps(message) + "}"
+    return dumps({"status": "error", "message": message})
 
 
 def _report_progress(ctx, current: float, total: float, message: str = None):
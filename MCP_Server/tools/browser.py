@@ -5,7 +5,9 @@ from MCP_Server.tools._base import _tool_handler, _m4l_result
 from MCP_Server.connections.ableton import get_ableton_connection
 from MCP_Server.connections.m4l import get_m4l_connection
 from MCP_Server.validation import _validate_index, _validate_range
-from MCP_Server.cache.browser import resolve_device_uri, resolve_sample_uri, get_browser_cache, populate_browser_cache
+from MCP_Server.cache.browser import (
+    resolve_device_uri, resolve_sample_uri, get_browser_cache, populate_browser_cache, search_names,
+)
 from MCP_Server.constants import CATEGORY_DISPLAY
 import MCP_Server.state as state
 
@@ -131,22 +133,22 @@ def register_tools(mcp):
         - query: Search string to find items (searches by name)
         - category: Limit search to category ('all', 'instruments', 'sounds', 'drums', 'audio_effects', 'midi_effects', 'max_for_live', 'plugins', 'clips', 'samples', 'packs', 'user_library')
         """
-        cache = get_browser_cache()
-        if not cache:
-            return "Browser cache is empty. Make sure Ableton is running and try again."
-
         query_lower = query.lower()
 
-        # Use category index for filtered search (smaller list to scan)
+        # Use category index for filtered search (smaller list to scan); both
+        # views are read under one lock so they come from the same cache
         filter_display = CATEGORY_DISPLAY.get(category) if category != "all" else None
         with state.browser_cache_lock:
+            cache = state.browser_cache_flat
             search_list = state.browser_cache_by_category.get(filter_display, cache) if filter_display else cache
+        if not cache:
+            return "Browser cache is empty. Make sure Ableton is running and try again."
 
-        results = []
-        for item in search_list:
-            # Substring match using pre-lowercased search_name
-            if query_lower in item.get("search_name", item.get("name", "").lower()):
-                results.append(item)
+        # Substring match over the pre-lowercased name column
+        results = [
+            item for item, search_name in zip(search_list, search_names(search_list))
+            if query_lower in search_name
+        ]
 
         if not results:
             return f"No results found for '{query}' in category '{category}'"
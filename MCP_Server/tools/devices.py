@@ -408,6 +408,8 @@ def _m4l_batch_set_params(m4l, track_index, device_index, parameters):
     ok = 0
     failed = 0
     errors: List[str] = []
+    # Small delay to let Ableton breathe when setting many params
+    pace = len(parameters) > 6
     for p in parameters:
         try:
             result = m4l.send_command("set_hidden_param", {
@@ -424,8 +426,7 @@ def _m4l_batch_set_params(m4l, track_index, device_index, parameters):
         except Exception as e:
             failed += 1
             errors.append(f"[{p['index']}]: {str(e)}")
-        # Small delay to let Ableton breathe when setting many params
-        if len(parameters) > 6:
+        if pace:
             time.sleep(0.05)
     return {
         "params_set": ok,
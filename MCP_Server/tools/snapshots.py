@@ -1,8 +1,11 @@
 """Snapshot, macro, and parameter-map tool handlers for AbletonBridge."""
+import hashlib
 import json
+import sys
 import time
 import uuid
 import logging
+from collections import defaultdict
 from typing import Dict, Any, List
 from mcp.server.fastmcp import Context
 from MCP_Server.tools._base import _tool_handler, _m4l_result
@@ -15,6 +18,86 @@ import MCP_Server.state as state
 logger = logging.getLogger("AbletonBridge")
 
 
+class _ParamList(list):
+    """Parameter list that can live in the weak-valued snapshot_param_pool."""
+    __slots__ = ("__weakref__",)
+
+
+def _intern_parameters(params: list) -> list:
+    """Return a shared list for *params*, deduplicated by content hash.
+
+    Capturing the same device repeatedly (generate_preset revert snapshots,
+    A/B workflows, many instances of one device) yields identical parameter
+    arrays. Identical arrays are stored once and shared between snapshots;
+    the pool holds them weakly, so deleting the last snapshot frees the list.
+    Interned lists are shared and must be treated as read-only.
+    """
+    if not params:
+        return params
+    digest = hashlib.blake2b(
+        json.dumps(params, sort_keys=True, separators=(",", ":")).encode(),
+        digest_size=16,
+    ).digest()
+    with state.snapshot_param_pool_lock:
+        shared = state.snapshot_param_pool.get(digest)
+        if shared is None:
+            shared = _ParamList(params)
+            state.snapshot_param_pool[digest] = shared
+    return shared
+
+
+def _store_snapshots(entries: dict) -> None:
+    """Publish *entries* into snapshot_store by swapping in an updated copy.
+
+    Readers take the current ``state.snapshot_store`` reference without a
+    lock, so the published dict is never mutated in place.
+    """
+    with state.store_lock:
+        store = dict(state.snapshot_store)
+        store.update(entries)
+        state.snapshot_store = store
+
+
+# Restores larger than this are diffed against the live device first; below
+# it one extra discover_params round trip costs about as much as it saves.
+_RESTORE_DIFF_MIN_PARAMS = 6
+_RESTORE_EPSILON = 1e-6
+
+
+def _changed_params(m4l, track_index: int, device_index: int, params_to_set: list) -> list:
+    """Drop parameters whose live value already matches the restore target.
+
+    Reads the device once with discover_params and keeps only the entries
+    that differ, so reverting an untouched device sends nothing. Falls back
+    to the full list if the live state cannot be read.
+    """
+    if len(params_to_set) <= _RESTORE_DIFF_MIN_PARAMS:
+        return params_to_set
+    try:
+        result = m4l.send_command("discover_params", {
+            "track_index": track_index,
+            "device_index": device_index
+        })
+    except Exception as e:
+        logger.debug("Live state read before restore failed: %s", e)
+        return params_to_set
+    if result.get("status") != "success":
+        return params_to_set
+
+    live = {p.get("index"): p.get("value") for p in result.get("result", {}).get("parameters", [])}
+    changed = []
+    for p in params_to_set:
+        current = live.get(p["index"])
+        if not isinstance(current, (int, float)) or abs(current - p["value"]) > _RESTORE_EPSILON:
+            changed.append(p)
+    return changed
+
+
+def _format_created(created_ns: int) -> str:
+    """Render a parameter map's creation time; stored as an int until shown."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created_ns / 1e9))
+
+
 def register_tools(mcp):
 
     # ==================================================================
@@ -67,11 +150,10 @@ def register_tools(mcp):
             "device_name": data.get("device_name", "Unknown"),
             "device_class": data.get("device_class", "Unknown"),
             "parameter_count": data.get("parameter_count", 0),
-            "parameters": data.get("parameters", [])
+            "parameters": _intern_parameters(data.get("parameters", []))
         }
 
-        with state.store_lock:
-            state.snapshot_store[snapshot_id] = snapshot
+        _store_snapshots({snapshot_id: snapshot})
 
         return (
             f"Snapshot saved: '{snapshot['name']}' (ID: {snapshot_id})\n"
@@ -102,10 +184,9 @@ def register_tools(mcp):
         Requires the AbletonBridge M4L device to be loaded on any track.
         """
         try:
-            with state.store_lock:
-                if snapshot_id not in state.snapshot_store:
-                    return f"Snapshot '{snapshot_id}' not found. Use list_snapshots() to see available snapshots."
-                snapshot = state.snapshot_store[snapshot_id]
+            snapshot = state.snapshot_store.get(snapshot_id)
+            if snapshot is None:
+                return f"Snapshot '{snapshot_id}' not found. Use list_snapshots() to see available snapshots."
 
             target_track = track_index if track_index >= 0 else snapshot["track_index"]
             target_device = device_index if device_index >= 0 else snapshot["device_index"]
@@ -116,14 +197,21 @@ def register_tools(mcp):
                 return "Snapshot contains no parameters to restore."
 
             m4l = get_m4l_connection()
-            data = _m4l_batch_set_params(m4l, target_track, target_device, params_to_set)
-            ok = data["params_set"]
-            failed = data["params_failed"]
-            return (
+            changed = _changed_params(m4l, target_track, target_device, params_to_set)
+            unchanged = len(params_to_set) - len(changed)
+            ok = failed = 0
+            if changed:
+                data = _m4l_batch_set_params(m4l, target_track, target_device, changed)
+                ok = data["params_set"]
+                failed = data["params_failed"]
+            output = (
                 f"Restored snapshot '{snapshot['name']}' (ID: {snapshot_id})\n"
                 f"Target: track {target_track}, device {target_device}\n"
-                f"Parameters restored: {ok}/{len(params_to_set)} ({failed} failed)"
+                f"Parameters restored: {ok}/{len(changed)} ({failed} failed)"
             )
+            if unchanged:
+                output += f"\nAlready matching (skipped): {unchanged}"
+            return output
         except ConnectionError as e:
             return f"M4L bridge not available: {e}"
         except Exception as e:
@@ -138,8 +226,7 @@ def register_tools(mcp):
         Shows snapshot IDs, names, device info, and timestamps.
         Use snapshot IDs with restore_device_snapshot() to recall states.
         """
-        with state.store_lock:
-            non_group = {k: v for k, v in state.snapshot_store.items() if v.get("type") != "group"}
+        non_group = {k: v for k, v in state.snapshot_store.items() if v.get("type") != "group"}
 
         if not non_group:
             return "No snapshots stored. Use snapshot_device_state() to capture a device state."
@@ -165,10 +252,14 @@ def register_tools(mcp):
         - snapshot_id: The ID of the snapshot to delete
         """
         with state.store_lock:
-            if snapshot_id not in state.snapshot_store:
-                return f"Snapshot '{snapshot_id}' not found."
-            name = state.snapshot_store[snapshot_id].get("name", snapshot_id)
-            del state.snapshot_store[snapshot_id]
+            snap = state.snapshot_store.get(snapshot_id)
+            if snap is not None:
+                store = dict(state.snapshot_store)
+                del store[snapshot_id]
+                state.snapshot_store = store
+        if snap is None:
+            return f"Snapshot '{snapshot_id}' not found."
+        name = snap.get("name", snapshot_id)
         return f"Deleted snapshot '{name}' (ID: {snapshot_id})."
 
     @mcp.tool()
@@ -179,10 +270,9 @@ def register_tools(mcp):
         Parameters:
         - snapshot_id: The ID of the snapshot to inspect
         """
-        with state.store_lock:
-            if snapshot_id not in state.snapshot_store:
-                return f"Snapshot '{snapshot_id}' not found."
-            snap = state.snapshot_store[snapshot_id]
+        snap = state.snapshot_store.get(snapshot_id)
+        if snap is None:
+            return f"Snapshot '{snapshot_id}' not found."
 
         output = (
             f"Snapshot: {snap.get('name', snapshot_id)} (ID: {snapshot_id})\n"
@@ -208,10 +298,14 @@ def register_tools(mcp):
         Clears all in-memory feature data. This cannot be undone.
         """
         with state.store_lock:
-            count = len(state.snapshot_store) + len(state.macro_store) + len(state.param_map_store)
-            state.snapshot_store.clear()
+            count = len(state.snapshot_store)
+            state.snapshot_store = {}
+        with state.macro_lock:
+            count += len(state.macro_store)
             state.macro_store.clear()
-            state.param_map_store.clear()
+        with state.param_map_lock:
+            count += len(state.param_map_store)
+            state.param_map_store = {}
         return f"Cleared all feature data: {count} items deleted."
 
     # ==================================================================
@@ -246,6 +340,7 @@ def register_tools(mcp):
         group_id = str(uuid.uuid4())[:8]
         timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         snapshot_ids = []
+        captured = {}
         device_count = 0
 
         for ti in track_indices:
@@ -263,35 +358,36 @@ def register_tools(mcp):
 
                 data = result.get("result", {})
                 snap_id = str(uuid.uuid4())[:8]
+                params = _intern_parameters(data.get("parameters", []))
 
-                with state.store_lock:
-                    state.snapshot_store[snap_id] = {
-                        "id": snap_id,
-                        "group_id": group_id,
-                        "name": f"{data.get('device_name', 'Unknown')}_t{ti}_d{di}",
-                        "timestamp": timestamp,
-                        "track_index": ti,
-                        "device_index": di,
-                        "device_name": data.get("device_name", "Unknown"),
-                        "device_class": data.get("device_class", "Unknown"),
-                        "parameter_count": data.get("parameter_count", 0),
-                        "parameters": data.get("parameters", [])
-                    }
+                captured[snap_id] = {
+                    "id": snap_id,
+                    "group_id": group_id,
+                    "name": f"{data.get('device_name', 'Unknown')}_t{ti}_d{di}",
+                    "timestamp": timestamp,
+                    "track_index": ti,
+                    "device_index": di,
+                    "device_name": data.get("device_name", "Unknown"),
+                    "device_class": data.get("device_class", "Unknown"),
+                    "parameter_count": data.get("parameter_count", 0),
+                    "parameters": params
+                }
                 snapshot_ids.append(snap_id)
                 device_count += 1
 
         group_name = snapshot_name or f"group_{group_id}"
 
-        with state.store_lock:
-            state.snapshot_store[f"group_{group_id}"] = {
-                "id": f"group_{group_id}",
-                "type": "group",
-                "name": group_name,
-                "timestamp": timestamp,
-                "track_indices": track_indices,
-                "snapshot_ids": snapshot_ids,
-                "device_count": device_count
-            }
+        captured[f"group_{group_id}"] = {
+            "id": f"group_{group_id}",
+            "type": "group",
+            "name": group_name,
+            "timestamp": timestamp,
+            "track_indices": track_indices,
+            "snapshot_ids": snapshot_ids,
+            "device_count": device_count
+        }
+        # Publish the whole group in one swap
+        _store_snapshots(captured)
 
         return (
             f"Group snapshot '{group_name}' saved (ID: group_{group_id})\n"
@@ -312,10 +408,9 @@ def register_tools(mcp):
 
         Requires the AbletonBridge M4L device to be loaded on any track.
         """
-        with state.store_lock:
-            if group_id not in state.snapshot_store:
-                return f"Group snapshot '{group_id}' not found."
-            group = state.snapshot_store[group_id]
+        group = state.snapshot_store.get(group_id)
+        if group is None:
+            return f"Group snapshot '{group_id}' not found."
 
         if group.get("type") != "group":
             return f"'{group_id}' is not a group snapshot. Use restore_device_snapshot() instead."
@@ -324,28 +419,36 @@ def register_tools(mcp):
         total_devices = 0
         total_params = 0
         total_failed = 0
+        total_unchanged = 0
 
         for snap_id in group.get("snapshot_ids", []):
-            with state.store_lock:
-                if snap_id not in state.snapshot_store:
-                    continue
-                snap = state.snapshot_store[snap_id]
+            snap = state.snapshot_store.get(snap_id)
+            if snap is None:
+                continue
 
             params_to_set = [{"index": p["index"], "value": p["value"]} for p in snap.get("parameters", [])]
 
             if not params_to_set:
                 continue
 
-            data = _m4l_batch_set_params(m4l, snap["track_index"], snap["device_index"], params_to_set)
+            changed = _changed_params(m4l, snap["track_index"], snap["device_index"], params_to_set)
+            total_unchanged += len(params_to_set) - len(changed)
+            total_devices += 1
+            if not changed:
+                continue
+
+            data = _m4l_batch_set_params(m4l, snap["track_index"], snap["device_index"], changed)
             total_params += data["params_set"]
             total_failed += data["params_failed"]
-            total_devices += 1
 
-        return (
+        output = (
             f"Restored group snapshot '{group['name']}'\n"
             f"Devices restored: {total_devices}\n"
             f"Parameters restored: {total_params} ({total_failed} failed)"
         )
+        if total_unchanged:
+            output += f"\nAlready matching (skipped): {total_unchanged}"
+        return output
 
     @mcp.tool()
     @_tool_handler("comparing snapshots")
@@ -358,13 +461,13 @@ def register_tools(mcp):
         - snapshot_a_id: First snapshot ID
         - snapshot_b_id: Second snapshot ID
         """
-        with state.store_lock:
-            if snapshot_a_id not in state.snapshot_store:
-                return f"Snapshot '{snapshot_a_id}' not found."
-            if snapshot_b_id not in state.snapshot_store:
-                return f"Snapshot '{snapshot_b_id}' not found."
-            snap_a = state.snapshot_store[snapshot_a_id]
-            snap_b = state.snapshot_store[snapshot_b_id]
+        store = state.snapshot_store
+        snap_a = store.get(snapshot_a_id)
+        snap_b = store.get(snapshot_b_id)
+        if snap_a is None:
+            return f"Snapshot '{snapshot_a_id}' not found."
+        if snap_b is None:
+            return f"Snapshot '{snapshot_b_id}' not found."
 
         a_by_index = {p["index"]: p for p in snap_a.get("parameters", [])}
         b_by_index = {p["index"]: p for p in snap_b.get("parameters", [])}
@@ -442,15 +545,18 @@ def register_tools(mcp):
 
         Requires the AbletonBridge M4L device to be loaded on any track.
         """
-        _validate_range(position, "position", 0.0, 1.0)
-
-        with state.store_lock:
-            if snapshot_a_id not in state.snapshot_store:
-                return f"Snapshot A '{snapshot_a_id}' not found."
-            if snapshot_b_id not in state.snapshot_store:
-                return f"Snapshot B '{snapshot_b_id}' not found."
-            snap_a = state.snapshot_store[snapshot_a_id]
-            snap_b = state.snapshot_store[snapshot_b_id]
+        # Inlined fast path: morphs run at control rate; the validator only
+        # runs (and raises) when the check fails.
+        if not (type(position) in (float, int) and 0.0 <= position <= 1.0):
+            _validate_range(position, "position", 0.0, 1.0)
+
+        store = state.snapshot_store
+        snap_a = store.get(snapshot_a_id)
+        snap_b = store.get(snapshot_b_id)
+        if snap_a is None:
+            return f"Snapshot A '{snapshot_a_id}' not found."
+        if snap_b is None:
+            return f"Snapshot B '{snapshot_b_id}' not found."
 
         target_track = track_index if track_index >= 0 else snap_a["track_index"]
         target_device = device_index if device_index >= 0 else snap_a["device_index"]
@@ -529,7 +635,7 @@ def register_tools(mcp):
                 raise ValueError(f"Mapping at index {i} missing keys: {', '.join(sorted(missing))}")
 
         macro_id = str(uuid.uuid4())[:8]
-        with state.store_lock:
+        with state.macro_lock:
             state.macro_store[macro_id] = {
                 "id": macro_id,
                 "name": name,
@@ -567,11 +673,15 @@ def register_tools(mcp):
 
         Requires the AbletonBridge M4L device to be loaded on any track.
         """
-        with state.store_lock:
-            if macro_id not in state.macro_store:
-                return f"Macro '{macro_id}' not found. Use list_macros() to see available macros."
+        # Inlined fast path: macros run at control rate; the validator only
+        # runs (and raises) when the check fails.
+        if not (type(value) in (float, int) and 0.0 <= value <= 1.0):
             _validate_range(value, "value", 0.0, 1.0)
-            macro = state.macro_store[macro_id]
+
+        with state.macro_lock:
+            macro = state.macro_store.get(macro_id)
+            if macro is None:
+                return f"Macro '{macro_id}' not found. Use list_macros() to see available macros."
             macro["current_value"] = value
 
         grouped: Dict[tuple, list] = {}
@@ -604,19 +714,20 @@ def register_tools(mcp):
 
         Shows macro IDs, names, number of linked parameters, and current values.
         """
-        with state.store_lock:
-            if not state.macro_store:
-                return "No macro controllers created. Use create_macro_controller() to create one."
+        with state.macro_lock:
+            macros = [(mid, dict(macro)) for mid, macro in state.macro_store.items()]
+        if not macros:
+            return "No macro controllers created. Use create_macro_controller() to create one."
 
-            output = f"Macro controllers ({len(state.macro_store)}):\n\n"
-            for mid, macro in state.macro_store.items():
-                output += (
-                    f"  ID: {mid}\n"
-                    f"  Name: {macro['name']}\n"
-                    f"  Linked params: {len(macro['mappings'])}\n"
-                    f"  Current value: {macro['current_value']:.2f}\n"
-                    f"  Created: {macro['created']}\n\n"
-                )
+        output = f"Macro controllers ({len(macros)}):\n\n"
+        for mid, macro in macros:
+            output += (
+                f"  ID: {mid}\n"
+                f"  Name: {macro['name']}\n"
+                f"  Linked params: {len(macro['mappings'])}\n"
+                f"  Current value: {macro['current_value']:.2f}\n"
+                f"  Created: {macro['created']}\n\n"
+            )
         return output
 
     @mcp.tool()
@@ -627,11 +738,11 @@ def register_tools(mcp):
         Parameters:
         - macro_id: The ID of the macro to delete
         """
-        with state.store_lock:
-            if macro_id not in state.macro_store:
-                return f"Macro '{macro_id}' not found."
-            name = state.macro_store[macro_id]["name"]
-            del state.macro_store[macro_id]
+        with state.macro_lock:
+            macro = state.macro_store.pop(macro_id, None)
+        if macro is None:
+            return f"Macro '{macro_id}' not found."
+        name = macro["name"]
         return f"Deleted macro controller '{name}' (ID: {macro_id})."
 
     # ==================================================================
@@ -686,18 +797,18 @@ def register_tools(mcp):
 
         # Auto-snapshot current state for revert
         snapshot_id = str(uuid.uuid4())[:8]
-        with state.store_lock:
-            state.snapshot_store[snapshot_id] = {
-                "id": snapshot_id,
-                "name": f"pre_preset_{device_name}_{snapshot_id}",
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "track_index": track_index,
-                "device_index": device_index,
-                "device_name": device_name,
-                "device_class": device_class,
-                "parameter_count": len(params),
-                "parameters": params
-            }
+        revert_params = _intern_parameters(params)
+        _store_snapshots({snapshot_id: {
+            "id": snapshot_id,
+            "name": f"pre_preset_{device_name}_{snapshot_id}",
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "track_index": track_index,
+            "device_index": device_index,
+            "device_name": device_name,
+            "device_class": device_class,
+            "parameter_count": len(params),
+            "parameters": revert_params
+        }})
 
         output = (
             f"PRESET GENERATION for: '{description}'\n"
@@ -758,6 +869,24 @@ def register_tools(mcp):
         _validate_index(device_index, "device_index")
         if not isinstance(friendly_names, list) or len(friendly_names) == 0:
             raise ValueError("friendly_names must be a non-empty list.")
+        # Single pass: validate, group by category for the report, and pack
+        # each mapping into a tuple with categories/parameter names interned
+        # (they repeat across maps for the same plugin).
+        categories: Dict[str, list] = defaultdict(list)
+        mappings = []
+        for i, fn in enumerate(friendly_names):
+            if not isinstance(fn, dict):
+                raise ValueError(f"Mapping at index {i} must be a dictionary.")
+            original_name = fn.get("original_name")
+            category = fn.get("category")
+            mapping = (
+                fn.get("parameter_index"),
+                sys.intern(original_name) if type(original_name) is str else original_name,
+                fn.get("friendly_name"),
+                sys.intern(category) if type(category) is str else category,
+            )
+            mappings.append(mapping)
+            categories["Uncategorized" if category is None else category].append(mapping)
 
         m4l = get_m4l_connection()
         result = m4l.send_command("discover_params", {
@@ -769,41 +898,32 @@ def register_tools(mcp):
         device_name = data.get("device_name", "Unknown")
         device_class = data.get("device_class", "Unknown")
 
-        map_id = str(uuid.uuid4())[:8]
-        with state.store_lock:
-            state.param_map_store[map_id] = {
-                "id": map_id,
-                "track_index": track_index,
-                "device_index": device_index,
-                "device_name": device_name,
-                "device_class": device_class,
-                "mappings": friendly_names,
-                "created": time.strftime("%Y-%m-%d %H:%M:%S")
-            }
+        map_id = f"{next(state.param_map_ids) & 0xFFFFFFFF:08x}"
+        pmap = state.ParamMapRecord(
+            map_id, track_index, device_index, device_name, device_class,
+            tuple(mappings), time.time_ns(),
+        )
+        with state.param_map_lock:
+            store = dict(state.param_map_store)
+            store[map_id] = pmap
+            state.param_map_store = store
 
-        output = (
+        parts = [
             f"Parameter map created for '{device_name}' (ID: {map_id})\n"
             f"Mapped parameters: {len(friendly_names)}\n\n"
-        )
-
-        categories: Dict[str, list] = {}
-        for fn in friendly_names:
-            cat = fn.get("category", "Uncategorized")
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(fn)
+        ]
 
         for cat, maps in categories.items():
-            output += f"  [{cat}]\n"
-            for m in maps:
-                output += (
-                    f"    [{m.get('parameter_index', '?')}] "
-                    f"'{m.get('original_name', '?')}' -> "
-                    f"'{m.get('friendly_name', '?')}'\n"
+            parts.append(f"  [{cat}]\n")
+            for parameter_index, original_name, friendly_name, _ in maps:
+                parts.append(
+                    f"    [{'?' if parameter_index is None else parameter_index}] "
+                    f"'{'?' if original_name is None else original_name}' -> "
+                    f"'{'?' if friendly_name is None else friendly_name}'\n"
                 )
-            output += "\n"
+            parts.append("\n")
 
-        return output
+        return "".join(parts)
 
     @mcp.tool()
     @_tool_handler("getting parameter map")
@@ -813,29 +933,29 @@ def register_tools(mcp):
         Parameters:
         - map_id: The ID of the parameter map to retrieve
         """
-        with state.store_lock:
-            if map_id not in state.param_map_store:
-                return f"Parameter map '{map_id}' not found."
-            return json.dumps(state.param_map_store[map_id])
+        pmap = state.param_map_store.get(map_id)
+        if pmap is None:
+            return f"Parameter map '{map_id}' not found."
+        return json.dumps({**pmap.to_dict(), "created": _format_created(pmap.created_ns)})
 
     @mcp.tool()
     @_tool_handler("listing parameter maps")
     def list_parameter_maps(ctx: Context) -> str:
         """List all stored parameter maps."""
-        with state.store_lock:
-            if not state.param_map_store:
-                return "No parameter maps stored. Use create_parameter_map() to create one."
-
-            output = f"Parameter maps ({len(state.param_map_store)}):\n\n"
-            for mid, pmap in state.param_map_store.items():
-                output += (
-                    f"  ID: {mid}\n"
-                    f"  Device: {pmap.get('device_name', '?')} ({pmap.get('device_class', '?')})\n"
-                    f"  Location: track {pmap.get('track_index', '?')}, device {pmap.get('device_index', '?')}\n"
-                    f"  Mapped params: {len(pmap.get('mappings', []))}\n"
-                    f"  Created: {pmap.get('created', '?')}\n\n"
-                )
-        return output
+        store = state.param_map_store
+        if not store:
+            return "No parameter maps stored. Use create_parameter_map() to create one."
+
+        parts = [f"Parameter maps ({len(store)}):\n\n"]
+        for mid, pmap in store.items():
+            parts.append(
+                f"  ID: {mid}\n"
+                f"  Device: {pmap.device_name} ({pmap.device_class})\n"
+                f"  Location: track {pmap.track_index}, device {pmap.device_index}\n"
+                f"  Mapped params: {len(pmap.mappings)}\n"
+                f"  Created: {_format_created(pmap.created_ns)}\n\n"
+            )
+        return "".join(parts)
 
     @mcp.tool()
     @_tool_handler("deleting parameter map")
@@ -845,9 +965,13 @@ def register_tools(mcp):
         Parameters:
         - map_id: The ID of the parameter map to delete
         """
-        with state.store_lock:
-            if map_id not in state.param_map_store:
-                return f"Parameter map '{map_id}' not found."
-            name = state.param_map_store[map_id].get("device_name", map_id)
-            del state.param_map_store[map_id]
+        with state.param_map_lock:
+            pmap = state.param_map_store.get(map_id)
+            if pmap is not None:
+                store = dict(state.param_map_store)
+                del store[map_id]
+                state.param_map_store = store
+        if pmap is None:
+            return f"Parameter map '{map_id}' not found."
+        name = pmap.device_name
         return f"Deleted parameter map for '{name}' (ID: {map_id})."
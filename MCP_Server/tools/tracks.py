@@ -1,45 +1,156 @@
 """Track management tool handlers for AbletonBridge."""
-import json
+from typing import Any, Dict, List
 from mcp.server.fastmcp import Context
 from MCP_Server.tools._base import _tool_handler, _m4l_result
 from MCP_Server.connections.ableton import get_ableton_connection
 from MCP_Server.connections.m4l import get_m4l_connection
-from MCP_Server.validation import _validate_index, _validate_index_allow_negative, _validate_range
+from MCP_Server.cache.queries import (
+    cached_query, cached_query_async, adjust_track_count, record_track_count, METER_QUERY_TTL,
+)
+from MCP_Server.serialization import dumps
+from MCP_Server.validation import (
+    _validate_index, _validate_index_allow_negative, _validate_range, _validate_track_index,
+    MAX_TRACK_OPS_PER_CALL,
+)
 import MCP_Server.state as state
 
+# apply_track_ops kinds -> extra keys each kind requires besides track_index
+_TRACK_OP_REQUIRED_KEYS = {
+    "set_name": ("name",),
+    "set_color": ("color_index",),
+    "arm": (),
+    "disarm": (),
+    "set_monitoring": ("state",),
+    "set_routing": (),
+}
+_ROUTING_KEYS = ("input_type", "input_channel", "output_type", "output_channel")
+_MONITORING_STATE_NAMES = ("IN", "AUTO", "OFF")
+
+
+# Tools that take only a track_index and forward it to one Remote Script
+# command: (tool name, command, error prefix, docstring, message builder,
+# change in track count).
+_SIMPLE_TRACK_TOOLS = (
+    ("delete_track", "delete_track", "deleting track",
+     """Delete a track from the session.
+
+        Parameters:
+        - track_index: The index of the track to delete
+        """,
+     lambda ti, r: f"Deleted track '{r.get('track_name', 'unknown')}' at index {ti}", -1),
+    ("duplicate_track", "duplicate_track", "duplicating track",
+     """Duplicate a track with all its devices and clips.
+
+        Parameters:
+        - track_index: The index of the track to duplicate
+        """,
+     lambda ti, r: (f"Duplicated track '{r.get('source_name', 'unknown')}' to new track "
+                    f"'{r.get('new_name', 'unknown')}' at index {r.get('new_index', 'unknown')}"), 1),
+    ("arm_track", "arm_track", "arming track",
+     """Arm a track for recording.
+
+        Parameters:
+        - track_index: The index of the track to arm
+        """,
+     lambda ti, r: f"Track {ti} armed", 0),
+    ("disarm_track", "disarm_track", "disarming track",
+     """Disarm a track (disable recording).
+
+        Parameters:
+        - track_index: The index of the track to disarm
+        """,
+     lambda ti, r: f"Track {ti} disarmed", 0),
+    ("freeze_track", "freeze_track", "freezing track",
+     """Freeze a track (render effects in place to reduce CPU load).
+
+        Parameters:
+        - track_index: The index of the track to freeze
+        """,
+     lambda ti, r: f"Track {ti} ({r.get('track_name', '?')}) frozen", 0),
+    ("unfreeze_track", "unfreeze_track", "unfreezing track",
+     """Unfreeze a track.
+
+        Parameters:
+        - track_index: The index of the track to unfreeze
+        """,
+     lambda ti, r: f"Track {ti} ({r.get('track_name', '?')}) unfrozen", 0),
+)
+
+
+def _make_simple_track_tool(name: str, command: str, doc: str, message, track_delta: int = 0):
+    """Build a tool function that sends *command* for one track_index."""
+    def tool(ctx: Context, track_index: int) -> str:
+        _validate_track_index(track_index)
+        ableton = get_ableton_connection()
+        result = ableton.send_command(command, {"track_index": track_index})
+        if track_delta:
+            adjust_track_count(track_delta)
+        return message(track_index, result)
+    tool.__name__ = tool.__qualname__ = name
+    tool.__doc__ = doc
+    return tool
+
+
+def _record_track_count(result, epoch: int) -> None:
+    if isinstance(result, dict) and isinstance(result.get("tracks"), list):
+        record_track_count(len(result["tracks"]), epoch)
+
+
+def _validate_track_ops(ops: list) -> None:
+    if not isinstance(ops, list) or len(ops) == 0:
+        raise ValueError("ops must be a non-empty list.")
+    if len(ops) > MAX_TRACK_OPS_PER_CALL:
+        raise ValueError(f"Too many ops ({len(ops)}). Maximum is {MAX_TRACK_OPS_PER_CALL} per call.")
+    for i, op in enumerate(ops):
+        if not isinstance(op, dict):
+            raise ValueError(f"Op at index {i} must be a dictionary.")
+        kind = op.get("kind")
+        if kind not in _TRACK_OP_REQUIRED_KEYS:
+            raise ValueError(
+                f"Op at index {i}: kind must be one of {', '.join(_TRACK_OP_REQUIRED_KEYS)}, got {kind!r}."
+            )
+        _validate_track_index(op.get("track_index"), f"ops[{i}].track_index")
+        missing = [k for k in _TRACK_OP_REQUIRED_KEYS[kind] if k not in op]
+        if missing:
+            raise ValueError(f"Op at index {i} ({kind}) is missing required keys: {', '.join(missing)}.")
+        if kind == "set_monitoring":
+            _validate_range(op["state"], f"ops[{i}].state", 0, 2)
+        elif kind == "set_routing" and not any(op.get(k) is not None for k in _ROUTING_KEYS):
+            raise ValueError(f"Op at index {i} (set_routing) must set at least one of: {', '.join(_ROUTING_KEYS)}.")
+
 
 def register_tools(mcp):
     """Register track management tools with the MCP server."""
 
+    for name, command, error_prefix, doc, message, track_delta in _SIMPLE_TRACK_TOOLS:
+        mcp.tool()(_tool_handler(error_prefix)(
+            _make_simple_track_tool(name, command, doc, message, track_delta)))
+
     @mcp.tool()
     @_tool_handler("getting track info")
-    def get_track_info(ctx: Context, track_index: int) -> str:
+    async def get_track_info(ctx: Context, track_index: int) -> str:
         """
         Get detailed information about a specific track in Ableton.
 
         Parameters:
         - track_index: The index of the track to get information about
         """
-        _validate_index(track_index, "track_index")
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_track_info", {"track_index": track_index})
-        return json.dumps(result)
+        _validate_track_index(track_index)
+        return await cached_query_async(get_ableton_connection, "get_track_info", {"track_index": track_index})
 
     @mcp.tool()
     @_tool_handler("getting all tracks info")
     def get_all_tracks_info(ctx: Context) -> str:
         """Get information about all tracks in the session at once (bulk query)."""
         ableton = get_ableton_connection()
-        result = ableton.send_command("get_all_tracks_info")
-        return json.dumps(result)
+        return cached_query(ableton, "get_all_tracks_info", on_fetch=_record_track_count)
 
     @mcp.tool()
     @_tool_handler("getting return tracks info")
     def get_return_tracks_info(ctx: Context) -> str:
         """Get detailed information about all return tracks (bulk query)."""
         ableton = get_ableton_connection()
-        result = ableton.send_command("get_return_tracks_info")
-        return json.dumps(result)
+        return cached_query(ableton, "get_return_tracks_info")
 
     @mcp.tool()
     @_tool_handler("creating MIDI track")
@@ -53,6 +164,7 @@ def register_tools(mcp):
         _validate_index_allow_negative(index, "index", min_value=-1)
         ableton = get_ableton_connection()
         result = ableton.send_command("create_midi_track", {"index": index})
+        adjust_track_count(1)
         return f"Created new MIDI track: {result.get('name', 'unknown')}"
 
     @mcp.tool()
@@ -67,36 +179,9 @@ def register_tools(mcp):
         _validate_index_allow_negative(index, "index", min_value=-1)
         ableton = get_ableton_connection()
         result = ableton.send_command("create_audio_track", {"index": index})
+        adjust_track_count(1)
         return f"Created new audio track: {result.get('name', 'unknown')}"
 
-    @mcp.tool()
-    @_tool_handler("deleting track")
-    def delete_track(ctx: Context, track_index: int) -> str:
-        """
-        Delete a track from the session.
-
-        Parameters:
-        - track_index: The index of the track to delete
-        """
-        _validate_index(track_index, "track_index")
-        ableton = get_ableton_connection()
-        result = ableton.send_command("delete_track", {"track_index": track_index})
-        return f"Deleted track '{result.get('track_name', 'unknown')}' at index {track_index}"
-
-    @mcp.tool()
-    @_tool_handler("duplicating track")
-    def duplicate_track(ctx: Context, track_index: int) -> str:
-        """
-        Duplicate a track with all its devices and clips.
-
-        Parameters:
-        - track_index: The index of the track to duplicate
-        """
-        _validate_index(track_index, "track_index")
-        ableton = get_ableton_connection()
-        result = ableton.send_command("duplicate_track", {"track_index": track_index})
-        return f"Duplicated track '{result.get('source_name', 'unknown')}' to new track '{result.get('new_name', 'unknown')}' at index {result.get('new_index', 'unknown')}"
-
     @mcp.tool()
     @_tool_handler("setting track name")
     def set_track_name(ctx: Context, track_index: int, name: str) -> str:
@@ -107,7 +192,7 @@ def register_tools(mcp):
         - track_index: The index of the track to rename
         - name: The new name for the track
         """
-        _validate_index(track_index, "track_index")
+        _validate_track_index(track_index)
         ableton = get_ableton_connection()
         result = ableton.send_command("set_track_name", {"track_index": track_index, "name": name})
         return f"Renamed track to: {result.get('name', name)}"
@@ -121,7 +206,7 @@ def register_tools(mcp):
         - track_index: The index of the track
         - color_index: The color index (0-69, Ableton's color palette)
         """
-        _validate_index(track_index, "track_index")
+        _validate_track_index(track_index)
         ableton = get_ableton_connection()
         result = ableton.send_command("set_track_color", {
             "track_index": track_index,
@@ -129,32 +214,6 @@ def register_tools(mcp):
         })
         return f"Track {track_index} color set to {color_index}"
 
-    @mcp.tool()
-    @_tool_handler("arming track")
-    def arm_track(ctx: Context, track_index: int) -> str:
-        """Arm a track for recording.
-
-        Parameters:
-        - track_index: The index of the track to arm
-        """
-        _validate_index(track_index, "track_index")
-        ableton = get_ableton_connection()
-        result = ableton.send_command("arm_track", {"track_index": track_index})
-        return f"Track {track_index} armed"
-
-    @mcp.tool()
-    @_tool_handler("disarming track")
-    def disarm_track(ctx: Context, track_index: int) -> str:
-        """Disarm a track (disable recording).
-
-        Parameters:
-        - track_index: The index of the track to disarm
-        """
-        _validate_index(track_index, "track_index")
-        ableton = get_ableton_connection()
-        result = ableton.send_command("disarm_track", {"track_index": track_index})
-        return f"Track {track_index} disarmed"
-
     @mcp.tool()
     @_tool_handler("grouping tracks")
     def group_tracks(ctx: Context, track_indices: list) -> str:
@@ -195,12 +254,11 @@ def register_tools(mcp):
     def get_return_tracks(ctx: Context) -> str:
         """Get information about all return tracks."""
         ableton = get_ableton_connection()
-        result = ableton.send_command("get_return_tracks")
-        return json.dumps(result)
+        return cached_query(ableton, "get_return_tracks")
 
     @mcp.tool()
     @_tool_handler("getting return track info")
-    def get_return_track_info(ctx: Context, return_track_index: int) -> str:
+    async def get_return_track_info(ctx: Context, return_track_index: int) -> str:
         """
         Get detailed information about a specific return track.
 
@@ -208,45 +266,16 @@ def register_tools(mcp):
         - return_track_index: The index of the return track (0 = A, 1 = B, etc.)
         """
         _validate_index(return_track_index, "return_track_index")
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_return_track_info", {
+        return await cached_query_async(get_ableton_connection, "get_return_track_info", {
             "return_track_index": return_track_index
         })
-        return json.dumps(result)
 
     @mcp.tool()
     @_tool_handler("getting master track info")
     def get_master_track_info(ctx: Context) -> str:
         """Get detailed information about the master track, including volume, panning, and devices."""
         ableton = get_ableton_connection()
-        result = ableton.send_command("get_master_track_info")
-        return json.dumps(result)
-
-    @mcp.tool()
-    @_tool_handler("freezing track")
-    def freeze_track(ctx: Context, track_index: int) -> str:
-        """Freeze a track (render effects in place to reduce CPU load).
-
-        Parameters:
-        - track_index: The index of the track to freeze
-        """
-        _validate_index(track_index, "track_index")
-        ableton = get_ableton_connection()
-        result = ableton.send_command("freeze_track", {"track_index": track_index})
-        return f"Track {track_index} ({result.get('track_name', '?')}) frozen"
-
-    @mcp.tool()
-    @_tool_handler("unfreezing track")
-    def unfreeze_track(ctx: Context, track_index: int) -> str:
-        """Unfreeze a track.
-
-        Parameters:
-        - track_index: The index of the track to unfreeze
-        """
-        _validate_index(track_index, "track_index")
-        ableton = get_ableton_connection()
-        result = ableton.send_command("unfreeze_track", {"track_index": track_index})
-        return f"Track {track_index} ({result.get('track_name', '?')}) unfrozen"
+        return cached_query(ableton, "get_master_track_info")
 
     @mcp.tool()
     @_tool_handler("setting track fold")
@@ -257,7 +286,7 @@ def register_tools(mcp):
         - track_index: The index of the group track
         - fold_state: True to collapse (fold), False to expand (unfold)
         """
-        _validate_index(track_index, "track_index")
+        _validate_track_index(track_index)
         ableton = get_ableton_connection()
         result = ableton.send_command("set_track_fold", {
             "track_index": track_index,
@@ -276,7 +305,7 @@ def register_tools(mcp):
         - track_index: The index of the track
         - collapsed: True to collapse, False to expand
         """
-        _validate_index(track_index, "track_index")
+        _validate_track_index(track_index)
         ableton = get_ableton_connection()
         result = ableton.send_command("set_track_collapse", {
             "track_index": track_index,
@@ -287,7 +316,7 @@ def register_tools(mcp):
 
     @mcp.tool()
     @_tool_handler("getting track routing")
-    def get_track_routing(ctx: Context, track_index: int) -> str:
+    async def get_track_routing(ctx: Context, track_index: int) -> str:
         """Get current input/output routing and available options for a track.
 
         Parameters:
@@ -297,12 +326,10 @@ def register_tools(mcp):
         of all available routing options. Useful for understanding and configuring
         side-chain routing, resampling, and multi-output setups.
         """
-        _validate_index(track_index, "track_index")
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_track_routing", {
+        _validate_track_index(track_index)
+        return await cached_query_async(get_ableton_connection, "get_track_routing", {
             "track_index": track_index,
         })
-        return json.dumps(result)
 
     @mcp.tool()
     @_tool_handler("setting track routing")
@@ -322,16 +349,12 @@ def register_tools(mcp):
         Useful for setting up side-chain compression, resampling, or routing to
         specific outputs.
         """
-        _validate_index(track_index, "track_index")
-        params = {"track_index": track_index}
-        if input_type is not None:
-            params["input_type"] = input_type
-        if input_channel is not None:
-            params["input_channel"] = input_channel
-        if output_type is not None:
-            params["output_type"] = output_type
-        if output_channel is not None:
-            params["output_channel"] = output_channel
+        _validate_track_index(track_index)
+        routing = {k: v for k, v in zip(_ROUTING_KEYS, (input_type, input_channel, output_type, output_channel))
+                   if v is not None}
+        if not routing:
+            return f"Track {track_index} routing unchanged (no parameters supplied)"
+        params = {"track_index": track_index, **routing}
         ableton = get_ableton_connection()
         result = ableton.send_command("set_track_routing", params)
         changes = [f"{k}={v}" for k, v in result.items() if k not in ("track_index", "track_name")]
@@ -349,15 +372,15 @@ def register_tools(mcp):
         Controls whether the track passes its input through to the output.
         AUTO is the default and monitors only when the track is armed for recording.
         """
-        _validate_index(track_index, "track_index")
+        _validate_track_index(track_index)
         _validate_range(state, "state", 0, 2)
-        state_names = {0: "IN", 1: "AUTO", 2: "OFF"}
         ableton = get_ableton_connection()
         result = ableton.send_command("set_track_monitoring", {
             "track_index": track_index,
             "state": state,
         })
-        state_name = state_names.get(result.get("monitoring_state", state), "unknown")
+        monitoring = result.get("monitoring_state", state)
+        state_name = _MONITORING_STATE_NAMES[int(monitoring)] if monitoring in (0, 1, 2) else "unknown"
         return f"Track {track_index} ('{result.get('track_name', '?')}') monitoring set to {state_name}"
 
     @mcp.tool()
@@ -373,11 +396,10 @@ def register_tools(mcp):
         """
         params = {}
         if track_index is not None:
-            _validate_index(track_index, "track_index")
+            _validate_track_index(track_index)
             params["track_index"] = track_index
         ableton = get_ableton_connection()
-        result = ableton.send_command("get_track_meters", params)
-        return json.dumps(result)
+        return cached_query(ableton, "get_track_meters", params, ttl=METER_QUERY_TTL)
 
     @mcp.tool()
     @_tool_handler("getting track data")
@@ -388,12 +410,12 @@ def register_tools(mcp):
         - track_index: The track index
         - key: The data key to retrieve
         """
-        _validate_index(track_index, "track_index")
+        _validate_track_index(track_index)
         ableton = get_ableton_connection()
         result = ableton.send_command("get_track_data", {
             "track_index": track_index, "key": key,
         })
-        return json.dumps(result)
+        return dumps(result)
 
     @mcp.tool()
     @_tool_handler("setting track data")
@@ -405,12 +427,12 @@ def register_tools(mcp):
         - key: The data key to store
         - value: The string value to store
         """
-        _validate_index(track_index, "track_index")
+        _validate_track_index(track_index)
         ableton = get_ableton_connection()
         result = ableton.send_command("set_track_data", {
             "track_index": track_index, "key": key, "value": value,
         })
-        return json.dumps(result)
+        return dumps(result)
 
     @mcp.tool()
     @_tool_handler("selecting track")
@@ -444,7 +466,7 @@ def register_tools(mcp):
         - track_index: The index of the track (0-based)
         - enabled: True to enable implicit arm, False to disable
         """
-        _validate_index(track_index, "track_index")
+        _validate_track_index(track_index)
         ableton = get_ableton_connection()
         ableton.send_command("set_implicit_arm", {
             "track_index": track_index,
@@ -453,5 +475,28 @@ def register_tools(mcp):
         state_str = "enabled" if enabled else "disabled"
         return f"Implicit arm {state_str} for track {track_index}"
 
+    @mcp.tool()
+    @_tool_handler("applying track operations")
+    def apply_track_ops(ctx: Context, ops: List[Dict[str, Any]]) -> str:
+        """Apply several track property changes in a single round trip.
+
+        All ops run inside one Live main-thread task, so renaming, coloring,
+        and arming ten tracks costs one command instead of thirty.
+
+        Parameters:
+        - ops: List of operations, each a dict with "kind", "track_index", and:
+            - set_name: name (str)
+            - set_color: color_index (0-69)
+            - arm / disarm: no extra keys
+            - set_monitoring: state (0=IN, 1=AUTO, 2=OFF)
+            - set_routing: any of input_type, input_channel, output_type, output_channel
+
+        Returns per-op results; a failing op does not stop the remaining ones.
+        """
+        _validate_track_ops(ops)
+        ableton = get_ableton_connection()
+        result = ableton.send_command("apply_track_ops", {"ops": ops})
+        return dumps(result)
+
     # NOTE: select_device_in_view, get_selected_parameter, select_instrument
     # are registered in tools/devices.py (their canonical home)
@@ -3,17 +3,23 @@
 These high-level tools orchestrate multiple Remote Script commands in a single
 MCP tool call, reducing round-trip overhead by 3-5x for common workflows.
 """
+import asyncio
+import concurrent.futures
 import json
 import logging
 import os
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from mcp.server.fastmcp import Context
-from MCP_Server.tools._base import _tool_handler, _m4l_result, _report_progress
+from MCP_Server.tools._base import _tool_handler, _m4l_result, _report_progress, tool_error
 from MCP_Server.connections.ableton import get_ableton_connection
 from MCP_Server.connections.m4l import get_m4l_connection
 from MCP_Server.cache.browser import resolve_device_uri
-from MCP_Server.validation import _validate_index, _validate_index_allow_negative, _validate_range, _validate_notes
+from MCP_Server.validation import (
+    _validate_index, _validate_index_allow_negative, _validate_range, _validate_notes,
+    MAX_BATCH_CALLS, MAX_BATCH_CONCURRENCY,
+)
 from MCP_Server.constants import CHAIN_TEMPLATES_PATH
+from MCP_Server.serialization import dumps
 import MCP_Server.state as state
 
 logger = logging.getLogger("AbletonBridge")
@@ -22,8 +28,7 @@ logger = logging.getLogger("AbletonBridge")
 def _persist_chain_templates():
     """Save effect chain templates to disk (plain JSON)."""
     try:
-        with state.store_lock:
-            data = dict(state.effect_chain_store)
+        data = state.effect_chain_store  # copy-on-write: never mutated in place
         os.makedirs(os.path.dirname(CHAIN_TEMPLATES_PATH), exist_ok=True)
         with open(CHAIN_TEMPLATES_PATH, "w") as f:
             json.dump(data, f, indent=2)
@@ -39,13 +44,148 @@ def load_chain_templates_from_disk():
     try:
         with open(CHAIN_TEMPLATES_PATH) as f:
             data = json.load(f)
-        with state.store_lock:
-            state.effect_chain_store.update(data)
+        with state.effect_chain_lock:
+            state.effect_chain_store = {**state.effect_chain_store, **data}
         logger.info("Loaded %d effect chain templates from disk", len(data))
     except Exception as e:
         logger.warning("Failed to load chain templates from disk: %s", e)
 
 
+# Upper bound on names resolved in parallel while the browser cache warms up
+_RESOLVE_WORKERS = 4
+
+
+def _note_columns(notes: list) -> Dict[str, list]:
+    """Turn validated note dicts into the parallel lists add_notes_to_clip_soa takes."""
+    columns = {
+        "pitch": [n["pitch"] for n in notes],
+        "start_time": [n["start_time"] for n in notes],
+        "duration": [n["duration"] for n in notes],
+        "velocity": [n["velocity"] for n in notes],
+    }
+    if any(n.get("mute") for n in notes):
+        columns["mute"] = [bool(n.get("mute", False)) for n in notes]
+    return columns
+
+
+def _is_unknown_command(error: Exception) -> bool:
+    """True if *error* is the Remote Script rejecting a command it does not have.
+
+    Scripts installed before a batch command existed answer "Unknown command",
+    so callers can fall back to the per-item commands every version knows.
+    """
+    return "Unknown command" in str(error)
+
+
+# Per-value mixer commands for Remote Scripts without set_mixer_batch:
+# track_type -> (index param, {setting key: command})
+_MIXER_COMMANDS = {
+    "track": ("track_index", {
+        "volume": "set_track_volume", "pan": "set_track_pan",
+        "mute": "set_track_mute", "solo": "set_track_solo",
+    }),
+    "return": ("return_track_index", {
+        "volume": "set_return_track_volume", "pan": "set_return_track_pan",
+        "mute": "set_return_track_mute", "solo": "set_return_track_solo",
+    }),
+    "master": (None, {"volume": "set_master_volume"}),
+}
+
+
+def _set_mixer_per_command(ableton, batch: list) -> Dict[str, Any]:
+    """Apply set_mixer_batch *batch* entries as one pipelined command per value.
+
+    Returns the same {applied, errors} shape as set_mixer_batch.
+    """
+    errors = []
+    sent = []
+    for setting in batch:
+        track_type = setting.get("track_type", "track")
+        index_key, commands = _MIXER_COMMANDS.get(track_type, _MIXER_COMMANDS["track"])
+        for key in ("volume", "pan", "mute", "solo"):
+            if key not in setting:
+                continue
+            if key not in commands:
+                errors.append({"index": setting["index"], "param": key,
+                               "error": f"Master track has no {key} control"})
+                continue
+            params = {key: setting[key]}
+            if index_key:
+                params[index_key] = setting["track_index"]
+            sent.append((setting["index"], key, commands[key], params))
+
+    results = ableton.send_commands_pipelined([(command, params) for _, _, command, params in sent])
+    applied = 0
+    for (label, key, _, _), r in zip(sent, results):
+        if isinstance(r, Exception):
+            errors.append({"index": label, "param": key, "error": str(r)})
+        else:
+            applied += 1
+    return {"applied": applied, "errors": errors}
+
+
+def _run_steps(ableton, steps: list) -> list:
+    """Send (command, params, critical) steps as one pipelined batch.
+
+    None entries are dropped, so optional steps can be written inline. The
+    first failed critical step is raised; other failures are logged and
+    left as Exceptions in the returned list (one entry per step sent).
+    """
+    steps = [step for step in steps if step is not None]
+    results = ableton.send_commands_pipelined([(command, params) for command, params, _ in steps])
+    for (command_type, _, critical), r in zip(steps, results):
+        if isinstance(r, Exception):
+            if critical:
+                raise r
+            logger.warning("%s failed: %s", command_type, r)
+    return results
+
+
+def _resolve_device_uris(names: list) -> list:
+    """resolve_device_uri for each name, resolving repeated names only once.
+
+    Until the browser cache is ready each unknown name can block for the
+    warmup timeout, so the names are resolved on a small thread pool to
+    overlap those waits instead of paying one per name.
+    """
+    unique = list(dict.fromkeys(names))
+    if len(unique) > 1 and not state.browser_cache_ready.is_set():
+        workers = min(_RESOLVE_WORKERS, len(unique))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            resolved = dict(zip(unique, pool.map(resolve_device_uri, unique)))
+    else:
+        resolved = {name: resolve_device_uri(name) for name in unique}
+    return [resolved[name] for name in names]
+
+
+def _validate_batch_calls(calls: list) -> None:
+    if not isinstance(calls, list) or len(calls) == 0:
+        raise ValueError("calls must be a non-empty list.")
+    if len(calls) > MAX_BATCH_CALLS:
+        raise ValueError(f"Too many calls ({len(calls)}). Maximum is {MAX_BATCH_CALLS} per batch.")
+    for i, call in enumerate(calls):
+        if not isinstance(call, dict):
+            raise ValueError(f"Call at index {i} must be a dictionary.")
+        tool = call.get("tool")
+        if not isinstance(tool, str) or not tool:
+            raise ValueError(f"Call at index {i} is missing a tool name.")
+        if tool == "batch_execute":
+            raise ValueError(f"Call at index {i}: batch_execute cannot be nested.")
+        args = call.get("args")
+        if args is not None and not isinstance(args, dict):
+            raise ValueError(f"Call at index {i}: args must be a dictionary.")
+
+
+def _parse_tool_result(raw: Any) -> Any:
+    """Decode a tool's JSON string result; leave anything else as-is."""
+    if isinstance(raw, str) and raw.lstrip().startswith(("{", "[")):
+        try:
+            return json.loads(raw)
+        except ValueError:
+            pass
+    return raw
+
+
 def register_tools(mcp):
     """Register compound workflow tools with the MCP server."""
 
@@ -78,36 +218,18 @@ def register_tools(mcp):
         result = ableton.send_command("create_midi_track", {"index": index})
         track_idx = result.get("index", 0)
 
-        # Step 2: Resolve and load the instrument
-        _report_progress(ctx, 2, total_steps, "Loading instrument")
+        # Steps 2-4 only need track_idx, so they go out as one pipelined batch
+        _report_progress(ctx, 2, total_steps, "Loading instrument and setting track properties")
         uri = resolve_device_uri(instrument_name)
-        try:
-            ableton.send_command("load_instrument_or_effect", {
-                "track_index": track_idx, "uri": uri
-            })
-        except Exception as e:
-            logger.warning("Failed to load instrument '%s': %s", instrument_name, e)
-
-        # Step 3: Set track name
-        _report_progress(ctx, 3, total_steps, "Setting track name")
         name = track_name or instrument_name
-        try:
-            ableton.send_command("set_track_name", {
-                "track_index": track_idx, "name": name
-            })
-        except Exception as e:
-            logger.debug("set_track_name failed: %s", e)
-
-        # Step 4: Set track color (if specified)
-        if color_index >= 0:
-            try:
-                ableton.send_command("set_track_color", {
-                    "track_index": track_idx, "color_index": color_index
-                })
-            except Exception as e:
-                logger.debug("set_track_color failed: %s", e)
-
-        return json.dumps({
+        _run_steps(ableton, [
+            ("load_instrument_or_effect", {"track_index": track_idx, "uri": uri}, False),
+            ("set_track_name", {"track_index": track_idx, "name": name}, False),
+            ("set_track_color", {"track_index": track_idx, "color_index": color_index}, False)
+            if color_index >= 0 else None,
+        ])
+
+        return dumps({
             "track_index": track_idx,
             "instrument": instrument_name,
             "name": name,
@@ -150,25 +272,32 @@ def register_tools(mcp):
             "length": length,
         })
 
-        # Step 2: Add notes
-        ableton.send_command("add_notes_to_clip", {
-            "track_index": track_index,
-            "clip_index": clip_index,
-            "notes": notes,
-        })
-
-        # Step 3: Set name (if provided)
-        if clip_name:
-            try:
-                ableton.send_command("set_clip_name", {
+        # Steps 2-3: add notes and set name (if provided) in one pipelined batch.
+        # Notes go as columns so key names are not repeated once per note.
+        try:
+            _run_steps(ableton, [
+                ("add_notes_to_clip_soa", {
+                    "track_index": track_index,
+                    "clip_index": clip_index,
+                    "notes": _note_columns(notes),
+                }, True),
+                ("set_clip_name", {
                     "track_index": track_index,
                     "clip_index": clip_index,
                     "name": clip_name,
-                })
-            except Exception as e:
-                logger.debug("set_clip_name failed: %s", e)
+                }, False) if clip_name else None,
+            ])
+        except Exception as e:
+            if not _is_unknown_command(e):
+                raise
+            # Older Remote Scripts only take notes as row dicts
+            ableton.send_command("add_notes_to_clip", {
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "notes": notes,
+            })
 
-        return json.dumps({
+        return dumps({
             "track_index": track_index,
             "clip_index": clip_index,
             "length": length,
@@ -203,46 +332,27 @@ def register_tools(mcp):
         result = ableton.send_command("create_return_track")
         return_idx = result.get("index", 0)
 
-        # Step 2: Load effect
+        # Steps 2-3: load the effect and name the return track, pipelined
+        # together with the return-track query needed for the send index
         uri = resolve_device_uri(effect_name)
-        try:
-            ableton.send_command("load_instrument_or_effect", {
-                "track_index": return_idx,
-                "uri": uri,
-                "track_type": "return",
-            })
-        except Exception as e:
-            logger.warning("Failed to load effect '%s' on return: %s", effect_name, e)
-
-        # Step 3: Name the return track
         name = return_name or effect_name
-        try:
-            ableton.send_command("set_track_name", {
-                "track_index": return_idx,
-                "name": name,
-                "track_type": "return",
-            })
-        except Exception as e:
-            logger.debug("set_track_name (return) failed: %s", e)
+        results = _run_steps(ableton, [
+            ("load_instrument_or_effect", {"track_index": return_idx, "uri": uri, "track_type": "return"}, False),
+            ("set_track_name", {"track_index": return_idx, "name": name, "track_type": "return"}, False),
+            ("get_return_tracks", None, True) if source_tracks else None,
+        ])
 
         # Step 4: Set send levels on source tracks
         sends_set = 0
         if source_tracks:
-            # Need to figure out which send index this new return is
-            returns_info = ableton.send_command("get_return_tracks")
-            send_index = len(returns_info.get("tracks", [])) - 1  # new return is last
-            for track_idx in source_tracks:
-                try:
-                    ableton.send_command("set_track_send", {
-                        "track_index": track_idx,
-                        "send_index": send_index,
-                        "value": send_level,
-                    })
-                    sends_set += 1
-                except Exception as e:
-                    logger.warning("Failed to set send on track %d: %s", track_idx, e)
-
-        return json.dumps({
+            send_index = len(results[2].get("tracks", [])) - 1  # new return is last
+            send_results = _run_steps(ableton, [
+                ("set_track_send", {"track_index": track_idx, "send_index": send_index, "value": send_level}, False)
+                for track_idx in source_tracks
+            ])
+            sends_set = sum(1 for r in send_results if not isinstance(r, Exception))
+
+        return dumps({
             "return_index": return_idx,
             "effect": effect_name,
             "name": name,
@@ -259,17 +369,22 @@ def register_tools(mcp):
         """
         ableton = get_ableton_connection()
 
-        session = ableton.send_command("get_session_info")
-        tracks = ableton.send_command("get_all_tracks_info")
-        returns = ableton.send_command("get_return_tracks")
-        scenes = ableton.send_command("get_scenes")
-
-        return json.dumps({
-            "session": session,
-            "tracks": tracks,
-            "return_tracks": returns,
-            "scenes": scenes,
-        })
+        # Independent reads: one pipelined write, four responses in order.
+        # The results are only forwarded, so splice their wire bytes together
+        # rather than decoding and re-encoding the whole session.
+        results = ableton.send_commands_pipelined([
+            ("get_session_info", None),
+            ("get_all_tracks_info", None),
+            ("get_return_tracks", None),
+            ("get_scenes", None),
+        ], raw=True)
+        for r in results:
+            if isinstance(r, Exception):
+                raise r
+
+        return (
+            b'{"session":%b,"tracks":%b,"return_tracks":%b,"scenes":%b}' % tuple(results)
+        ).decode("utf-8")
 
     @mcp.tool()
     @_tool_handler("applying effect chain")
@@ -295,21 +410,22 @@ def register_tools(mcp):
         failed = []
         total = len(effects)
 
-        for i, effect_name in enumerate(effects):
-            _report_progress(ctx, i + 1, total, f"Loading {effect_name}")
-            uri = resolve_device_uri(effect_name)
-            try:
-                ableton.send_command("load_instrument_or_effect", {
-                    "track_index": track_index,
-                    "uri": uri,
-                    "track_type": track_type,
-                })
+        # The Remote Script applies pipelined loads in order, so the chain
+        # order on the track still matches *effects*
+        _report_progress(ctx, 0, total, f"Loading {total} effects")
+        results = ableton.send_commands_pipelined([
+            ("load_instrument_or_effect", {"track_index": track_index, "uri": uri, "track_type": track_type})
+            for uri in _resolve_device_uris(effects)
+        ])
+        for effect_name, r in zip(effects, results):
+            if isinstance(r, Exception):
+                failed.append({"effect": effect_name, "error": str(r)})
+                logger.warning("Failed to load effect '%s': %s", effect_name, r)
+            else:
                 loaded.append(effect_name)
-            except Exception as e:
-                failed.append({"effect": effect_name, "error": str(e)})
-                logger.warning("Failed to load effect '%s': %s", effect_name, e)
+        _report_progress(ctx, total, total, "Effects loaded")
 
-        return json.dumps({
+        return dumps({
             "track_index": track_index,
             "loaded": loaded,
             "failed": failed,
@@ -324,7 +440,8 @@ def register_tools(mcp):
         """Set mixer parameters for multiple tracks at once.
 
         Each setting is a dict with track_index and optional volume, pan, mute, solo.
-        Saves N round trips vs. calling individual set_track_* tools.
+        All settings are applied by one Remote Script command, or by one
+        pipelined command per value on scripts that predate it.
 
         Parameters:
         - settings: List of dicts, each with:
@@ -338,80 +455,30 @@ def register_tools(mcp):
         if not isinstance(settings, list) or len(settings) == 0:
             raise ValueError("settings must be a non-empty list")
 
-        ableton = get_ableton_connection()
-        applied = 0
+        # Malformed entries are reported here; the rest go to Live as one
+        # set_mixer_batch command, labelled with their position in *settings*
         errors = []
-        total = len(settings)
-
+        batch = []
         for i, setting in enumerate(settings):
-            _report_progress(ctx, i + 1, total, f"Setting mixer {i + 1}/{total}")
             if not isinstance(setting, dict) or "track_index" not in setting:
                 errors.append({"index": i, "error": "missing track_index"})
                 continue
+            batch.append({**setting, "index": i})
 
-            track_idx = setting["track_index"]
-            track_type = setting.get("track_type", "track")
-
-            if "volume" in setting:
-                try:
-                    cmd = {"set_track_volume": "track", "set_return_track_volume": "return", "set_master_volume": "master"}
-                    if track_type == "master":
-                        ableton.send_command("set_master_volume", {"volume": setting["volume"]})
-                    elif track_type == "return":
-                        ableton.send_command("set_return_track_volume", {
-                            "track_index": track_idx, "volume": setting["volume"]
-                        })
-                    else:
-                        ableton.send_command("set_track_volume", {
-                            "track_index": track_idx, "volume": setting["volume"]
-                        })
-                    applied += 1
-                except Exception as e:
-                    errors.append({"index": i, "param": "volume", "error": str(e)})
-
-            if "pan" in setting:
-                try:
-                    if track_type == "return":
-                        ableton.send_command("set_return_track_pan", {
-                            "track_index": track_idx, "pan": setting["pan"]
-                        })
-                    else:
-                        ableton.send_command("set_track_pan", {
-                            "track_index": track_idx, "pan": setting["pan"]
-                        })
-                    applied += 1
-                except Exception as e:
-                    errors.append({"index": i, "param": "pan", "error": str(e)})
-
-            if "mute" in setting:
-                try:
-                    if track_type == "return":
-                        ableton.send_command("set_return_track_mute", {
-                            "track_index": track_idx, "mute": setting["mute"]
-                        })
-                    else:
-                        ableton.send_command("set_track_mute", {
-                            "track_index": track_idx, "mute": setting["mute"]
-                        })
-                    applied += 1
-                except Exception as e:
-                    errors.append({"index": i, "param": "mute", "error": str(e)})
-
-            if "solo" in setting:
-                try:
-                    if track_type == "return":
-                        ableton.send_command("set_return_track_solo", {
-                            "track_index": track_idx, "solo": setting["solo"]
-                        })
-                    else:
-                        ableton.send_command("set_track_solo", {
-                            "track_index": track_idx, "solo": setting["solo"]
-                        })
-                    applied += 1
-                except Exception as e:
-                    errors.append({"index": i, "param": "solo", "error": str(e)})
-
-        return json.dumps({
+        applied = 0
+        if batch:
+            ableton = get_ableton_connection()
+            try:
+                result = ableton.send_command("set_mixer_batch", {"settings": batch})
+            except Exception as e:
+                if not _is_unknown_command(e):
+                    raise
+                result = _set_mixer_per_command(ableton, batch)
+            applied = result.get("applied", 0)
+            errors.extend(result.get("errors", []))
+            errors.sort(key=lambda e: e.get("index", 0))
+
+        return dumps({
             "settings_processed": len(settings),
             "params_applied": applied,
             "errors": errors,
@@ -449,26 +516,43 @@ def register_tools(mcp):
             track_info = ableton.send_command("get_track_info", {"track_index": track_index})
 
         devices = track_info.get("devices", [])
-        chain_data = []
-
-        for i, dev in enumerate(devices):
-            dev_info = {
-                "name": dev.get("name", ""),
-                "class_name": dev.get("class_name", ""),
-                "index": i,
-            }
-            # Try to get parameters for each device
+        parameters_by_index = {}
+        if devices:
             try:
-                params = ableton.send_command("get_device_parameters", {
+                batch = ableton.send_command("get_device_parameters_batch", {
                     "track_index": track_index,
-                    "device_index": i,
+                    "device_indices": list(range(len(devices))),
                     "track_type": track_type,
                 })
-                dev_info["parameters"] = params.get("parameters", [])
+                parameters_by_index = batch.get("parameters_by_index", {})
+                for i, err in batch.get("errors", {}).items():
+                    logger.debug("get_device_parameters_batch failed for device %s: %s", i, err)
             except Exception as e:
-                logger.debug("get_device_parameters failed for device %d: %s", i, e)
-                dev_info["parameters"] = []
-            chain_data.append(dev_info)
+                # Older Remote Scripts lack the batch command; read each device instead
+                logger.info("get_device_parameters_batch failed, reading devices one by one: %s", e)
+                results = ableton.send_commands_pipelined([
+                    ("get_device_parameters", {
+                        "track_index": track_index,
+                        "device_index": i,
+                        "track_type": track_type,
+                    })
+                    for i in range(len(devices))
+                ])
+                for i, r in enumerate(results):
+                    if isinstance(r, Exception):
+                        logger.debug("get_device_parameters failed for device %d: %s", i, r)
+                    else:
+                        parameters_by_index[str(i)] = r.get("parameters", [])
+
+        chain_data = [
+            {
+                "name": dev.get("name", ""),
+                "class_name": dev.get("class_name", ""),
+                "index": i,
+                "parameters": parameters_by_index.get(str(i), []),
+            }
+            for i, dev in enumerate(devices)
+        ]
 
         template = {
             "name": template_name.strip(),
@@ -476,11 +560,13 @@ def register_tools(mcp):
             "source_track_type": track_type,
         }
 
-        with state.store_lock:
-            state.effect_chain_store[template_name.strip()] = template
+        with state.effect_chain_lock:
+            store = dict(state.effect_chain_store)
+            store[template_name.strip()] = template
+            state.effect_chain_store = store
         _persist_chain_templates()
 
-        return json.dumps({
+        return dumps({
             "template_name": template_name.strip(),
             "device_count": len(chain_data),
         })
@@ -504,9 +590,7 @@ def register_tools(mcp):
         """
         _validate_index(track_index, "track_index")
 
-        with state.store_lock:
-            store = state.effect_chain_store
-            template = store.get(template_name)
+        template = state.effect_chain_store.get(template_name)
 
         if not template:
             raise ValueError(f"Effect chain template '{template_name}' not found")
@@ -515,20 +599,18 @@ def register_tools(mcp):
         loaded = []
         failed = []
 
-        for dev_data in template["devices"]:
-            dev_name = dev_data.get("name", "")
-            uri = resolve_device_uri(dev_name)
-            try:
-                ableton.send_command("load_instrument_or_effect", {
-                    "track_index": track_index,
-                    "uri": uri,
-                    "track_type": track_type,
-                })
+        names = [dev_data.get("name", "") for dev_data in template["devices"]]
+        results = ableton.send_commands_pipelined([
+            ("load_instrument_or_effect", {"track_index": track_index, "uri": uri, "track_type": track_type})
+            for uri in _resolve_device_uris(names)
+        ])
+        for dev_name, r in zip(names, results):
+            if isinstance(r, Exception):
+                failed.append({"device": dev_name, "error": str(r)})
+            else:
                 loaded.append(dev_name)
-            except Exception as e:
-                failed.append({"device": dev_name, "error": str(e)})
 
-        return json.dumps({
+        return dumps({
             "template_name": template_name,
             "loaded": loaded,
             "failed": failed,
@@ -624,29 +706,7 @@ def register_tools(mcp):
         result = ableton.send_command("create_midi_track", {"index": index})
         track_idx = result.get("index", 0)
 
-        # Step 2: Load Drum Rack
-        uri = resolve_device_uri("Drum Rack")
-        try:
-            ableton.send_command("load_instrument_or_effect", {
-                "track_index": track_idx, "uri": uri
-            })
-        except Exception as e:
-            logger.warning("Failed to load Drum Rack: %s", e)
-
-        # Step 3: Set track name
-        try:
-            ableton.send_command("set_track_name", {
-                "track_index": track_idx, "name": name
-            })
-        except Exception as e:
-            logger.debug("set_track_name failed: %s", e)
-
-        # Step 4: Create clip
-        ableton.send_command("create_clip", {
-            "track_index": track_idx, "clip_index": 0, "length": clip_length
-        })
-
-        # Step 5: Generate and add drum pattern notes
+        # Generate the drum pattern notes
         notes = []
         swing_offset = swing * 0.08
         for pitch, positions, vel_ratio, duration in patterns[pattern_style]:
@@ -663,11 +723,17 @@ def register_tools(mcp):
                     "velocity": max(1, min(127, int(velocity * vel_ratio))),
                 })
 
-        ableton.send_command("add_notes_to_clip", {
-            "track_index": track_idx, "clip_index": 0, "notes": notes
-        })
-
-        return json.dumps({
+        # Steps 2-5 only need track_idx: load Drum Rack, name the track,
+        # create the clip and add the notes in one pipelined batch
+        uri = resolve_device_uri("Drum Rack")
+        _run_steps(ableton, [
+            ("load_instrument_or_effect", {"track_index": track_idx, "uri": uri}, False),
+            ("set_track_name", {"track_index": track_idx, "name": name}, False),
+            ("create_clip", {"track_index": track_idx, "clip_index": 0, "length": clip_length}, True),
+            ("add_notes_to_clip", {"track_index": track_idx, "clip_index": 0, "notes": notes}, True),
+        ])
+
+        return dumps({
             "track_index": track_idx,
             "name": name,
             "pattern_style": pattern_style,
@@ -679,13 +745,64 @@ def register_tools(mcp):
     @_tool_handler("listing effect chain templates")
     def list_effect_chain_templates(ctx: Context) -> str:
         """List all saved effect chain templates."""
-        with state.store_lock:
-            store = state.effect_chain_store
-            templates = []
-            for name, template in store.items():
-                templates.append({
-                    "name": name,
-                    "device_count": len(template.get("devices", [])),
-                })
+        templates = [
+            {"name": name, "device_count": len(template.get("devices", []))}
+            for name, template in state.effect_chain_store.items()
+        ]
+
+        return dumps({"templates": templates})
+
+    @mcp.tool()
+    async def batch_execute(
+        ctx: Context,
+        calls: List[Dict[str, Any]],
+        max_concurrent: int = 1,
+        stop_on_error: bool = False,
+    ) -> str:
+        """Run several tool calls in one request.
 
-        return json.dumps({"templates": templates})
+        Each call goes through the named tool exactly as if it were called
+        directly, so it gets the same validation and error handling.
+
+        Parameters:
+        - calls: List of {"tool": name, "args": {...}} dicts (max 50)
+        - max_concurrent: How many calls may be in flight at once (1-8, default 1).
+          With 1, calls run strictly in list order; only raise it for calls
+          that do not depend on each other.
+        - stop_on_error: Skip calls not yet started once any call fails
+
+        Returns {"results": [...], "errors": [...]} with one result per call,
+        in list order.
+        """
+        try:
+            _validate_batch_calls(calls)
+            _validate_range(max_concurrent, "max_concurrent", 1, MAX_BATCH_CONCURRENCY)
+        except ValueError as e:
+            return tool_error(f"Invalid input: {e}")
+
+        gate = asyncio.Semaphore(int(max_concurrent))
+        failed = asyncio.Event()
+
+        async def run(index: int, call: dict) -> dict:
+            async with gate:
+                entry = {"index": index, "tool": call["tool"]}
+                if stop_on_error and failed.is_set():
+                    entry["status"] = "skipped"
+                    return entry
+                try:
+                    result = _parse_tool_result(await mcp._tool_manager.call_tool(
+                        call["tool"], call.get("args") or {}, context=ctx))
+                except Exception as e:
+                    result = {"status": "error", "message": str(e)}
+                is_error = isinstance(result, dict) and result.get("status") == "error"
+                if is_error:
+                    failed.set()
+                entry["status"] = "error" if is_error else "ok"
+                entry["result"] = result
+                return entry
+
+        results = await asyncio.gather(*(run(i, c) for i, c in enumerate(calls)))
+        return dumps({
+            "results": results,
+            "errors": [r for r in results if r["status"] == "error"],
+        })
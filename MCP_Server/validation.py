@@ -1,6 +1,7 @@
 """Input validation helpers for AbletonBridge MCP tools."""
 import math
 import logging
+from MCP_Server.cache.queries import known_track_count
 
 logger = logging.getLogger("AbletonBridge")
 
@@ -9,17 +10,39 @@ MAX_NOTES_PER_CALL = 10_000
 MAX_AUTOMATION_POINTS = 500
 MAX_BATCH_PARAMS = 200
 MAX_TRACKS_PER_BATCH = 50
+MAX_TRACK_OPS_PER_CALL = 200
+MAX_BATCH_CALLS = 50
+MAX_BATCH_CONCURRENCY = 8
 MAX_SEARCH_QUERY_LENGTH = 500
 
 
 def _validate_index(value: int, name: str) -> None:
+    if type(value) is int and value >= 0:
+        return  # fast path: plain in-range int
     if not isinstance(value, int) or isinstance(value, bool):
         raise ValueError(f"{name} must be an integer.")
     if value < 0:
         raise ValueError(f"{name} must be a non-negative integer, got {value}.")
 
 
+def _validate_track_index(value: int, name: str = "track_index", check_bounds: bool = True) -> None:
+    """Like _validate_index, but also reject indices past the last known track.
+
+    The bound comes from the cached track count and is skipped when no fresh
+    count is available or *check_bounds* is False.
+    """
+    _validate_index(value, name)
+    if check_bounds:
+        count = known_track_count()
+        if count is not None and value >= count:
+            raise ValueError(
+                f"{name} {value} is out of range (session has {count} tracks)."
+            )
+
+
 def _validate_index_allow_negative(value: int, name: str, min_value: int = -1) -> None:
+    if type(value) is int and value >= min_value:
+        return  # fast path: plain in-range int
     if not isinstance(value, int) or isinstance(value, bool):
         raise ValueError(f"{name} must be an integer.")
     if value < min_value:
@@ -27,12 +50,44 @@ def _validate_index_allow_negative(value: int, name: str, min_value: int = -1) -
 
 
 def _validate_range(value: float, name: str, min_val: float, max_val: float) -> None:
+    if type(value) in (float, int) and min_val <= value <= max_val:
+        return  # fast path: plain in-range number
     if not isinstance(value, (int, float)) or isinstance(value, bool):
         raise ValueError(f"{name} must be a number.")
     if value < min_val or value > max_val:
         raise ValueError(f"{name} must be between {min_val} and {max_val}, got {value}.")
 
 
+_NUMBER_TYPES = (int, float)
+_NOTE_KEYS = frozenset(("pitch", "start_time", "duration", "velocity"))
+
+
+def _notes_fast_ok(notes: list) -> bool:
+    """Single cheap pass accepting only plainly valid notes.
+
+    Uses exact type checks (which also exclude bool) and chained range
+    comparisons. Returns False on anything unusual, including valid
+    int/float subclasses, so the caller can fall back to the full checks.
+    """
+    number_types = _NUMBER_TYPES
+    for note in notes:
+        if type(note) is not dict:
+            return False
+        try:
+            pitch = note["pitch"]
+            velocity = note["velocity"]
+            duration = note["duration"]
+            start_time = note["start_time"]
+        except KeyError:
+            return False
+        if not (type(pitch) is int and 0 <= pitch <= 127
+                and type(velocity) in number_types and 0 <= velocity <= 127
+                and type(duration) in number_types and duration > 0
+                and type(start_time) in number_types and start_time >= 0):
+            return False
+    return True
+
+
 def _validate_notes(notes: list) -> None:
     if not isinstance(notes, list):
         raise ValueError("notes must be a list.")
@@ -40,23 +95,26 @@ def _validate_notes(notes: list) -> None:
         raise ValueError("notes list must not be empty.")
     if len(notes) > MAX_NOTES_PER_CALL:
         raise ValueError(f"Too many notes ({len(notes)}). Maximum is {MAX_NOTES_PER_CALL} per call.")
-    required_keys = {"pitch", "start_time", "duration", "velocity"}
+    if _notes_fast_ok(notes):
+        return
+    # Something is off: rescan with per-field checks to report the exact note
     for i, note in enumerate(notes):
         if not isinstance(note, dict):
             raise ValueError(f"Each note must be a dictionary (note at index {i} is not).")
-        missing = required_keys - note.keys()
-        if missing:
-            raise ValueError(f"Note at index {i} is missing required keys: {', '.join(sorted(missing))}.")
-        pitch = note["pitch"]
+        pitch = note.get("pitch")
+        velocity = note.get("velocity")
+        duration = note.get("duration")
+        start_time = note.get("start_time")
+        if pitch is None or velocity is None or duration is None or start_time is None:
+            missing = _NOTE_KEYS - note.keys()
+            if missing:
+                raise ValueError(f"Note at index {i} is missing required keys: {', '.join(sorted(missing))}.")
         if not isinstance(pitch, int) or isinstance(pitch, bool) or pitch < 0 or pitch > 127:
             raise ValueError(f"Note at index {i}: pitch must be an integer between 0 and 127, got {pitch}.")
-        velocity = note["velocity"]
         if not isinstance(velocity, (int, float)) or isinstance(velocity, bool) or velocity < 0 or velocity > 127:
             raise ValueError(f"Note at index {i}: velocity must be a number between 0 and 127, got {velocity}.")
-        duration = note["duration"]
         if not isinstance(duration, (int, float)) or isinstance(duration, bool) or duration <= 0:
             raise ValueError(f"Note at index {i}: duration must be a positive number, got {duration}.")
-        start_time = note["start_time"]
         if not isinstance(start_time, (int, float)) or isinstance(start_time, bool) or start_time < 0:
             raise ValueError(f"Note at index {i}: start_time must be a non-negative number, got {start_time}.")
 
@@ -68,7 +126,14 @@ def _validate_automation_points(points: list) -> None:
         raise ValueError("automation_points list must not be empty.")
     if len(points) > MAX_AUTOMATION_POINTS:
         raise ValueError(f"Too many automation points ({len(points)}). Maximum is {MAX_AUTOMATION_POINTS}.")
+    number_types = _NUMBER_TYPES
     for i, point in enumerate(points):
+        # Fast path: exact type checks also exclude bool
+        if type(point) is dict:
+            time_val = point.get("time")
+            if (type(time_val) in number_types and time_val >= 0
+                    and type(point.get("value")) in number_types):
+                continue
         if not isinstance(point, dict):
             raise ValueError(f"Each automation point must be a dictionary (point at index {i} is not).")
         if "time" not in point or "value" not in point:
@@ -91,26 +156,59 @@ def _perpendicular_distance(at, av, bt, bv, ct, cv):
     return abs(dv * (bt - at) - dt * (bv - av)) / math.sqrt(length_sq)
 
 
-def _rdp_recursive(norm_points, epsilon):
-    """Ramer-Douglas-Peucker on list of (norm_t, norm_v, original_dict)."""
-    if len(norm_points) <= 2:
-        return [p[2] for p in norm_points]
-    first = norm_points[0]
-    last = norm_points[-1]
+def _rdp_split(ts, vs, lo, hi):
+    """Find the point between lo and hi farthest from the lo->hi segment.
+
+    Returns ``(index, distance)``. Compares the unnormalized cross product,
+    which ranks points the same as the perpendicular distance, and divides
+    by the segment length once per range instead of once per point.
+    """
+    at, av, ct, cv = ts[lo], vs[lo], ts[hi], vs[hi]
+    dt = ct - at
+    dv = cv - av
+    length = math.hypot(dt, dv)
     max_dist = 0.0
-    max_idx = 1
-    for i in range(1, len(norm_points) - 1):
-        p = norm_points[i]
-        d = _perpendicular_distance(first[0], first[1], p[0], p[1], last[0], last[1])
-        if d > max_dist:
-            max_dist = d
+    max_idx = lo + 1
+    if length == 0.0:
+        for i in range(lo + 1, hi):
+            d = _perpendicular_distance(at, av, ts[i], vs[i], ct, cv)
+            if d > max_dist:
+                max_dist = d
+                max_idx = i
+        return max_idx, max_dist
+    max_cross = 0.0
+    for i in range(lo + 1, hi):
+        c = abs(dv * (ts[i] - at) - dt * (vs[i] - av))
+        if c > max_cross:
+            max_cross = c
             max_idx = i
-    if max_dist > epsilon:
-        left = _rdp_recursive(norm_points[:max_idx + 1], epsilon)
-        right = _rdp_recursive(norm_points[max_idx:], epsilon)
-        return left[:-1] + right
-    else:
-        return [first[2], last[2]]
+    return max_idx, max_cross / length
+
+
+def _rdp_thresholds(ts, vs):
+    """Largest epsilon at which RDP still keeps each point.
+
+    RDP keeps a point when its own split distance and those of every split
+    above it exceed epsilon, so one full pass recording the running minimum
+    answers all epsilons at once: RDP at ``eps`` keeps exactly the indices
+    whose threshold is greater than ``eps``. Endpoints are inf. Uses an
+    explicit stack of (lo, hi) ranges rather than recursion, so pathological
+    inputs cannot hit the recursion limit.
+    """
+    n = len(ts)
+    thresholds = [0.0] * n
+    thresholds[0] = thresholds[-1] = math.inf
+    stack = [(0, n - 1, math.inf)]
+    while stack:
+        lo, hi, ceiling = stack.pop()
+        if hi - lo < 2:
+            continue
+        max_idx, max_dist = _rdp_split(ts, vs, lo, hi)
+        threshold = min(max_dist, ceiling)
+        thresholds[max_idx] = threshold
+        stack.append((lo, max_idx, threshold))
+        stack.append((max_idx, hi, threshold))
+    return thresholds
 
 
 def _reduce_automation_points(points, max_points=20, time_epsilon=0.001,
@@ -120,7 +218,8 @@ def _reduce_automation_points(points, max_points=20, time_epsilon=0.001,
     Three-stage pipeline:
     1. Sort by time, deduplicate points at same/close times (keep last)
     2. Remove collinear points (redundant under linear interpolation)
-    3. If still over max_points, apply RDP simplification
+    3. If still over max_points, apply RDP simplification at the smallest
+       epsilon whose result fits
     """
     if len(points) <= 2:
         return points
@@ -141,45 +240,36 @@ def _reduce_automation_points(points, max_points=20, time_epsilon=0.001,
             logger.info("Automation point reduction: %d -> %d points", original_count, len(deduped))
         return deduped
 
-    # Normalization spans for stages 2 and 3
+    # Normalize once into flat coordinate lists for stages 2 and 3
     times = [p["time"] for p in deduped]
     values = [p["value"] for p in deduped]
     t_min, t_max = min(times), max(times)
     v_min, v_max = min(values), max(values)
     t_span = (t_max - t_min) or 1.0
     v_span = (v_max - v_min) or 1.0
+    nts = [(t - t_min) / t_span for t in times]
+    nvs = [(v - v_min) / v_span for v in values]
 
-    def nt(t):
-        return (t - t_min) / t_span
-
-    def nv(v):
-        return (v - v_min) / v_span
-
-    # Stage 2: remove collinear points
-    result = [deduped[0]]
+    # Stage 2: remove collinear points. Each point is tested against the
+    # last point kept, so this pass is inherently sequential.
+    kept = [0]
+    a = 0
     for i in range(1, len(deduped) - 1):
-        A = result[-1]
-        B = deduped[i]
-        C = deduped[i + 1]
-        dist = _perpendicular_distance(
-            nt(A["time"]), nv(A["value"]),
-            nt(B["time"]), nv(B["value"]),
-            nt(C["time"]), nv(C["value"]),
-        )
+        dist = _perpendicular_distance(nts[a], nvs[a], nts[i], nvs[i], nts[i + 1], nvs[i + 1])
         if dist > collinear_epsilon:
-            result.append(B)
-    result.append(deduped[-1])
+            kept.append(i)
+            a = i
+    kept.append(len(deduped) - 1)
+    result = [deduped[i] for i in kept]
 
-    # Stage 3: RDP cap if still over max_points
+    # Stage 3: RDP cap if still over max_points. A single threshold pass
+    # gives every point's survival epsilon; using the (max_points + 1)-th
+    # largest as epsilon keeps the most detail that fits, with no search.
     if len(result) > max_points:
-        norm_pts = [(nt(p["time"]), nv(p["value"]), p) for p in result]
-        eps = 0.005
-        for _ in range(20):
-            reduced = _rdp_recursive(norm_pts, eps)
-            if len(reduced) <= max_points:
-                result = reduced
-                break
-            eps *= 2.0
+        if max_points >= 2:
+            thresholds = _rdp_thresholds([nts[i] for i in kept], [nvs[i] for i in kept])
+            eps = sorted(thresholds, reverse=True)[max_points]
+            result = [pt for pt, th in zip(result, thresholds) if th > eps]
         else:
             # Fallback: uniform sampling
             indices = [0, len(result) - 1]
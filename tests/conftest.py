@@ -1,14 +1,31 @@
+import json
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import MCP_Server.state as state
 
 
+def _pipelined_via_send_command(conn):
+    """Mirror send_commands_pipelined on top of the mock's send_command."""
+    def run(commands, raw=False):
+        results = []
+        for command_type, params in commands:
+            try:
+                result = conn.send_command(command_type, params)
+                results.append(json.dumps(result).encode("utf-8") if raw else result)
+            except Exception as e:
+                results.append(e)
+        return results
+    return run
+
+
 @pytest.fixture
 def mock_ableton():
     """Mock AbletonConnection that returns success responses."""
     conn = MagicMock()
     conn.sock = MagicMock()
     conn.send_command = MagicMock(return_value={"status": "success"})
+    conn.send_command_async = AsyncMock(side_effect=lambda *a, **k: conn.send_command(*a, **k))
+    conn.send_commands_pipelined = MagicMock(side_effect=_pipelined_via_send_command(conn))
     return conn
 
 
@@ -19,26 +36,37 @@ def mock_m4l():
     conn.send_sock = MagicMock()
     conn.recv_sock = MagicMock()
     conn.send_command = MagicMock(return_value={"status": "success", "result": {}})
+    conn.send_command_async = AsyncMock(side_effect=lambda *a, **k: conn.send_command(*a, **k))
     conn.send_command_with_retry = MagicMock(return_value={"status": "success", "result": {}})
     return conn
 
 
+# Stores each test gets a fresh, empty dict for
+_ISOLATED_STORES = ("snapshot_store", "macro_store", "param_map_store", "effect_chain_store")
+
+
 @pytest.fixture(autouse=True)
 def reset_state():
-    """Reset global state between tests."""
+    """Reset global state between tests.
+
+    Stores are swapped for empty dicts rather than copied: whatever a test
+    writes lands in its own dict, and teardown just rebinds the originals.
+    """
     original_ableton = state.ableton_connection
     original_m4l = state.m4l_connection
-    original_snapshots = state.snapshot_store.copy()
-    original_macros = state.macro_store.copy()
-    original_param_maps = state.param_map_store.copy()
-    original_chains = state.effect_chain_store.copy()
+    original_stores = {name: getattr(state, name) for name in _ISOLATED_STORES}
+    for name in _ISOLATED_STORES:
+        setattr(state, name, {})
+    state.query_cache.clear()
+    state.ableton_verified_at = 0.0
+    state.track_count_cache = None
+    state.device_uri_scan_memo = {}
+    state.browser_search_columns = {}
     yield
     state.ableton_connection = original_ableton
     state.m4l_connection = original_m4l
-    state.snapshot_store = original_snapshots
-    state.macro_store = original_macros
-    state.param_map_store = original_param_maps
-    state.effect_chain_store = original_chains
+    for name, store in original_stores.items():
+        setattr(state, name, store)
 
 
 @pytest.fixture
@@ -3,15 +3,46 @@ import json
 import gzip
 import os
 import tempfile
+import time
 from unittest.mock import patch, MagicMock
 import MCP_Server.state as state
+from MCP_Server.constants import CATEGORY_PRIORITY
 from MCP_Server.cache.browser import (
     build_device_uri_map, save_browser_cache_to_disk,
     load_browser_cache_from_disk, resolve_device_uri,
-    get_browser_cache,
+    get_browser_cache, search_names, _install_browser_cache,
 )
 
 
+class TestSearchNames:
+    def test_column_built_once_per_list(self):
+        items = [{"name": "Operator", "search_name": "operator"}, {"name": "Drift"}]
+        names = search_names(items)
+        assert names == ["operator", "drift"]
+        assert search_names(items) is names
+
+    def test_new_list_gets_new_column(self):
+        first = [{"search_name": "operator"}]
+        search_names(first)
+        assert search_names([{"search_name": "drift"}]) == ["drift"]
+
+
+class TestInstallBrowserCache:
+    def test_replaces_all_fields_and_derived_state(self):
+        items = [{"name": "Drift", "search_name": "drift", "category": "Instruments"}]
+        state.device_uri_scan_memo = {"old": ""}
+        search_names(state.browser_cache_flat)
+        state.browser_cache_ready.clear()
+        _install_browser_cache(items, {"Instruments": items}, {"drift": "query:Drift"}, 123.0)
+        assert state.browser_cache_flat is items
+        assert state.browser_cache_by_category["Instruments"] is items
+        assert state.device_uri_map == {"drift": "query:Drift"}
+        assert state.browser_cache_timestamp == 123.0
+        assert state.device_uri_scan_memo == {}
+        assert state.browser_search_columns == {}
+        assert state.browser_cache_ready.is_set()
+
+
 class TestBuildDeviceUriMap:
     def test_basic_mapping(self):
         """Test that loadable items get mapped by lowercase name."""
@@ -40,6 +71,16 @@ class TestBuildDeviceUriMap:
         uri_map = build_device_uri_map(items)
         assert uri_map["reverb"] == "query:Instruments#Reverb"
 
+    def test_device_beats_category_and_first_wins_ties(self):
+        items = [
+            {"name": "Echo", "search_name": "echo", "uri": "a", "is_loadable": True, "category": "Instruments"},
+            {"name": "Echo", "search_name": "echo", "uri": "b", "is_loadable": True,
+             "category": "Audio Effects", "is_device": True},
+            {"name": "Echo", "search_name": "echo", "uri": "c", "is_loadable": True,
+             "category": "Audio Effects", "is_device": True},
+        ]
+        assert build_device_uri_map(items) == {"echo": "b"}
+
 
 class TestBrowserCacheDiskPersistence:
     def test_save_and_load_roundtrip(self):
@@ -49,16 +90,17 @@ class TestBrowserCacheDiskPersistence:
         ]
         with tempfile.TemporaryDirectory() as tmpdir:
             cache_path = os.path.join(tmpdir, "cache.json.gz")
-            with patch('MCP_Server.cache.browser.BROWSER_DISK_CACHE_PATH', cache_path):
+            with patch('MCP_Server.cache.browser.BROWSER_DISK_CACHE_PATH', cache_path), \
+                    patch('MCP_Server.cache.browser.BROWSER_DISK_CACHE_PATH_ZSTD', os.path.join(tmpdir, "cache.json.zst")):
                 with patch('MCP_Server.cache.browser.BROWSER_DISK_CACHE_PATH_LEGACY', cache_path + ".legacy"):
                     with patch('MCP_Server.cache.browser.BROWSER_DISK_CACHE_DIR', tmpdir):
                         # Set up state
                         state.browser_cache_flat = items
                         state.browser_cache_by_category = {"Instruments": items}
                         state.device_uri_map = {"testdevice": "query:test"}
-                        state.browser_cache_timestamp = __import__('time').time()
+                        state.browser_cache_timestamp = time.time()
                         save_browser_cache_to_disk()
-                        assert os.path.exists(cache_path)
+                        assert os.path.exists(cache_path) or os.path.exists(os.path.join(tmpdir, "cache.json.zst"))
 
                         # Clear state and reload
                         state.browser_cache_flat = []
@@ -68,6 +110,137 @@ class TestBrowserCacheDiskPersistence:
                         assert loaded is True
                         assert len(state.browser_cache_flat) == 1
                         assert state.browser_cache_flat[0]["name"] == "TestDevice"
+                        assert state.browser_cache_by_category == {"Instruments": state.browser_cache_flat}
+                        assert state.browser_cache_by_category["Instruments"][0] is state.browser_cache_flat[0]
+                        assert state.device_uri_map["testdevice"] == "query:test"
+
+
+class TestBrowserCacheDiskFormats:
+    _ITEMS = [{"name": "Operator", "uri": "query:Instruments#Operator", "is_loadable": True}]
+
+    def _paths(self, tmpdir):
+        return {
+            "BROWSER_DISK_CACHE_DIR": tmpdir,
+            "BROWSER_DISK_CACHE_PATH": os.path.join(tmpdir, "cache.json.gz"),
+            "BROWSER_DISK_CACHE_PATH_ZSTD": os.path.join(tmpdir, "cache.json.zst"),
+            "BROWSER_DISK_CACHE_PATH_LEGACY": os.path.join(tmpdir, "cache.json"),
+        }
+
+    def _payload(self):
+        return {
+            "version": 1, "timestamp": time.time(),
+            "flat": self._ITEMS, "by_category": {}, "device_uri_map": {},
+        }
+
+    def test_gzip_without_zstandard_replaces_legacy_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._paths(tmpdir)
+            with open(paths["BROWSER_DISK_CACHE_PATH_LEGACY"], "w") as f:
+                json.dump(self._payload(), f)
+            with patch.multiple('MCP_Server.cache.browser', zstandard=None, **paths):
+                state.browser_cache_flat = self._ITEMS
+                state.browser_cache_timestamp = time.time()
+                assert save_browser_cache_to_disk() is True
+            with gzip.open(paths["BROWSER_DISK_CACHE_PATH"], "rt") as f:
+                saved = json.load(f)
+            assert saved["flat"] == self._ITEMS
+            assert "by_category" not in saved
+            assert not os.path.exists(paths["BROWSER_DISK_CACHE_PATH_LEGACY"])
+
+    def test_legacy_uncompressed_file_still_loads(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._paths(tmpdir)
+            with open(paths["BROWSER_DISK_CACHE_PATH_LEGACY"], "w") as f:
+                json.dump(self._payload(), f)
+            with patch.multiple('MCP_Server.cache.browser', **paths):
+                state.browser_cache_flat = []
+                assert load_browser_cache_from_disk() is True
+            assert state.browser_cache_flat == self._ITEMS
+
+    def test_empty_categories_survive_roundtrip(self):
+        items = [{"name": "Drift", "uri": "query:Drift", "is_loadable": True, "category": "Instruments"}]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._paths(tmpdir)
+            with patch.multiple('MCP_Server.cache.browser', zstandard=None, **paths):
+                state.browser_cache_flat = items
+                state.browser_cache_by_category = {"Instruments": items, "Clips": []}
+                state.browser_cache_timestamp = time.time()
+                save_browser_cache_to_disk()
+                os.remove(paths["BROWSER_DISK_CACHE_PATH"] + ".pkl")
+                state.browser_cache_by_category = {}
+                assert load_browser_cache_from_disk() is True
+            assert list(state.browser_cache_by_category) == ["Instruments", "Clips"]
+            assert state.browser_cache_by_category["Instruments"] == items
+
+    def test_loaded_categories_are_interned(self):
+        items = [{"name": n, "uri": "query:" + n, "is_loadable": True, "category": "Audio Effects"}
+                 for n in ("Reverb", "Delay")]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._paths(tmpdir)
+            with patch.multiple('MCP_Server.cache.browser', zstandard=None, **paths):
+                state.browser_cache_flat = items
+                state.browser_cache_by_category = {"Audio Effects": items}
+                state.browser_cache_timestamp = time.time()
+                save_browser_cache_to_disk()
+                os.remove(paths["BROWSER_DISK_CACHE_PATH"] + ".pkl")
+                assert load_browser_cache_from_disk() is True
+        canonical = next(k for k in CATEGORY_PRIORITY if k == "Audio Effects")
+        assert all(item["category"] is canonical for item in state.browser_cache_flat)
+
+    def test_zstd_roundtrip(self):
+        pytest.importorskip("zstandard")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._paths(tmpdir)
+            with patch.multiple('MCP_Server.cache.browser', **paths):
+                state.browser_cache_flat = self._ITEMS
+                state.browser_cache_timestamp = time.time()
+                save_browser_cache_to_disk()
+                assert os.path.exists(paths["BROWSER_DISK_CACHE_PATH_ZSTD"])
+                os.remove(paths["BROWSER_DISK_CACHE_PATH_ZSTD"] + ".pkl")  # force the zstd decode
+                state.browser_cache_flat = []
+                assert load_browser_cache_from_disk() is True
+            assert state.browser_cache_flat == self._ITEMS
+
+    def test_snapshot_skips_decode(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._paths(tmpdir)
+            with patch.multiple('MCP_Server.cache.browser', zstandard=None, **paths):
+                state.browser_cache_flat = self._ITEMS
+                state.browser_cache_timestamp = time.time()
+                save_browser_cache_to_disk()
+                state.browser_cache_flat = []
+                with patch('MCP_Server.cache.browser.loads', side_effect=AssertionError("parsed")):
+                    assert load_browser_cache_from_disk() is True
+            assert state.browser_cache_flat == self._ITEMS
+
+    def test_uri_map_survives_decode_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._paths(tmpdir)
+            with patch.multiple('MCP_Server.cache.browser', zstandard=None, **paths):
+                state.browser_cache_flat = self._ITEMS
+                state.device_uri_map = {"operator": "query:Instruments#Operator"}
+                state.browser_cache_timestamp = time.time()
+                save_browser_cache_to_disk()
+                os.remove(paths["BROWSER_DISK_CACHE_PATH"] + ".pkl")
+                state.device_uri_map = {}
+                assert load_browser_cache_from_disk() is True
+            assert state.device_uri_map == {"operator": "query:Instruments#Operator"}
+
+    def test_stale_snapshot_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._paths(tmpdir)
+            with patch.multiple('MCP_Server.cache.browser', zstandard=None, **paths):
+                state.browser_cache_flat = self._ITEMS
+                state.browser_cache_timestamp = time.time()
+                save_browser_cache_to_disk()
+
+                # Another writer replaces the cache file; the pickle no longer matches
+                newer = dict(self._payload(), flat=[{"name": "Drift", "uri": "query:Drift", "is_loadable": True}])
+                with gzip.open(paths["BROWSER_DISK_CACHE_PATH"], "wt") as f:
+                    json.dump(newer, f)
+                state.browser_cache_flat = []
+                assert load_browser_cache_from_disk() is True
+            assert state.browser_cache_flat[0]["name"] == "Drift"
 
 
 class TestResolveDeviceUri:
@@ -78,6 +251,13 @@ class TestResolveDeviceUri:
         result = resolve_device_uri("query:Instruments#Wavetable")
         assert result == "query:Instruments#Wavetable"
 
+    @pytest.mark.parametrize("uri", ["vst3:FabFilter Pro-Q 3", "Plugins#Serum", "userlibrary:Presets/Pad.adv"])
+    def test_any_uri_shape_passes_through_without_lookup(self, uri):
+        """Any ':' or '#' marks a URI, not just known scheme prefixes."""
+        with patch.object(state.browser_cache_ready, "wait") as wait:
+            assert resolve_device_uri(uri) == uri
+        wait.assert_not_called()
+
     def test_name_resolution(self):
         """Test resolving a device name to URI."""
         state.device_uri_map = {"wavetable": "query:Instruments#Wavetable"}
@@ -85,6 +265,19 @@ class TestResolveDeviceUri:
         result = resolve_device_uri("Wavetable")
         assert result == "query:Instruments#Wavetable"
 
+    def test_name_without_spaces_resolves(self):
+        items = [
+            {"name": "Drum Rack", "search_name": "drum rack", "uri": "query:Drums#Drum Rack", "is_loadable": True},
+            {"name": "EQ Eight", "search_name": "eq eight", "uri": "query:AudioFx#EQ Eight", "is_loadable": True},
+            {"name": "EQEight", "search_name": "eqeight", "uri": "query:Plugins#EQEight", "is_loadable": True},
+        ]
+        state.device_uri_map = build_device_uri_map(items)
+        state.browser_cache_flat = []
+        state.browser_cache_ready.set()
+        assert resolve_device_uri("DrumRack") == "query:Drums#Drum Rack"
+        # A real name is never shadowed by another name's compact form
+        assert resolve_device_uri("EQEight") == "query:Plugins#EQEight"
+
     def test_unknown_name_returns_input(self):
         """Unknown name should return the input as-is."""
         state.device_uri_map = {}
@@ -92,3 +285,26 @@ class TestResolveDeviceUri:
         state.browser_cache_ready.set()
         result = resolve_device_uri("NonexistentDevice")
         assert result == "NonexistentDevice"
+
+    def test_scan_hit_is_memoized_until_refresh(self):
+        """A name found by the fallback scan should not be scanned for again."""
+        state.device_uri_map = {}
+        state.device_uri_scan_memo = {}
+        flat = [{"search_name": "glue compressor", "is_loadable": True, "uri": "query:Effects#Glue"}]
+        state.browser_cache_flat = flat
+        state.browser_cache_ready.set()
+        assert resolve_device_uri("Glue Compressor") == "query:Effects#Glue"
+
+        state.browser_cache_flat = []  # a second scan would now miss
+        assert resolve_device_uri("Glue Compressor") == "query:Effects#Glue"
+
+    def test_scan_miss_is_memoized(self):
+        state.device_uri_map = {}
+        state.device_uri_scan_memo = {}
+        state.browser_cache_flat = [{"search_name": "operator", "is_loadable": True, "uri": "query:Synths#Operator"}]
+        state.browser_cache_ready.set()
+        assert resolve_device_uri("Mystery Synth") == "Mystery Synth"
+
+        with patch.object(state.browser_cache_ready, "wait") as wait:
+            assert resolve_device_uri("mystery synth ") == "mystery synth "
+        wait.assert_not_called()
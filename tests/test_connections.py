@@ -3,27 +3,110 @@ import json
 import socket
 import time
 from unittest.mock import MagicMock, patch, PropertyMock, call
-from MCP_Server.connections.ableton import AbletonConnection, get_ableton_connection, NON_IDEMPOTENT_COMMANDS
-from MCP_Server.constants import TIER_0_COMMANDS, TIER_1_COMMANDS, TIER_2_COMMANDS
+from MCP_Server.connections.ableton import (
+    AbletonConnection, get_ableton_connection, invalidate_ableton_connection,
+)
+from MCP_Server.constants import (
+    TIER_0_COMMANDS, TIER_1_COMMANDS, TIER_2_COMMANDS, NON_IDEMPOTENT_COMMANDS,
+)
 import MCP_Server.state as state
 
 
+def _feed(sock, chunks):
+    """Make sock.recv_into deliver *chunks* one per call, like a real socket."""
+    chunks = iter(chunks)
+
+    def recv_into(view):
+        data = next(chunks)
+        view[:len(data)] = data
+        return len(data)
+    sock.recv_into.side_effect = recv_into
+
+
 class TestAbletonConnectionSendCommand:
     def test_successful_command(self):
         """Test basic send_command round-trip."""
         conn = AbletonConnection(host="localhost", port=9877)
         conn.sock = MagicMock()
-        conn._recv_buffer = ""
+        conn._recv_buffer = bytearray()
         # Mock receive_full_response
         with patch.object(conn, 'receive_full_response', return_value={"status": "success", "result": {"tempo": 120.0}}):
             result = conn.send_command("get_session_info")
             assert result["tempo"] == 120.0
 
+    @pytest.mark.asyncio
+    async def test_send_command_async_matches_sync(self):
+        conn = AbletonConnection(host="localhost", port=9877)
+        conn.sock = MagicMock()
+        conn._recv_buffer = bytearray()
+        with patch.object(conn, 'receive_full_response', return_value={"status": "success", "result": {"tempo": 120.0}}):
+            result = await conn.send_command_async("get_session_info")
+        assert result == {"tempo": 120.0}
+
+    def test_command_line_is_compact_ascii(self):
+        conn = AbletonConnection(host="localhost", port=9877)
+        conn.sock = MagicMock()
+        with patch.object(conn, 'receive_full_response', return_value={"status": "success", "result": {}}):
+            conn.send_command("set_track_name", {"track_index": 0, "name": "Caf\u00e9"})
+        sent = conn.sock.sendall.call_args[0][0]
+        assert sent.endswith(b"\n") and sent.count(b"\n") == 1
+        assert sent.isascii()
+        assert json.loads(sent) == {"type": "set_track_name", "params": {"track_index": 0, "name": "Caf\u00e9"}}
+
+    def test_pipelined_commands_share_one_write(self):
+        conn = AbletonConnection(host="localhost", port=9877)
+        conn.sock = MagicMock()
+        conn._recv_buffer = bytearray()
+        responses = [
+            {"status": "success", "result": {"loaded": True}},
+            {"status": "error", "message": "bad name"},
+            {"status": "success", "result": {"color_index": 5}},
+        ]
+        with patch.object(conn, 'receive_full_response', side_effect=responses), \
+                patch('MCP_Server.connections.ableton.time.sleep'):
+            results = conn.send_commands_pipelined([
+                ("load_instrument_or_effect", {"track_index": 0, "uri": "x"}),
+                ("set_track_name", {"track_index": 0, "name": ""}),
+                ("set_track_color", {"track_index": 0, "color_index": 5}),
+            ])
+        assert conn.sock.sendall.call_count == 1
+        lines = conn.sock.sendall.call_args[0][0].decode("utf-8").splitlines()
+        assert [json.loads(l)["type"] for l in lines] == [
+            "load_instrument_or_effect", "set_track_name", "set_track_color"]
+        assert results[0] == {"loaded": True}
+        assert isinstance(results[1], Exception)
+        assert results[2] == {"color_index": 5}
+
+    def test_pipelined_raw_results_are_wire_bytes(self):
+        conn = AbletonConnection(host="localhost", port=9877)
+        conn.sock = MagicMock()
+        _feed(conn.sock, [
+            json.dumps({"status": "success", "result": {"tempo": 120.0}}).encode("utf-8") + b"\n"
+            + json.dumps({"status": "error", "message": "no scenes"}).encode("utf-8") + b"\n"
+            + b'{"result": [1, 2], "status": "success"}\n',
+        ])
+        results = conn.send_commands_pipelined(
+            [("get_session_info", None), ("get_scenes", None), ("get_return_tracks", None)], raw=True)
+        assert results[0] == b'{"tempo": 120.0}'
+        assert isinstance(results[1], Exception)
+        assert json.loads(results[2]) == [1, 2]
+
+    def test_pipelined_transport_error_is_not_retried(self):
+        conn = AbletonConnection(host="localhost", port=9877)
+        conn.sock = MagicMock()
+        conn._recv_buffer = bytearray()
+        with patch.object(conn, 'receive_full_response', side_effect=socket.timeout("timeout")), \
+                patch.object(conn, 'disconnect') as disconnect:
+            with pytest.raises(Exception, match="Pipelined batch"):
+                conn.send_commands_pipelined([("set_track_name", {"track_index": 0, "name": "A"})])
+        assert conn.sock.sendall.call_count == 1
+        disconnect.assert_called_once()
+
     def test_non_idempotent_single_attempt(self):
         """Non-idempotent commands (create/delete) should only attempt once."""
         conn = AbletonConnection(host="localhost", port=9877)
         conn.sock = MagicMock()
-        conn._recv_buffer = ""
+        conn._recv_buffer = bytearray()
         with patch.object(conn, 'receive_full_response', side_effect=socket.timeout("timeout")):
             with patch.object(conn, 'disconnect'):
                 with pytest.raises(Exception):
@@ -35,7 +118,7 @@ class TestAbletonConnectionSendCommand:
         """Idempotent commands should retry once on socket error."""
         conn = AbletonConnection(host="localhost", port=9877)
         conn.sock = MagicMock()
-        conn._recv_buffer = ""
+        conn._recv_buffer = bytearray()
         call_count = [0]
         def side_effect(*args, **kwargs):
             call_count[0] += 1
@@ -52,14 +135,28 @@ class TestAbletonConnectionSendCommand:
         """TIER_0 commands should have no pre/post delays."""
         conn = AbletonConnection(host="localhost", port=9877)
         conn.sock = MagicMock()
-        conn._recv_buffer = ""
+        conn._recv_buffer = bytearray()
         with patch.object(conn, 'receive_full_response', return_value={"status": "success", "result": {}}):
             with patch('time.sleep') as mock_sleep:
                 conn.send_command("set_tempo", {"tempo": 120})
-                # TIER_0 should not call time.sleep for delays
-                for c in mock_sleep.call_args_list:
-                    # Any sleep call should not be the tier delay ones
-                    pass  # Just verify no Exception
+                conn.send_command("set_tempo", {"tempo": 121})
+        mock_sleep.assert_not_called()
+
+    def test_settle_time_only_slept_when_next_send_is_early(self):
+        conn = AbletonConnection(host="localhost", port=9877)
+        conn.sock = MagicMock()
+        with patch.object(conn, 'receive_full_response', return_value={"status": "success", "result": {}}), \
+                patch('MCP_Server.connections.ableton.time.sleep') as mock_sleep:
+            conn.send_command("add_notes_to_clip", {})
+            mock_sleep.assert_not_called()
+            conn.send_command("set_tempo", {"tempo": 120})
+            assert mock_sleep.call_count == 1
+            assert 0 < mock_sleep.call_args[0][0] <= 0.01
+
+            conn._next_send_at = time.monotonic() - 1.0  # caller was slower than the settle time
+            mock_sleep.reset_mock()
+            conn.send_command("set_tempo", {"tempo": 121})
+            mock_sleep.assert_not_called()
 
     def test_non_idempotent_commands_list(self):
         """Verify key commands are in non-idempotent set."""
@@ -71,9 +168,74 @@ class TestAbletonConnectionSendCommand:
 
     def test_tier_membership(self):
         """Verify tier sets are disjoint."""
-        assert len(TIER_0_COMMANDS & TIER_1_COMMANDS) == 0
-        assert len(TIER_1_COMMANDS & TIER_2_COMMANDS) == 0
-        assert len(TIER_0_COMMANDS & TIER_2_COMMANDS) == 0
+        assert TIER_0_COMMANDS.isdisjoint(TIER_1_COMMANDS)
+        assert TIER_1_COMMANDS.isdisjoint(TIER_2_COMMANDS)
+        assert TIER_0_COMMANDS.isdisjoint(TIER_2_COMMANDS)
+
+
+class TestReceiveFullResponse:
+    def _conn(self, chunks):
+        conn = AbletonConnection(host="localhost", port=9877)
+        sock = MagicMock()
+        _feed(sock, chunks)
+        return conn, sock
+
+    def test_response_split_across_chunks(self):
+        payload = json.dumps({"status": "success", "result": {"name": "Caf\u00e9"}}, ensure_ascii=False).encode("utf-8")
+        # Split inside the multi-byte character to make sure decoding waits for the full line
+        cut = payload.index("\u00e9".encode("utf-8")) + 1
+        conn, sock = self._conn([payload[:cut], payload[cut:] + b"\n"])
+        assert conn.receive_full_response(sock)["result"]["name"] == "Caf\u00e9"
+        assert conn._recv_buffer == b""
+
+    def test_two_responses_in_one_chunk(self):
+        conn, sock = self._conn([b'{"id": 1}\n\n{"id": 2}\n{"id"'])
+        assert conn.receive_full_response(sock) == {"id": 1}
+        assert conn.receive_full_response(sock) == {"id": 2}
+        assert sock.recv_into.call_count == 1
+        assert conn._recv_buffer == b'{"id"'
+
+    def test_reads_into_preallocated_chunk(self):
+        conn, sock = self._conn([b'{"id": 1}\n', b'{"id": 2}\n'])
+        conn.receive_full_response(sock)
+        conn.receive_full_response(sock)
+        first, second = (c[0][0] for c in sock.recv_into.call_args_list)
+        assert len(first) == 64 * 1024
+        assert first.obj is second.obj
+
+    def test_closed_connection_raises(self):
+        conn, sock = self._conn([b""])
+        with pytest.raises(Exception, match="Connection closed"):
+            conn.receive_full_response(sock)
+
+    def test_buffer_reused_after_failure(self):
+        conn = AbletonConnection(host="localhost", port=9877)
+        buf = conn._recv_buffer
+        buf.extend(b'{"partial"')
+        with patch.object(conn, "connect", return_value=False):
+            conn._reconnect()
+        assert conn._recv_buffer is buf
+        assert buf == b""
+
+
+class TestAbletonConnectionConnect:
+    def test_socket_tuned_before_connect(self):
+        conn = AbletonConnection(host="localhost", port=9877)
+        fake = MagicMock()
+        with patch('MCP_Server.connections.ableton.socket.socket', return_value=fake):
+            assert conn.connect()
+        fake.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        fake.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            fake.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 10)
+
+    def test_unsupported_option_does_not_block_connect(self):
+        conn = AbletonConnection(host="localhost", port=9877)
+        fake = MagicMock()
+        fake.setsockopt.side_effect = OSError("not supported")
+        with patch('MCP_Server.connections.ableton.socket.socket', return_value=fake):
+            assert conn.connect()
+        fake.connect.assert_called_once_with(("localhost", 9877))
 
 
 class TestGetAbletonConnection:
@@ -100,3 +262,43 @@ class TestGetAbletonConnection:
         with patch('MCP_Server.connections.ableton.AbletonConnection', return_value=new_conn):
             result = get_ableton_connection()
             assert new_conn.connect.called
+
+    def test_recently_verified_connection_skips_probe(self):
+        """A connection verified within the TTL is returned without a socket probe."""
+        mock_conn = MagicMock()
+        mock_conn.sock = MagicMock()
+        state.ableton_connection = mock_conn
+        state.ableton_verified_at = time.monotonic()
+        assert get_ableton_connection() is mock_conn
+        mock_conn.sock.getpeername.assert_not_called()
+
+    def test_invalidate_forces_reconnect(self):
+        mock_conn = MagicMock()
+        state.ableton_connection = mock_conn
+        state.ableton_verified_at = time.monotonic()
+        invalidate_ableton_connection()
+        assert state.ableton_connection is None
+        assert state.ableton_verified_at == 0.0
+        mock_conn.disconnect.assert_called_once()
+
+    def test_successful_command_refreshes_verification(self):
+        conn = AbletonConnection(host="localhost", port=9877)
+        conn.sock = MagicMock()
+        state.ableton_connection = conn
+        with patch.object(conn, 'receive_full_response', return_value={"status": "success", "result": {}}):
+            conn.send_command("get_session_info")
+        assert time.monotonic() - state.ableton_verified_at < 1.0
+        assert get_ableton_connection() is conn
+        conn.sock.getpeername.assert_not_called()
+
+    def test_failed_command_clears_verification(self):
+        conn = AbletonConnection(host="localhost", port=9877)
+        conn.sock = MagicMock()
+        state.ableton_connection = conn
+        state.ableton_verified_at = time.monotonic()
+        with patch.object(conn, 'receive_full_response', side_effect=socket.timeout("timed out")), \
+                patch.object(conn, 'connect', return_value=True), \
+                patch('MCP_Server.connections.ableton.time.sleep'):
+            with pytest.raises(Exception):
+                conn.send_command("get_session_info")
+        assert state.ableton_verified_at == 0.0
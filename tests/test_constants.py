@@ -1,5 +1,7 @@
 from MCP_Server.constants import (
     TIER_0_COMMANDS, TIER_1_COMMANDS, TIER_2_COMMANDS, MODIFYING_COMMANDS,
+    NON_IDEMPOTENT_COMMANDS, SLOW_COMMAND_TIMEOUTS, TIER_SETTLE_TIMES, COMMAND_META,
+    DEFAULT_COMMAND_META,
 )
 
 
@@ -9,11 +11,18 @@ class TestCommandTiers:
         assert TIER_0_COMMANDS.isdisjoint(TIER_1_COMMANDS)
         assert TIER_0_COMMANDS.isdisjoint(TIER_2_COMMANDS)
         assert TIER_1_COMMANDS.isdisjoint(TIER_2_COMMANDS)
+        # Pairwise disjoint iff the sizes add up to the union's size
+        assert sum(map(len, (TIER_0_COMMANDS, TIER_1_COMMANDS, TIER_2_COMMANDS))) == len(MODIFYING_COMMANDS)
 
     def test_modifying_is_union(self):
         """MODIFYING_COMMANDS should be the union of all three tiers."""
         assert MODIFYING_COMMANDS == TIER_0_COMMANDS | TIER_1_COMMANDS | TIER_2_COMMANDS
 
+    def test_command_sets_are_frozen(self):
+        for commands in (TIER_0_COMMANDS, TIER_1_COMMANDS, TIER_2_COMMANDS,
+                         MODIFYING_COMMANDS, NON_IDEMPOTENT_COMMANDS):
+            assert type(commands) is frozenset
+
     def test_tiers_are_not_empty(self):
         assert len(TIER_0_COMMANDS) > 0
         assert len(TIER_1_COMMANDS) > 0
@@ -26,3 +35,29 @@ class TestCommandTiers:
         assert "add_notes_to_clip" in TIER_1_COMMANDS
         assert "create_midi_track" in TIER_2_COMMANDS
         assert "load_instrument_or_effect" in TIER_2_COMMANDS
+
+
+class TestCommandMeta:
+    def _meta(self, command):
+        return COMMAND_META.get(command, DEFAULT_COMMAND_META)
+
+    def test_settle_times_match_tier_sets(self):
+        for command in TIER_0_COMMANDS:
+            assert self._meta(command)[0] == TIER_SETTLE_TIMES[0]
+        for command in TIER_1_COMMANDS:
+            assert self._meta(command)[0] == TIER_SETTLE_TIMES[1]
+        for command in TIER_2_COMMANDS:
+            assert self._meta(command)[0] == TIER_SETTLE_TIMES[2]
+        assert self._meta("get_session_info")[0] == 0.0
+
+    def test_non_idempotent_flag_matches_set(self):
+        for command in NON_IDEMPOTENT_COMMANDS:
+            assert self._meta(command)[1] is True
+        assert self._meta("set_tempo")[1] is False
+        assert self._meta("get_session_info")[1] is False
+
+    def test_default_timeouts(self):
+        for command, seconds in SLOW_COMMAND_TIMEOUTS.items():
+            assert self._meta(command)[2] == seconds
+        assert self._meta("set_tempo")[2] == 15.0
+        assert self._meta("get_session_info")[2] == 10.0
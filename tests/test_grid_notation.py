@@ -1,5 +1,5 @@
 import pytest
-from MCP_Server.grid_notation import parse_grid, notes_to_grid
+from MCP_Server.grid_notation import parse_grid, notes_to_grid, notes_to_melodic_grid
 
 
 class TestParseGrid:
@@ -40,6 +40,26 @@ HH|x-x-x-x-|"""
         assert len(notes) > 0
         assert notes[0]["pitch"] == 61  # C#4 = MIDI 61
 
+    def test_drum_bar_separators_take_no_steps(self):
+        notes = parse_grid("SN|o-.-|X---|", is_drums=True)
+        assert [(n["start_time"], n["velocity"]) for n in notes] == [
+            (0.0, 100), (0.5, 50), (1.0, 120),
+        ]
+        assert all(n["duration"] == 0.25 for n in notes)
+
+    @pytest.mark.parametrize("label, pitch", [
+        ("Db4", 61), ("bb3", 58), ("e5", 76), ("Cb4", 59), ("B#3", 60), ("G", 67),
+    ])
+    def test_note_name_table(self, label, pitch):
+        notes = parse_grid(f"{label}|o---|", is_drums=False)
+        assert notes[0]["pitch"] == pitch
+
+    def test_melodic_symbols_set_velocity_and_length(self):
+        notes = parse_grid("C4|O-.-xx*-|", is_drums=False)
+        assert [(n["start_time"], n["duration"], n["velocity"]) for n in notes] == [
+            (0.0, 0.25, 110), (0.5, 0.25, 60), (1.0, 0.75, 90),
+        ]
+
 
 class TestNotesToGrid:
     def test_roundtrip_simple(self):
@@ -60,3 +80,29 @@ class TestNotesToGrid:
         ]
         grid_str = notes_to_grid(drum_notes)
         assert isinstance(grid_str, str)
+
+    def test_drum_grid_layout(self):
+        notes = [
+            {"pitch": 36, "start_time": 0.0, "duration": 0.25, "velocity": 120},
+            {"pitch": 42, "start_time": 0.5, "duration": 0.25, "velocity": 90},
+            {"pitch": 38, "start_time": 1.0, "duration": 0.25, "velocity": 40},
+        ]
+        assert notes_to_grid(notes, is_drums=True, steps_per_beat=2).split("\n") == [
+            "HC|-o------|",
+            "SN|--.-----|",
+            "KK|O-------|",
+            "  |1 2 3 4 |",
+        ]
+
+    def test_melodic_grid_clips_notes_to_last_bar(self):
+        notes = [
+            {"pitch": 72, "start_time": 3.0, "duration": 4.0, "velocity": 100},
+            {"pitch": 61, "start_time": 0.0, "duration": 1.0, "velocity": 50},
+            {"pitch": 60, "start_time": -1.0, "duration": 3.0, "velocity": 120},
+        ]
+        assert notes_to_melodic_grid(notes, steps_per_beat=1, num_bars=1).split("\n") == [
+            "C5 |---o|",
+            "C#4|.---|",
+            "C4 |OOO-|",
+            "   |1234|",
+        ]
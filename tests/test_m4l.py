@@ -1,5 +1,6 @@
 import pytest
 import json
+import math
 import struct
 import socket
 import base64
@@ -42,6 +43,35 @@ class TestBuildOscMessage:
         msg = conn._build_osc_message("/a", [("s", "x")])
         assert len(msg) % 4 == 0
 
+    @pytest.mark.parametrize("n", range(8))
+    def test_string_padding_for_every_length(self, n):
+        """Every string gets at least one null, then nulls up to a 4-byte boundary."""
+        text = "s" * n
+        msg = M4LConnection._build_osc_message("/p", [("s", text)])
+        arg = msg[len(b"/p\x00\x00,s\x00\x00"):]
+        assert len(arg) == (n + 4) & ~3
+        assert arg == text.encode() + b"\x00" * (len(arg) - n)
+
+    def test_exact_layout(self):
+        """Strings are null-terminated and padded; numbers are big-endian."""
+        msg = M4LConnection._build_osc_message(
+            "/set", [("i", -2), ("f", 0.5), ("s", "abcd")])
+        assert msg == (
+            b"/set\x00\x00\x00\x00"
+            + b",ifs\x00\x00\x00\x00"
+            + struct.pack(">i", -2)
+            + struct.pack(">f", 0.5)
+            + b"abcd\x00\x00\x00\x00"
+        )
+
+    def test_unknown_tag_is_declared_but_not_packed(self):
+        msg = M4LConnection._build_osc_message("/x", [("T", True), ("i", 1)])
+        assert msg == b"/x\x00\x00,Ti\x00" + struct.pack(">i", 1)
+
+    def test_no_arguments(self):
+        msg = M4LConnection._build_osc_message("/ping")
+        assert msg == b"/ping\x00\x00\x00,\x00\x00\x00"
+
 
 class TestParseM4lResponse:
     def test_urlsafe_base64(self):
@@ -55,6 +85,15 @@ class TestParseM4lResponse:
         assert result["status"] == "success"
         assert result["result"]["value"] == 42
 
+    def test_non_ascii_payload(self):
+        data = {"status": "success", "result": {"name": "Caf\u00e9 \u266b"}}
+        encoded = base64.urlsafe_b64encode(json.dumps(data, ensure_ascii=False).encode()).rstrip(b"=")
+        assert M4LConnection._parse_m4l_response(encoded + b"\x00") == data
+
+    def test_nan_from_bridge_still_parses(self):
+        encoded = base64.urlsafe_b64encode(b'{"value":NaN}').rstrip(b"=")
+        assert math.isnan(M4LConnection._parse_m4l_response(encoded)["value"])
+
     def test_raw_json(self):
         """Test parsing raw JSON response (fallback)."""
         conn = M4LConnection()
@@ -62,6 +101,13 @@ class TestParseM4lResponse:
         result = conn._parse_m4l_response(data)
         assert result["status"] == "success"
 
+    def test_raw_json_skips_base64_attempts(self):
+        data = json.dumps({"_c": 1, "_t": 2, "_d": "abc"}).encode() + b"\x00\x00"
+        with patch("MCP_Server.connections.m4l.base64") as b64:
+            result = M4LConnection._parse_m4l_response(data)
+        assert result == {"_c": 1, "_t": 2, "_d": "abc"}
+        assert not b64.method_calls
+
 
 class TestReassembleChunkedResponse:
     def test_single_chunk(self):
@@ -97,6 +143,40 @@ class TestReassembleChunkedResponse:
         result = conn._reassemble_chunked_response(first_chunk)
         assert result == data
 
+    @pytest.mark.parametrize("part_size", [3, 7, 30])
+    def test_out_of_order_duplicate_and_multibyte(self, part_size):
+        """Chunks land in their own slot; a multi-byte char may straddle pieces."""
+        conn = M4LConnection()
+        conn.recv_sock = MagicMock()
+        data = {"name": "Caf\u00e9 \u00fcber \u266b" * 4}
+        raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        raw_parts = [raw[i:i + part_size] for i in range(0, len(raw), part_size)]
+        pieces = [base64.urlsafe_b64encode(p).decode().rstrip("=") for p in raw_parts]
+        total = len(pieces)
+        order = [total - 1, total - 1, total + 3] + list(range(total - 2, 0, -1))
+        conn.recv_sock.recvfrom.side_effect = [
+            (json.dumps({"_c": i, "_t": total, "_d": pieces[i % total]}).encode(), None)
+            for i in order
+        ]
+        result = conn._reassemble_chunked_response({"_c": 0, "_t": total, "_d": pieces[0]})
+        assert result == data
+        assert conn.recv_sock.recvfrom.call_count == len(order)
+
+    def test_timeout_reports_missing_chunks(self):
+        conn = M4LConnection()
+        conn.recv_sock = MagicMock()
+        conn.recv_sock.recvfrom.side_effect = socket.timeout
+        with pytest.raises(Exception, match=r"1/3 chunks, missing: \[1, 2\]"):
+            conn._reassemble_chunked_response({"_c": 0, "_t": 3, "_d": "e30"})
+
+    @pytest.mark.parametrize("idx", [3, -1])
+    def test_first_chunk_index_out_of_range(self, idx):
+        conn = M4LConnection()
+        conn.recv_sock = MagicMock()
+        with pytest.raises(Exception, match="first chunk index .* out of range"):
+            conn._reassemble_chunked_response({"_c": idx, "_t": 3, "_d": "e30"})
+        conn.recv_sock.recvfrom.assert_not_called()
+
 
 class TestDynamicTimeouts:
     def test_batch_set_hidden_params_timeout(self):
@@ -117,3 +197,28 @@ class TestDynamicTimeouts:
                     # Check settimeout was called with appropriate value
                     timeout_calls = [c for c in conn.recv_sock.settimeout.call_args_list]
                     assert len(timeout_calls) > 0
+
+
+class TestResend:
+    def test_reconnect_retry_resends_the_same_packet(self):
+        """The packet is built once per command; the retry resends those bytes."""
+        conn = M4LConnection()
+        send_sock, recv_sock = MagicMock(), MagicMock()
+        response = base64.urlsafe_b64encode(json.dumps({"status": "success", "result": {}}).encode())
+        recv_sock.recvfrom.side_effect = [socket.timeout, (response, None)]
+
+        def reconnect():
+            conn.send_sock, conn.recv_sock, conn._connected = send_sock, recv_sock, True
+            return True
+
+        reconnect()
+        with patch.object(conn, "connect", side_effect=reconnect), \
+                patch.object(conn, "_drain_recv_socket"), \
+                patch.object(conn, "_build_osc_packet", wraps=conn._build_osc_packet) as build, \
+                patch("MCP_Server.connections.m4l.time.sleep"):
+            result = conn.send_command("ping")
+
+        assert result["status"] == "success"
+        build.assert_called_once()
+        (first, _), (second, _) = [c.args for c in send_sock.sendto.call_args_list]
+        assert first is second
@@ -0,0 +1,120 @@
+"""Tests for MCP_Server/cache/queries.py -- short-lived read-only query cache."""
+
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from MCP_Server.cache.queries import (
+    cached_query, cached_query_async, bump_live_state_epoch,
+    record_track_count, adjust_track_count, known_track_count,
+)
+from MCP_Server.connections.ableton import AbletonConnection
+import MCP_Server.state as state
+
+
+class TestCachedQuery:
+    def test_repeat_read_within_ttl_skips_round_trip(self, mock_ableton):
+        mock_ableton.send_command.return_value = {"tracks": [1, 2]}
+        first = cached_query(mock_ableton, "get_all_tracks_info")
+        second = cached_query(mock_ableton, "get_all_tracks_info")
+        assert first is second
+        assert json.loads(first) == {"tracks": [1, 2]}
+        assert mock_ableton.send_command.call_count == 1
+
+    def test_params_are_part_of_key(self, mock_ableton):
+        cached_query(mock_ableton, "get_track_routing", {"track_index": 0})
+        cached_query(mock_ableton, "get_track_routing", {"track_index": 1})
+        assert mock_ableton.send_command.call_count == 2
+
+    def test_expired_entry_is_refetched(self, mock_ableton):
+        cached_query(mock_ableton, "get_track_meters", ttl=0.0)
+        cached_query(mock_ableton, "get_track_meters", ttl=0.0)
+        assert mock_ableton.send_command.call_count == 2
+
+    def test_epoch_bump_invalidates(self, mock_ableton):
+        cached_query(mock_ableton, "get_all_tracks_info")
+        bump_live_state_epoch()
+        cached_query(mock_ableton, "get_all_tracks_info")
+        assert mock_ableton.send_command.call_count == 2
+
+    def test_write_during_fetch_is_not_cached(self, mock_ableton):
+        def send(cmd, params=None):
+            bump_live_state_epoch()  # a write lands while the read is in flight
+            return {}
+        mock_ableton.send_command.side_effect = send
+        cached_query(mock_ableton, "get_all_tracks_info")
+        assert state.query_cache == {}
+
+
+class TestSendCommandInvalidation:
+    def _conn(self):
+        conn = AbletonConnection(host="localhost", port=9877)
+        conn.sock = MagicMock()
+        return conn
+
+    def test_write_command_bumps_epoch(self):
+        conn = self._conn()
+        before = state.live_state_epoch
+        with patch.object(conn, 'receive_full_response', return_value={"status": "success", "result": {}}):
+            conn.send_command("set_track_name", {"track_index": 0, "name": "x"})
+        assert state.live_state_epoch > before
+
+    def test_read_command_keeps_epoch(self):
+        conn = self._conn()
+        before = state.live_state_epoch
+        with patch.object(conn, 'receive_full_response', return_value={"status": "success", "result": {}}):
+            conn.send_command("get_all_tracks_info")
+        assert state.live_state_epoch == before
+
+
+class TestTrackCount:
+    def test_recorded_count_is_known_at_same_epoch(self):
+        record_track_count(4, state.live_state_epoch)
+        assert known_track_count() == 4
+
+    def test_any_write_makes_count_unknown(self):
+        record_track_count(4, state.live_state_epoch)
+        bump_live_state_epoch()
+        assert known_track_count() is None
+
+    def test_adjust_carries_count_across_own_write(self):
+        record_track_count(4, state.live_state_epoch)
+        bump_live_state_epoch()
+        adjust_track_count(-1)
+        assert known_track_count() == 3
+
+    def test_adjust_drops_count_after_intervening_write(self):
+        record_track_count(4, state.live_state_epoch)
+        bump_live_state_epoch()
+        bump_live_state_epoch()
+        adjust_track_count(1)
+        assert state.track_count_cache is None
+
+    def test_expires_after_ttl(self):
+        record_track_count(4, state.live_state_epoch)
+        with patch.object(state, "TRACK_COUNT_TTL", 0.0):
+            assert known_track_count() is None
+
+    def test_on_fetch_sees_raw_result(self, mock_ableton):
+        mock_ableton.send_command.return_value = {"tracks": [1, 2, 3]}
+        seen = []
+        cached_query(mock_ableton, "get_all_tracks_info", on_fetch=lambda r, e: seen.append(r))
+        cached_query(mock_ableton, "get_all_tracks_info", on_fetch=lambda r, e: seen.append(r))
+        assert seen == [{"tracks": [1, 2, 3]}]
+
+
+class TestCachedQueryAsync:
+    @pytest.mark.asyncio
+    async def test_shares_cache_with_sync_path(self, mock_ableton):
+        mock_ableton.send_command.return_value = {"name": "Bass"}
+        first = await cached_query_async(lambda: mock_ableton, "get_track_info", {"track_index": 0})
+        second = cached_query(mock_ableton, "get_track_info", {"track_index": 0})
+        assert first is second
+        assert mock_ableton.send_command_async.await_count == 1
+        assert mock_ableton.send_command.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_hit_does_not_connect(self, mock_ableton):
+        await cached_query_async(lambda: mock_ableton, "get_track_routing", {"track_index": 1})
+        connect = MagicMock()
+        await cached_query_async(connect, "get_track_routing", {"track_index": 1})
+        connect.assert_not_called()
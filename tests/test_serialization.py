@@ -0,0 +1,48 @@
+import json
+import pytest
+import MCP_Server.serialization as serialization
+
+
+class TestDumps:
+    def test_round_trips_nested_structures(self):
+        obj = {"tracks": [{"name": "Bass", "volume": 0.85, "muted": False, "clip": None}]}
+        assert json.loads(serialization.dumps(obj)) == obj
+
+    def test_returns_str(self):
+        assert isinstance(serialization.dumps({"a": 1}), str)
+
+    def test_non_str_keys(self):
+        assert json.loads(serialization.dumps({0: "IN", 1: "AUTO"})) == {"0": "IN", "1": "AUTO"}
+
+    def test_unicode_preserved(self):
+        assert json.loads(serialization.dumps({"name": "Café ♪"}))["name"] == "Café ♪"
+
+    def test_oversized_int_falls_back(self):
+        big = 2 ** 70
+        assert json.loads(serialization.dumps({"n": big}))["n"] == big
+
+
+class TestDumpb:
+    def test_returns_compact_bytes(self):
+        out = serialization.dumpb({"a": [1, 2], "name": "Café"})
+        assert isinstance(out, bytes)
+        assert b" " not in out.replace("Café".encode("utf-8"), b"")
+        assert json.loads(out) == {"a": [1, 2], "name": "Café"}
+
+    def test_oversized_int_falls_back(self):
+        assert json.loads(serialization.dumpb({"n": 2 ** 70}))["n"] == 2 ** 70
+
+
+class TestLoads:
+    def test_parses_bytes_and_str(self):
+        assert serialization.loads(b'{"a": [1, 2.5]}') == {"a": [1, 2.5]}
+        assert serialization.loads('{"a": null}') == {"a": None}
+
+    def test_stdlib_only_inputs_fall_back(self):
+        data = serialization.loads(b'{"n": 1180591620717411303424, "v": NaN}')
+        assert data["n"] == 2 ** 70
+        assert data["v"] != data["v"]
+
+    def test_malformed_raises_json_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            serialization.loads(b'{"a": ')
@@ -0,0 +1,238 @@
+"""Tests for MCP_Server/tools/snapshots.py -- snapshot, macro, and param-map tools.
+
+M4L connections are mocked via conftest.py fixtures (patch_m4l, reset_state).
+Because snapshots.py binds ``get_m4l_connection`` at import time via
+``from ... import``, each test also patches the module-level name.
+"""
+
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+import MCP_Server.state as state
+from MCP_Server.tools.snapshots import _intern_parameters, _store_snapshots
+
+_PATCH_GMC = 'MCP_Server.tools.snapshots.get_m4l_connection'
+
+_PARAMS = [
+    {"index": 0, "name": "Device On", "value": 1.0, "min": 0.0, "max": 1.0, "is_quantized": True},
+    {"index": 1, "name": "Filter Freq", "value": 0.5, "min": 0.0, "max": 1.0},
+]
+
+
+def _register_snapshot_tools():
+    """Create a disposable FastMCP instance with snapshot tools registered."""
+    from mcp.server.fastmcp import FastMCP
+    from MCP_Server.tools.snapshots import register_tools
+    mcp = FastMCP("test")
+    register_tools(mcp)
+    return mcp
+
+
+def _get_tool(mcp, name):
+    """Retrieve a registered tool function by name."""
+    tool_fn = mcp._tool_manager._tools.get(name)
+    assert tool_fn is not None, f"Tool '{name}' was not registered"
+    return tool_fn
+
+
+def _discover_response(params=None):
+    return {
+        "status": "success",
+        "result": {
+            "device_name": "Wavetable",
+            "device_class": "InstrumentVector",
+            "parameter_count": len(params if params is not None else _PARAMS),
+            "parameters": [dict(p) for p in (params if params is not None else _PARAMS)],
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# Parameter interning
+# ---------------------------------------------------------------------------
+
+class TestInternParameters:
+
+    def test_identical_arrays_are_shared(self):
+        a = _intern_parameters([dict(p) for p in _PARAMS])
+        b = _intern_parameters([dict(p) for p in _PARAMS])
+        assert a is b
+        assert a == _PARAMS
+
+    def test_different_arrays_are_not_shared(self):
+        changed = [dict(p) for p in _PARAMS]
+        changed[1]["value"] = 0.75
+        a = _intern_parameters([dict(p) for p in _PARAMS])
+        b = _intern_parameters(changed)
+        assert a is not b
+
+    def test_empty_passthrough(self):
+        assert _intern_parameters([]) == []
+
+    @pytest.mark.asyncio
+    async def test_repeated_captures_share_parameters(self, patch_m4l):
+        with patch(_PATCH_GMC, return_value=patch_m4l):
+            mcp = _register_snapshot_tools()
+            tool_fn = _get_tool(mcp, "snapshot_device_state")
+            patch_m4l.send_command.side_effect = lambda *a, **k: _discover_response()
+
+            await tool_fn.fn(MagicMock(), track_index=0, device_index=0)
+            await tool_fn.fn(MagicMock(), track_index=0, device_index=0)
+
+        snaps = [s for s in state.snapshot_store.values() if s.get("device_name") == "Wavetable"]
+        assert len(snaps) >= 2
+        assert snaps[-1]["parameters"] is snaps[-2]["parameters"]
+
+
+# ---------------------------------------------------------------------------
+# Copy-on-write snapshot store
+# ---------------------------------------------------------------------------
+
+class TestSnapshotStorePublishing:
+
+    @pytest.mark.asyncio
+    async def test_capture_and_delete_swap_the_store(self, patch_m4l):
+        patch_m4l.send_command.return_value = _discover_response()
+        with patch(_PATCH_GMC, return_value=patch_m4l):
+            mcp = _register_snapshot_tools()
+            before = state.snapshot_store
+            await _get_tool(mcp, "snapshot_device_state").fn(MagicMock(), track_index=0, device_index=0)
+            after_capture = state.snapshot_store
+            (snap_id,) = set(after_capture) - set(before)
+
+            await _get_tool(mcp, "delete_snapshot").fn(MagicMock(), snapshot_id=snap_id)
+
+        assert snap_id not in before
+        assert snap_id in after_capture  # a reader holding this view keeps seeing it
+        assert snap_id not in state.snapshot_store
+
+    @pytest.mark.asyncio
+    async def test_group_capture_is_published_at_once(self, patch_m4l):
+        ableton = MagicMock()
+        ableton.send_command.return_value = {"devices": [{}, {}]}
+        patch_m4l.send_command.return_value = _discover_response()
+        with patch(_PATCH_GMC, return_value=patch_m4l), \
+                patch('MCP_Server.tools.snapshots.get_ableton_connection', return_value=ableton), \
+                patch('MCP_Server.tools.snapshots._store_snapshots',
+                      wraps=_store_snapshots) as publish:
+            mcp = _register_snapshot_tools()
+            await _get_tool(mcp, "snapshot_all_devices").fn(MagicMock(), track_indices=[0, 1])
+
+        publish.assert_called_once()
+        (entries,), _ = publish.call_args
+        assert len(entries) == 5  # 2 tracks x 2 devices + the group record
+        assert sum(1 for v in state.snapshot_store.values() if v.get("type") == "group") == 1
+
+
+# ---------------------------------------------------------------------------
+# restore_device_snapshot
+# ---------------------------------------------------------------------------
+
+def _many_params(value):
+    return [{"index": i, "name": f"P{i}", "value": value} for i in range(10)]
+
+
+class TestRestoreDeviceSnapshot:
+
+    def _store(self, params):
+        state.snapshot_store["snap1"] = {
+            "id": "snap1", "name": "snap1", "track_index": 0, "device_index": 0,
+            "parameters": params,
+        }
+
+    def _set_calls(self, m4l):
+        return [c for c in m4l.send_command.call_args_list if c[0][0] == "set_hidden_param"]
+
+    @pytest.mark.asyncio
+    async def test_skips_parameters_already_matching(self, patch_m4l):
+        target = _many_params(0.5)
+        live = _many_params(0.5)
+        live[3]["value"] = 0.9
+        self._store(target)
+
+        def send(cmd, params=None):
+            if cmd == "discover_params":
+                return _discover_response(live)
+            return {"status": "success", "result": {}}
+        patch_m4l.send_command.side_effect = send
+
+        with patch(_PATCH_GMC, return_value=patch_m4l), \
+                patch('MCP_Server.tools.devices.time.sleep'):
+            mcp = _register_snapshot_tools()
+            result = await _get_tool(mcp, "restore_device_snapshot").fn(MagicMock(), snapshot_id="snap1")
+
+        calls = self._set_calls(patch_m4l)
+        assert len(calls) == 1
+        assert calls[0][0][1]["parameter_index"] == 3
+        assert "skipped): 9" in result
+
+    @pytest.mark.asyncio
+    async def test_full_restore_when_live_read_fails(self, patch_m4l):
+        self._store(_many_params(0.5))
+
+        def send(cmd, params=None):
+            if cmd == "discover_params":
+                return {"status": "error", "message": "timeout"}
+            return {"status": "success", "result": {}}
+        patch_m4l.send_command.side_effect = send
+
+        with patch(_PATCH_GMC, return_value=patch_m4l), \
+                patch('MCP_Server.tools.devices.time.sleep'):
+            mcp = _register_snapshot_tools()
+            await _get_tool(mcp, "restore_device_snapshot").fn(MagicMock(), snapshot_id="snap1")
+
+        assert len(self._set_calls(patch_m4l)) == 10
+
+
+# ---------------------------------------------------------------------------
+# Parameter maps
+# ---------------------------------------------------------------------------
+
+_FRIENDLY = [
+    {"parameter_index": 1, "original_name": "Filter Freq", "friendly_name": "Brightness", "category": "Filter"},
+    {"parameter_index": 2, "original_name": "Filter Res", "friendly_name": "Resonance", "category": "Filter"},
+    {"parameter_index": 5, "original_name": "Env Attack", "friendly_name": "Attack"},
+]
+
+
+class TestParameterMaps:
+
+    async def _create(self, mcp, m4l):
+        m4l.send_command.return_value = _discover_response()
+        result = await _get_tool(mcp, "create_parameter_map").fn(
+            MagicMock(), track_index=0, device_index=0, friendly_names=_FRIENDLY)
+        return json.loads(result)["message"]
+
+    @pytest.mark.asyncio
+    async def test_create_get_delete_round_trip(self, patch_m4l):
+        with patch(_PATCH_GMC, return_value=patch_m4l):
+            mcp = _register_snapshot_tools()
+            message = await self._create(mcp, patch_m4l)
+            map_id = message.split("(ID: ")[1].split(")")[0]
+
+            assert "[Filter]" in message and "[Uncategorized]" in message
+
+            pmap = json.loads(await _get_tool(mcp, "get_parameter_map").fn(MagicMock(), map_id=map_id))
+            assert pmap["device_name"] == "Wavetable"
+            assert len(pmap["mappings"]) == 3
+            assert pmap["mappings"][0] == _FRIENDLY[0]
+            assert "category" not in pmap["mappings"][2]
+            assert isinstance(state.param_map_store[map_id].created_ns, int)
+            assert len(pmap["created"]) == len("2024-01-01 00:00:00")
+
+            listing = await _get_tool(mcp, "list_parameter_maps").fn(MagicMock())
+            assert map_id in listing
+
+            await _get_tool(mcp, "delete_parameter_map").fn(MagicMock(), map_id=map_id)
+            assert map_id not in state.param_map_store
+
+    @pytest.mark.asyncio
+    async def test_writes_replace_store_instead_of_mutating(self, patch_m4l):
+        """Readers holding the old dict must never see it change underneath them."""
+        before = state.param_map_store
+        snapshot = dict(before)
+        with patch(_PATCH_GMC, return_value=patch_m4l):
+            mcp = _register_snapshot_tools()
+            await self._create(mcp, patch_m4l)
+        assert state.param_map_store is not before
+        assert before == snapshot
@@ -1,5 +1,8 @@
+import logging
 import threading
 import MCP_Server.state as state
+from MCP_Server.dashboard.server import DashboardLogHandler
+from MCP_Server.tools.snapshots import _store_snapshots
 
 
 class TestStateThreadSafety:
@@ -8,15 +11,14 @@ class TestStateThreadSafety:
         assert isinstance(state.store_lock, type(threading.Lock()))
 
     def test_concurrent_snapshot_access(self):
-        """Multiple threads writing snapshots should not corrupt data."""
+        """Concurrent copy-on-write publishes must not lose each other's snapshots."""
         errors = []
 
         def writer(thread_id):
             try:
                 for i in range(100):
                     key = f"thread_{thread_id}_snap_{i}"
-                    with state.store_lock:
-                        state.snapshot_store[key] = {"data": i}
+                    _store_snapshots({key: {"data": i}})
             except Exception as e:
                 errors.append(e)
 
@@ -29,6 +31,28 @@ class TestStateThreadSafety:
         assert len(errors) == 0
         assert len(state.snapshot_store) == 500
 
+    def test_stores_have_independent_locks(self):
+        locks = [state.store_lock, state.macro_lock, state.effect_chain_lock,
+                 state.param_map_lock, state.snapshot_param_pool_lock]
+        assert len({id(lock) for lock in locks}) == len(locks)
+        with state.store_lock:
+            # A held snapshot lock must not block macro or chain writers
+            assert state.macro_lock.acquire(blocking=False)
+            state.macro_lock.release()
+            assert state.effect_chain_lock.acquire(blocking=False)
+            state.effect_chain_lock.release()
+
+    def test_dashboard_log_handler_never_waits(self):
+        handler = DashboardLogHandler()
+        record = logging.LogRecord("AbletonBridge", logging.INFO, __file__, 1, "hello", None, None)
+        state.server_log_buffer.clear()
+        with state.server_log_lock:
+            handler.emit(record)  # dropped instead of deadlocking
+        assert len(state.server_log_buffer) == 0
+        handler.emit(record)
+        assert state.server_log_buffer[-1][1:] == ("INFO", "hello")
+        state.server_log_buffer.clear()
+
     def test_browser_cache_ready_event(self):
         assert hasattr(state, 'browser_cache_ready')
         assert isinstance(state.browser_cache_ready, threading.Event)
@@ -40,3 +64,11 @@ class TestStateThreadSafety:
     def test_effect_chain_store_exists(self):
         assert hasattr(state, 'effect_chain_store')
         assert isinstance(state.effect_chain_store, dict)
+
+    def test_param_map_record_is_slotted(self):
+        rec = state.ParamMapRecord("ab12cd34", 0, 1, "Serum", "PluginDevice",
+                                   ((3, "Macro 1", "Brightness", None),), 0)
+        assert not hasattr(rec, "__dict__")
+        assert rec.to_dict()["mappings"] == [
+            {"parameter_index": 3, "original_name": "Macro 1", "friendly_name": "Brightness"}
+        ]
@@ -50,6 +50,26 @@ class TestToolHandler:
         assert parsed["status"] == "error"
         assert "Error doing stuff" in parsed["message"]
 
+    @pytest.mark.asyncio
+    async def test_coroutine_tool_is_awaited(self):
+        @_tool_handler("test")
+        async def my_tool(a):
+            await asyncio.sleep(0)
+            return f"got {a}"
+
+        parsed = json.loads(await my_tool(3))
+        assert parsed["message"] == "got 3"
+
+    @pytest.mark.asyncio
+    async def test_coroutine_tool_value_error_caught(self):
+        @_tool_handler("test")
+        async def my_tool():
+            raise ValueError("bad input")
+
+        parsed = json.loads(await my_tool())
+        assert parsed["status"] == "error"
+        assert "Invalid input" in parsed["message"]
+
     @pytest.mark.asyncio
     async def test_with_args(self):
         @_tool_handler("test")
@@ -84,6 +104,16 @@ class TestToolSuccess:
         result = json.loads(tool_success("Done", {"count": 5}))
         assert result["data"]["count"] == 5
 
+    @pytest.mark.parametrize("message", [
+        "", 'quote " and \\ backslash', "line\nbreak\ttab\x01", "Caf\u00e9 \u266b",
+    ])
+    def test_message_only_envelope_matches_full_encoding(self, message):
+        assert json.loads(tool_success(message)) == {"status": "ok", "message": message}
+        assert json.loads(tool_error(message)) == {"status": "error", "message": message}
+
+    def test_empty_data_is_omitted(self):
+        assert json.loads(tool_success("Done", {})) == {"status": "ok", "message": "Done"}
+
 
 class TestToolError:
     def test_basic(self):
@@ -0,0 +1,149 @@
+"""Tests for MCP_Server/tools/tracks.py -- track management tools."""
+
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+import MCP_Server.state as state
+
+_PATCH_GAC = 'MCP_Server.tools.tracks.get_ableton_connection'
+
+
+def _register_track_tools():
+    from mcp.server.fastmcp import FastMCP
+    from MCP_Server.tools.tracks import register_tools
+    mcp = FastMCP("test")
+    register_tools(mcp)
+    return mcp
+
+
+def _get_tool(mcp, name):
+    tool_fn = mcp._tool_manager._tools.get(name)
+    assert tool_fn is not None, f"Tool '{name}' was not registered"
+    return tool_fn
+
+
+class TestApplyTrackOps:
+
+    @pytest.mark.asyncio
+    async def test_sends_single_batched_command(self, patch_ableton):
+        ops = [
+            {"kind": "set_name", "track_index": 0, "name": "Bass"},
+            {"kind": "set_color", "track_index": 0, "color_index": 5},
+            {"kind": "arm", "track_index": 1},
+        ]
+        patch_ableton.send_command.return_value = {"applied": 3, "failed": 0, "results": []}
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            tool_fn = _get_tool(_register_track_tools(), "apply_track_ops")
+            result = await tool_fn.fn(MagicMock(), ops=ops)
+
+        assert json.loads(result)["applied"] == 3
+        patch_ableton.send_command.assert_called_once_with("apply_track_ops", {"ops": ops})
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("ops, fragment", [
+        ([], "non-empty"),
+        ([{"kind": "explode", "track_index": 0}], "kind must be one of"),
+        ([{"kind": "arm"}], "track_index"),
+        ([{"kind": "set_name", "track_index": 0}], "missing required keys: name"),
+        ([{"kind": "set_monitoring", "track_index": 0, "state": 5}], "between 0 and 2"),
+        ([{"kind": "set_routing", "track_index": 0}], "at least one of"),
+    ])
+    async def test_invalid_ops_rejected(self, patch_ableton, ops, fragment):
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            tool_fn = _get_tool(_register_track_tools(), "apply_track_ops")
+            result = json.loads(await tool_fn.fn(MagicMock(), ops=ops))
+
+        assert result["status"] == "error"
+        assert fragment in result["message"]
+        patch_ableton.send_command.assert_not_called()
+
+
+class TestSimpleTrackTools:
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("name, response, expected", [
+        ("arm_track", {}, "Track 2 armed"),
+        ("disarm_track", {}, "Track 2 disarmed"),
+        ("freeze_track", {"track_name": "Pad"}, "Track 2 (Pad) frozen"),
+        ("unfreeze_track", {"track_name": "Pad"}, "Track 2 (Pad) unfrozen"),
+        ("delete_track", {"track_name": "Pad"}, "Deleted track 'Pad' at index 2"),
+        ("duplicate_track", {"source_name": "Pad", "new_name": "Pad 2", "new_index": 3},
+         "Duplicated track 'Pad' to new track 'Pad 2' at index 3"),
+    ])
+    async def test_forwards_track_index(self, patch_ableton, name, response, expected):
+        patch_ableton.send_command.return_value = response
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            tool_fn = _get_tool(_register_track_tools(), name)
+            result = json.loads(await tool_fn.fn(MagicMock(), track_index=2))
+
+        assert result["message"] == expected
+        patch_ableton.send_command.assert_called_once_with(name, {"track_index": 2})
+        assert tool_fn.description.startswith(tool_fn.fn.__doc__.split("\n")[0])
+
+    @pytest.mark.asyncio
+    async def test_negative_index_rejected(self, patch_ableton):
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            tool_fn = _get_tool(_register_track_tools(), "arm_track")
+            result = json.loads(await tool_fn.fn(MagicMock(), track_index=-1))
+        assert result["status"] == "error"
+        patch_ableton.send_command.assert_not_called()
+
+
+class TestSetTrackRouting:
+
+    @pytest.mark.asyncio
+    async def test_no_arguments_skips_round_trip(self, patch_ableton):
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            tool_fn = _get_tool(_register_track_tools(), "set_track_routing")
+            result = json.loads(await tool_fn.fn(MagicMock(), track_index=0))
+        assert "unchanged" in result["message"]
+        patch_ableton.send_command.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_only_supplied_fields_sent(self, patch_ableton):
+        patch_ableton.send_command.return_value = {"track_name": "Bass", "output_routing_type": "Master"}
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            tool_fn = _get_tool(_register_track_tools(), "set_track_routing")
+            await tool_fn.fn(MagicMock(), track_index=1, output_type="Master")
+        patch_ableton.send_command.assert_called_once_with(
+            "set_track_routing", {"track_index": 1, "output_type": "Master"})
+
+
+class TestTrackCountBounds:
+
+    @pytest.mark.asyncio
+    async def test_out_of_range_rejected_without_round_trip(self, patch_ableton):
+        patch_ableton.send_command.return_value = {"tracks": [{"index": 0}, {"index": 1}], "count": 2}
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            mcp = _register_track_tools()
+            await _get_tool(mcp, "get_all_tracks_info").fn(MagicMock())
+            patch_ableton.send_command.reset_mock()
+            result = json.loads(await _get_tool(mcp, "arm_track").fn(MagicMock(), track_index=2))
+        assert result["status"] == "error"
+        assert "out of range" in result["message"]
+        patch_ableton.send_command.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_track_decrements_known_count(self, patch_ableton):
+        from MCP_Server.cache.queries import bump_live_state_epoch, known_track_count, record_track_count
+        record_track_count(3, state.live_state_epoch)
+
+        def send(cmd, params=None):
+            bump_live_state_epoch()  # what AbletonConnection.send_command does for writes
+            return {"track_name": "Old"}
+        patch_ableton.send_command.side_effect = send
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            await _get_tool(_register_track_tools(), "delete_track").fn(MagicMock(), track_index=0)
+        assert known_track_count() == 2
+
+
+class TestAsyncReadTools:
+
+    @pytest.mark.asyncio
+    async def test_get_track_info_uses_async_send(self, patch_ableton):
+        patch_ableton.send_command.return_value = {"name": "Bass", "index": 0}
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            tool_fn = _get_tool(_register_track_tools(), "get_track_info")
+            result = json.loads(await tool_fn.fn(MagicMock(), track_index=0))
+        assert result == {"name": "Bass", "index": 0}
+        patch_ableton.send_command_async.assert_awaited_once_with("get_track_info", {"track_index": 0})
@@ -1,10 +1,14 @@
+import math
 import pytest
+from unittest.mock import patch
 from MCP_Server.validation import (
-    _validate_index, _validate_index_allow_negative, _validate_range,
+    _validate_index, _validate_index_allow_negative, _validate_range, _validate_track_index,
     _validate_notes, _validate_automation_points,
-    _reduce_automation_points,
+    _reduce_automation_points, _rdp_split, _rdp_thresholds, _perpendicular_distance,
     MAX_NOTES_PER_CALL, MAX_AUTOMATION_POINTS,
 )
+from MCP_Server.cache.queries import record_track_count
+import MCP_Server.state as state
 
 
 class TestValidateIndex:
@@ -30,6 +34,13 @@ class TestValidateIndex:
         with pytest.raises(ValueError, match="must be an integer"):
             _validate_index("0", "test")
 
+    def test_int_subclass_takes_slow_path(self):
+        class Slot(int):
+            pass
+        _validate_index(Slot(3), "test")
+        with pytest.raises(ValueError, match="non-negative"):
+            _validate_index(Slot(-1), "test")
+
 
 class TestValidateIndexAllowNegative:
     def test_minus_one_default(self):
@@ -46,6 +57,15 @@ class TestValidateIndexAllowNegative:
         with pytest.raises(ValueError):
             _validate_index_allow_negative(-6, "test", min_value=-5)
 
+    def test_bool_raises(self):
+        with pytest.raises(ValueError, match="must be an integer"):
+            _validate_index_allow_negative(True, "test")
+
+    def test_int_subclass_accepted(self):
+        class Slot(int):
+            pass
+        _validate_index_allow_negative(Slot(3), "test")
+
 
 class TestValidateRange:
     def test_valid_middle(self):
@@ -72,11 +92,33 @@ class TestValidateRange:
     def test_int_in_float_range(self):
         _validate_range(1, "test", 0.0, 1.0)  # int should work for float range
 
+    def test_float_subclass_takes_slow_path(self):
+        class Gain(float):
+            pass
+        _validate_range(Gain(0.5), "test", 0.0, 1.0)
+        with pytest.raises(ValueError, match="between"):
+            _validate_range(Gain(1.5), "test", 0.0, 1.0)
+
 
 class TestValidateNotes:
     def test_valid_single_note(self):
         _validate_notes([{"pitch": 60, "start_time": 0.0, "duration": 1.0, "velocity": 100}])
 
+    def test_bad_note_deep_in_list_reports_its_index(self):
+        notes = [{"pitch": 60, "start_time": i * 0.5, "duration": 0.5, "velocity": 100} for i in range(500)]
+        notes[317]["velocity"] = 128
+        with pytest.raises(ValueError, match="index 317: velocity"):
+            _validate_notes(notes)
+
+    def test_bool_pitch_rejected(self):
+        with pytest.raises(ValueError, match="pitch must be an integer"):
+            _validate_notes([{"pitch": True, "start_time": 0.0, "duration": 1.0, "velocity": 100}])
+
+    def test_int_subclass_still_accepted(self):
+        class Pitch(int):
+            pass
+        _validate_notes([{"pitch": Pitch(60), "start_time": 0, "duration": 1, "velocity": 100}])
+
     def test_empty_list_raises(self):
         with pytest.raises(ValueError, match="must not be empty"):
             _validate_notes([])
@@ -95,6 +137,18 @@ class TestValidateNotes:
         with pytest.raises(ValueError, match="missing required keys"):
             _validate_notes([{"pitch": 60, "start_time": 0.0}])  # missing duration, velocity
 
+    def test_missing_keys_listed_sorted(self):
+        with pytest.raises(ValueError, match="index 0 is missing required keys: duration, velocity"):
+            _validate_notes([{"start_time": 0.0, "pitch": 60}])
+
+    def test_extra_keys_are_ignored(self):
+        _validate_notes([{"pitch": 60, "start_time": 0.0, "duration": 1.0, "velocity": 100,
+                          "mute": False, "probability": 0.5}])
+
+    def test_none_value_is_a_type_error_not_missing(self):
+        with pytest.raises(ValueError, match="pitch must be an integer"):
+            _validate_notes([{"pitch": None, "start_time": 0.0, "duration": 1.0, "velocity": 100}])
+
     def test_invalid_pitch_raises(self):
         with pytest.raises(ValueError, match="pitch must be"):
             _validate_notes([{"pitch": 128, "start_time": 0.0, "duration": 1.0, "velocity": 100}])
@@ -141,6 +195,12 @@ class TestValidateAutomationPoints:
         with pytest.raises(ValueError, match="time must be"):
             _validate_automation_points([{"time": -1.0, "value": 0.5}])
 
+    def test_error_reports_first_bad_point(self):
+        points = [{"time": float(i), "value": 0.5} for i in range(5)]
+        points[3]["value"] = True
+        with pytest.raises(ValueError, match="index 3: value must be a number"):
+            _validate_automation_points(points)
+
 
 class TestReduceAutomationPoints:
     def test_two_points_unchanged(self):
@@ -168,3 +228,98 @@ class TestReduceAutomationPoints:
         ]
         result = _reduce_automation_points(pts)
         assert len(result) == 2  # deduped to first=0.5, last=1.0
+
+
+class TestRdpEpsilonSearch:
+    def _wave(self, n):
+        return [{"time": i * 0.1, "value": 0.5 + 0.5 * math.sin(i * 0.7) * ((i * 13) % 7) / 7}
+                for i in range(n)]
+
+    def test_keeps_as_much_detail_as_fits(self):
+        result = _reduce_automation_points(self._wave(300), max_points=50)
+        assert 40 <= len(result) <= 50
+        assert result[0]["time"] == 0.0 and result[-1]["time"] == pytest.approx(29.9)
+
+    def test_single_threshold_pass(self):
+        with patch("MCP_Server.validation._rdp_thresholds", wraps=_rdp_thresholds) as rdp:
+            result = _reduce_automation_points(self._wave(300), max_points=20)
+        assert rdp.call_count == 1
+        assert len(result) <= 20
+
+
+def _rdp_indices(ts, vs, epsilon):
+    """Reference Ramer-Douglas-Peucker at a single epsilon.
+
+    Returns the sorted indices of the points to keep; _rdp_thresholds must
+    agree with it at every epsilon.
+    """
+    n = len(ts)
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < 2:
+            continue
+        max_idx, max_dist = _rdp_split(ts, vs, lo, hi)
+        if max_dist > epsilon:
+            keep[max_idx] = True
+            stack.append((lo, max_idx))
+            stack.append((max_idx, hi))
+    return [i for i in range(n) if keep[i]]
+
+
+class TestRdpThresholds:
+    def test_matches_rdp_at_every_epsilon(self):
+        ts = [i / 79 for i in range(80)]
+        vs = [0.5 + 0.5 * math.sin(i * 0.9) * ((i * 7) % 5) / 5 for i in range(80)]
+        thresholds = _rdp_thresholds(ts, vs)
+        for eps in (0.0, 0.01, 0.05, 0.1, 0.3, 1.0):
+            expected = _rdp_indices(ts, vs, eps)
+            assert [i for i, th in enumerate(thresholds) if th > eps] == expected
+
+    def test_endpoints_always_kept(self):
+        thresholds = _rdp_thresholds([0.0, 0.5, 1.0], [0.0, 0.0, 0.0])
+        assert thresholds == [math.inf, 0.0, math.inf]
+
+    def test_deep_split_does_not_recurse(self):
+        # Every point is a corner at epsilon 0, forcing ~n nested splits
+        n = 5000
+        ts = [i / (n - 1) for i in range(n)]
+        vs = [t * t for t in ts]
+        assert all(th > 0.0 for th in _rdp_thresholds(ts, vs))
+
+
+class TestRdpIndices:
+    def test_keeps_endpoints_and_spike(self):
+        ts = [0.0, 0.25, 0.5, 0.75, 1.0]
+        vs = [0.0, 0.5, 1.0, 0.5, 0.0]
+        assert _rdp_indices(ts, vs, 0.1) == [0, 2, 4]
+
+    def test_matches_per_point_distance(self):
+        ts = [i / 49 for i in range(50)]
+        vs = [((i * 37) % 11) / 10 for i in range(50)]
+        kept = _rdp_indices(ts, vs, 0.2)
+        # Every dropped point lies within epsilon of the kept segment around it
+        for a, c in zip(kept, kept[1:]):
+            for b in range(a + 1, c):
+                assert _perpendicular_distance(ts[a], vs[a], ts[b], vs[b], ts[c], vs[c]) <= 0.2
+
+    def test_loop_with_equal_endpoints(self):
+        # First and last point coincide, so distance falls back to Euclidean
+        assert _rdp_indices([0.0, 0.5, 0.0], [0.0, 1.0, 0.0], 0.1) == [0, 1, 2]
+
+
+class TestValidateTrackIndex:
+    def test_no_known_count_only_checks_type(self):
+        _validate_track_index(500)
+
+    def test_rejects_index_past_known_count(self):
+        record_track_count(3, state.live_state_epoch)
+        _validate_track_index(2)
+        with pytest.raises(ValueError, match="out of range"):
+            _validate_track_index(3)
+
+    def test_bounds_check_can_be_bypassed(self):
+        record_track_count(3, state.live_state_epoch)
+        _validate_track_index(3, check_bounds=False)
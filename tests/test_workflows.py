@@ -11,6 +11,7 @@ also patches the module-level name so the tool closures use the per-test mock.
 """
 
 import json
+import threading
 import pytest
 from unittest.mock import MagicMock, patch, call
 import MCP_Server.state as state
@@ -150,9 +151,54 @@ class TestCreateClipWithNotes:
 
             cmd_names = [c[0][0] for c in patch_ableton.send_command.call_args_list]
             assert cmd_names[0] == "create_clip"
-            assert "add_notes_to_clip" in cmd_names
+            assert "add_notes_to_clip_soa" in cmd_names
             assert "set_clip_name" in cmd_names
 
+            add_params = patch_ableton.send_command.call_args_list[cmd_names.index("add_notes_to_clip_soa")][0][1]
+            assert add_params["notes"] == {
+                "pitch": [60, 64],
+                "start_time": [0.0, 1.0],
+                "duration": [1.0, 1.0],
+                "velocity": [100, 90],
+            }
+
+    @pytest.mark.asyncio
+    async def test_mute_column_only_when_needed(self, patch_ableton):
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            mcp = _register_workflow_tools()
+            notes = [
+                {"pitch": 60, "start_time": 0.0, "duration": 1.0, "velocity": 100, "mute": True},
+                {"pitch": 64, "start_time": 1.0, "duration": 1.0, "velocity": 90},
+            ]
+            await _get_tool(mcp, "create_clip_with_notes").fn(
+                MagicMock(), track_index=0, clip_index=0, length=4.0, notes=notes)
+
+        add_call = next(c for c in patch_ableton.send_command.call_args_list
+                        if c[0][0] == "add_notes_to_clip_soa")
+        assert add_call[0][1]["notes"]["mute"] == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_note_rows_on_older_script(self, patch_ableton):
+        """A Remote Script without add_notes_to_clip_soa still gets the notes."""
+        def send(cmd, params=None):
+            if cmd == "add_notes_to_clip_soa":
+                raise Exception("Unknown command: add_notes_to_clip_soa")
+            return {}
+        patch_ableton.send_command.side_effect = send
+
+        notes = [{"pitch": 60, "start_time": 0.0, "duration": 1.0, "velocity": 100}]
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            mcp = _register_workflow_tools()
+            result = await _get_tool(mcp, "create_clip_with_notes").fn(
+                MagicMock(), track_index=0, clip_index=1, length=4.0, notes=notes, clip_name="Old")
+
+        assert json.loads(result)["note_count"] == 1
+        cmd_names = [c[0][0] for c in patch_ableton.send_command.call_args_list]
+        assert cmd_names == ["create_clip", "add_notes_to_clip_soa", "set_clip_name", "add_notes_to_clip"]
+        patch_ableton.send_command.assert_called_with("add_notes_to_clip", {
+            "track_index": 0, "clip_index": 1, "notes": notes,
+        })
+
     @pytest.mark.asyncio
     async def test_no_clip_name_skips_set_name(self, patch_ableton):
         """Empty clip_name should skip the set_clip_name call."""
@@ -203,13 +249,13 @@ class TestCreateClipWithNotes:
 class TestBatchSetMixer:
 
     @pytest.mark.asyncio
-    async def test_multiple_tracks(self, patch_ableton):
-        """Should process multiple track settings and report totals."""
+    async def test_multiple_tracks_single_command(self, patch_ableton):
+        """All settings should go to Live as one set_mixer_batch command."""
         with patch(_PATCH_GAC, return_value=patch_ableton):
             mcp = _register_workflow_tools()
             tool_fn = _get_tool(mcp, "batch_set_mixer")
 
-            patch_ableton.send_command.return_value = {"status": "success"}
+            patch_ableton.send_command.return_value = {"applied": 3, "errors": []}
 
             ctx = MagicMock()
             settings = [
@@ -220,100 +266,91 @@ class TestBatchSetMixer:
 
             data = json.loads(result)
             assert data["settings_processed"] == 2
-            assert data["params_applied"] >= 3  # volume + pan + mute
-
-    @pytest.mark.asyncio
-    async def test_error_accumulation(self, patch_ableton):
-        """Errors on individual tracks should not stop processing others."""
-        with patch(_PATCH_GAC, return_value=patch_ableton):
-            mcp = _register_workflow_tools()
-            tool_fn = _get_tool(mcp, "batch_set_mixer")
-
-            def side_effect(cmd, params=None):
-                if params and params.get("track_index") == 0:
-                    raise Exception("Track 0 error")
-                return {"status": "success"}
-            patch_ableton.send_command.side_effect = side_effect
-
-            ctx = MagicMock()
-            settings = [
-                {"track_index": 0, "volume": 0.8},
-                {"track_index": 1, "volume": 0.6},
-            ]
-            result = await tool_fn.fn(ctx, settings=settings)
-
-            data = json.loads(result)
-            assert len(data["errors"]) >= 1
-            assert data["params_applied"] >= 1  # track 1 should succeed
+            assert data["params_applied"] == 3
+            patch_ableton.send_command.assert_called_once_with("set_mixer_batch", {"settings": [
+                {"track_index": 0, "volume": 0.8, "pan": -0.5, "index": 0},
+                {"track_index": 1, "mute": True, "index": 1},
+            ]})
 
     @pytest.mark.asyncio
-    async def test_missing_track_index_error(self, patch_ableton):
-        """Settings without track_index should produce an error entry."""
+    async def test_remote_errors_are_merged(self, patch_ableton):
+        """Per-parameter errors from Live should be reported alongside local ones."""
         with patch(_PATCH_GAC, return_value=patch_ableton):
             mcp = _register_workflow_tools()
             tool_fn = _get_tool(mcp, "batch_set_mixer")
 
-            patch_ableton.send_command.return_value = {"status": "success"}
+            patch_ableton.send_command.return_value = {
+                "applied": 1,
+                "errors": [{"index": 2, "error": "Track index out of range"}],
+            }
 
             ctx = MagicMock()
             settings = [
                 {"volume": 0.8},  # missing track_index
                 {"track_index": 1, "volume": 0.6},
+                {"track_index": 99, "volume": 0.6},
             ]
             result = await tool_fn.fn(ctx, settings=settings)
 
             data = json.loads(result)
-            assert len(data["errors"]) >= 1
-            assert any("missing track_index" in e["error"] for e in data["errors"])
+            assert data["params_applied"] == 1
+            assert [e["index"] for e in data["errors"]] == [0, 2]
+            assert "missing track_index" in data["errors"][0]["error"]
 
     @pytest.mark.asyncio
-    async def test_empty_settings_rejected(self, patch_ableton):
-        """Empty settings list should return Invalid input error."""
+    async def test_falls_back_to_per_value_commands_on_older_script(self, patch_ableton):
+        """A Remote Script without set_mixer_batch gets one command per value."""
+        def send(cmd, params=None):
+            if cmd == "set_mixer_batch":
+                raise Exception("Unknown command: set_mixer_batch")
+            if cmd == "set_track_solo":
+                raise Exception("Track index out of range")
+            return {}
+        patch_ableton.send_command.side_effect = send
+
+        settings = [
+            {"track_index": 0, "volume": 0.8, "pan": -0.5},
+            {"track_index": 1, "track_type": "return", "mute": True},
+            {"track_index": 0, "track_type": "master", "volume": 0.7, "solo": True},
+            {"track_index": 9, "solo": True},
+        ]
         with patch(_PATCH_GAC, return_value=patch_ableton):
             mcp = _register_workflow_tools()
-            tool_fn = _get_tool(mcp, "batch_set_mixer")
-
-            ctx = MagicMock()
-            result = await tool_fn.fn(ctx, settings=[])
-            assert "Invalid input" in result
+            result = await _get_tool(mcp, "batch_set_mixer").fn(MagicMock(), settings=settings)
+
+        data = json.loads(result)
+        assert data["params_applied"] == 4
+        assert [(e["index"], e["param"]) for e in data["errors"]] == [(2, "solo"), (3, "solo")]
+        assert patch_ableton.send_command.call_args_list[1:] == [
+            call("set_track_volume", {"volume": 0.8, "track_index": 0}),
+            call("set_track_pan", {"pan": -0.5, "track_index": 0}),
+            call("set_return_track_mute", {"mute": True, "return_track_index": 1}),
+            call("set_master_volume", {"volume": 0.7}),
+            call("set_track_solo", {"solo": True, "track_index": 9}),
+        ]
 
     @pytest.mark.asyncio
-    async def test_solo_param_applied(self, patch_ableton):
-        """Solo parameter should trigger set_track_solo command."""
+    async def test_all_malformed_skips_round_trip(self, patch_ableton):
         with patch(_PATCH_GAC, return_value=patch_ableton):
             mcp = _register_workflow_tools()
             tool_fn = _get_tool(mcp, "batch_set_mixer")
 
-            patch_ableton.send_command.return_value = {"status": "success"}
-
-            ctx = MagicMock()
-            settings = [{"track_index": 2, "solo": True}]
-            result = await tool_fn.fn(ctx, settings=settings)
+            result = await tool_fn.fn(MagicMock(), settings=[{"volume": 0.8}])
 
             data = json.loads(result)
-            assert data["params_applied"] == 1
-
-            cmd_names = [c[0][0] for c in patch_ableton.send_command.call_args_list]
-            assert "set_track_solo" in cmd_names
+            assert data["params_applied"] == 0
+            patch_ableton.send_command.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_return_track_type(self, patch_ableton):
-        """track_type='return' should use return-specific commands."""
+    async def test_empty_settings_rejected(self, patch_ableton):
+        """Empty settings list should return Invalid input error."""
         with patch(_PATCH_GAC, return_value=patch_ableton):
             mcp = _register_workflow_tools()
             tool_fn = _get_tool(mcp, "batch_set_mixer")
 
-            patch_ableton.send_command.return_value = {"status": "success"}
-
             ctx = MagicMock()
-            settings = [{"track_index": 0, "track_type": "return", "volume": 0.7}]
-            result = await tool_fn.fn(ctx, settings=settings)
-
-            data = json.loads(result)
-            assert data["params_applied"] == 1
-
-            cmd_names = [c[0][0] for c in patch_ableton.send_command.call_args_list]
-            assert "set_return_track_volume" in cmd_names
+            result = await tool_fn.fn(ctx, settings=[])
+            assert "Invalid input" in result
 
 
 # ---------------------------------------------------------------------------
@@ -341,6 +378,38 @@ class TestApplyEffectChain:
             assert len(data["loaded"]) == 3
             assert len(data["failed"]) == 0
 
+    @pytest.mark.asyncio
+    async def test_repeated_effect_resolved_once(self, patch_ableton):
+        with patch(_PATCH_GAC, return_value=patch_ableton), \
+                patch(_PATCH_URI, side_effect=lambda n: f"query:{n}") as resolve:
+            mcp = _register_workflow_tools()
+            tool_fn = _get_tool(mcp, "apply_effect_chain")
+            await tool_fn.fn(MagicMock(), track_index=0, effects=["EQ Eight", "Compressor", "EQ Eight"])
+
+        assert resolve.call_count == 2
+        uris = [c[0][1]["uri"] for c in patch_ableton.send_command.call_args_list]
+        assert uris == ["query:EQ Eight", "query:Compressor", "query:EQ Eight"]
+
+    @pytest.mark.asyncio
+    async def test_names_resolve_in_parallel_during_warmup(self, patch_ableton):
+        """Each name may block on warmup; the waits must overlap, not add up."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def resolve(name):
+            barrier.wait()  # raises BrokenBarrierError if names resolve one by one
+            return f"query:{name}"
+
+        with patch(_PATCH_GAC, return_value=patch_ableton), \
+                patch(_PATCH_URI, side_effect=resolve), \
+                patch.object(state, 'browser_cache_ready', threading.Event()):
+            mcp = _register_workflow_tools()
+            tool_fn = _get_tool(mcp, "apply_effect_chain")
+            result = await tool_fn.fn(MagicMock(), track_index=0, effects=["EQ Eight", "Compressor", "Limiter"])
+
+        assert json.loads(result)["loaded"] == ["EQ Eight", "Compressor", "Limiter"]
+        uris = [c[0][1]["uri"] for c in patch_ableton.send_command.call_args_list]
+        assert uris == ["query:EQ Eight", "query:Compressor", "query:Limiter"]
+
     @pytest.mark.asyncio
     async def test_partial_failure(self, patch_ableton):
         """If one effect fails to load, others should still succeed."""
@@ -400,8 +469,14 @@ class TestEffectChainRoundTrip:
                             {"name": "Compressor", "class_name": "Compressor"},
                         ]
                     }
-                if cmd == "get_device_parameters":
-                    return {"parameters": [{"name": "Gain", "value": 0.5}]}
+                if cmd == "get_device_parameters_batch":
+                    return {
+                        "parameters_by_index": {
+                            str(i): [{"name": "Gain", "value": 0.5}]
+                            for i in params["device_indices"]
+                        },
+                        "errors": {},
+                    }
                 return {"status": "success", "index": 0}
             patch_ableton.send_command.side_effect = cmd_handler
 
@@ -419,6 +494,10 @@ class TestEffectChainRoundTrip:
             template = state.effect_chain_store["my_chain"]
             assert len(template["devices"]) == 2
             assert template["devices"][0]["name"] == "EQ Eight"
+            assert template["devices"][1]["parameters"] == [{"name": "Gain", "value": 0.5}]
+            sent = [c[0][0] for c in patch_ableton.send_command.call_args_list]
+            assert sent.count("get_device_parameters_batch") == 1
+            assert "get_device_parameters" not in sent
 
             # Load the chain onto a different track
             load_fn = _get_tool(mcp, "load_effect_chain")
@@ -436,6 +515,68 @@ class TestEffectChainRoundTrip:
             assert data["loaded"][0] == "EQ Eight"
             assert data["loaded"][1] == "Compressor"
 
+    @pytest.mark.asyncio
+    async def test_save_keeps_devices_whose_parameters_failed(self, patch_ableton):
+        def cmd_handler(cmd, params=None):
+            if cmd == "get_track_info":
+                return {"devices": [{"name": "EQ Eight"}, {"name": "Broken"}]}
+            if cmd == "get_device_parameters_batch":
+                return {
+                    "parameters_by_index": {"0": [{"name": "Gain", "value": 0.5}]},
+                    "errors": {"1": "Device index out of range"},
+                }
+            return {}
+        patch_ableton.send_command.side_effect = cmd_handler
+
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            mcp = _register_workflow_tools()
+            result = await _get_tool(mcp, "save_effect_chain").fn(
+                MagicMock(), track_index=0, template_name="partial")
+
+        assert json.loads(result)["device_count"] == 2
+        devices = state.effect_chain_store["partial"]["devices"]
+        assert devices[0]["parameters"] == [{"name": "Gain", "value": 0.5}]
+        assert devices[1]["parameters"] == []
+
+    @pytest.mark.asyncio
+    async def test_save_reads_devices_one_by_one_on_older_script(self, patch_ableton):
+        """Without get_device_parameters_batch, parameters come from per-device reads."""
+        def cmd_handler(cmd, params=None):
+            if cmd == "get_track_info":
+                return {"devices": [{"name": "EQ Eight"}, {"name": "Broken"}, {"name": "Compressor"}]}
+            if cmd == "get_device_parameters_batch":
+                raise Exception("Unknown command: get_device_parameters_batch")
+            if cmd == "get_device_parameters":
+                if params["device_index"] == 1:
+                    raise Exception("Device index out of range")
+                return {"parameters": [{"name": "Gain", "value": params["device_index"]}]}
+            return {}
+        patch_ableton.send_command.side_effect = cmd_handler
+
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            mcp = _register_workflow_tools()
+            await _get_tool(mcp, "save_effect_chain").fn(
+                MagicMock(), track_index=0, template_name="old_script")
+
+        devices = state.effect_chain_store["old_script"]["devices"]
+        assert [d["parameters"] for d in devices] == [
+            [{"name": "Gain", "value": 0}], [], [{"name": "Gain", "value": 2}],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_save_replaces_store_instead_of_mutating(self, patch_ableton):
+        """Lock-free readers holding the old dict must never see it change."""
+        patch_ableton.send_command.return_value = {"devices": []}
+        before = state.effect_chain_store
+        snapshot = dict(before)
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            mcp = _register_workflow_tools()
+            await _get_tool(mcp, "save_effect_chain").fn(
+                MagicMock(), track_index=0, template_name="cow")
+        assert state.effect_chain_store is not before
+        assert before == snapshot
+        assert "cow" in state.effect_chain_store
+
     @pytest.mark.asyncio
     async def test_load_nonexistent_template(self, patch_ableton):
         """Loading a template that does not exist should return Invalid input."""
@@ -514,6 +655,23 @@ class TestGetFullSessionState:
             assert len(data["tracks"]["tracks"]) == 1
             assert len(data["scenes"]["scenes"]) == 1
             assert call_count[0] == 4
+            patch_ableton.send_commands_pipelined.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_read_is_reported(self, patch_ableton):
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            mcp = _register_workflow_tools()
+            tool_fn = _get_tool(mcp, "get_full_session_state")
+
+            def cmd_handler(cmd, params=None):
+                if cmd == "get_scenes":
+                    raise Exception("scene query failed")
+                return {}
+            patch_ableton.send_command.side_effect = cmd_handler
+
+            data = json.loads(await tool_fn.fn(MagicMock()))
+            assert data["status"] == "error"
+            assert "scene query failed" in data["message"]
 
 
 # ---------------------------------------------------------------------------
@@ -606,6 +764,23 @@ class TestCreateDrumTrack:
             assert "load_instrument_or_effect" in cmd_names
             assert "create_clip" in cmd_names
             assert "add_notes_to_clip" in cmd_names
+            patch_ableton.send_commands_pipelined.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_clip_is_reported_but_failed_name_is_not(self, patch_ableton):
+        def cmd_handler(cmd, params=None):
+            if cmd in ("set_track_name", "create_clip"):
+                raise Exception(f"{cmd} rejected")
+            return {"index": 2}
+        patch_ableton.send_command.side_effect = cmd_handler
+
+        with patch(_PATCH_GAC, return_value=patch_ableton), \
+                patch(_PATCH_URI, return_value="query:Instruments#Drum Rack"):
+            mcp = _register_workflow_tools()
+            result = json.loads(await _get_tool(mcp, "create_drum_track").fn(MagicMock()))
+
+        assert result["status"] == "error"
+        assert "create_clip rejected" in result["message"]
 
     @pytest.mark.asyncio
     async def test_invalid_pattern_style_rejected(self, patch_ableton):
@@ -617,3 +792,60 @@ class TestCreateDrumTrack:
             ctx = MagicMock()
             result = await tool_fn.fn(ctx, pattern_style="breakcore")
             assert "Invalid input" in result
+
+
+# ---------------------------------------------------------------------------
+# batch_execute
+# ---------------------------------------------------------------------------
+
+class TestBatchExecute:
+
+    @pytest.mark.asyncio
+    async def test_runs_calls_in_order(self, patch_ableton):
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            mcp = _register_workflow_tools()
+            patch_ableton.send_command.return_value = {"status": "success"}
+            result = await _get_tool(mcp, "batch_execute").fn(MagicMock(), calls=[
+                {"tool": "batch_set_mixer", "args": {"settings": [{"track_index": 0, "volume": 0.5}]}},
+                {"tool": "list_effect_chain_templates"},
+            ])
+
+        data = json.loads(result)
+        assert [r["tool"] for r in data["results"]] == ["batch_set_mixer", "list_effect_chain_templates"]
+        assert all(r["status"] == "ok" for r in data["results"])
+        assert data["errors"] == []
+
+    @pytest.mark.asyncio
+    async def test_stop_on_error_skips_remaining(self, patch_ableton):
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            mcp = _register_workflow_tools()
+            result = await _get_tool(mcp, "batch_execute").fn(MagicMock(), calls=[
+                {"tool": "no_such_tool"},
+                {"tool": "list_effect_chain_templates"},
+            ], stop_on_error=True)
+
+        data = json.loads(result)
+        assert data["results"][0]["status"] == "error"
+        assert data["results"][1]["status"] == "skipped"
+        assert len(data["errors"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_tool_error_envelope_counts_as_error(self, patch_ableton):
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            mcp = _register_workflow_tools()
+            result = await _get_tool(mcp, "batch_execute").fn(MagicMock(), calls=[
+                {"tool": "apply_effect_chain", "args": {"track_index": 0, "effects": []}},
+            ])
+
+        data = json.loads(result)
+        assert data["errors"][0]["result"]["status"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_nested_batch_rejected(self):
+        mcp = _register_workflow_tools()
+        result = await _get_tool(mcp, "batch_execute").fn(MagicMock(), calls=[
+            {"tool": "batch_execute", "args": {"calls": []}},
+        ])
+        data = json.loads(result)
+        assert data["status"] == "error"
+        assert "nested" in data["message"]